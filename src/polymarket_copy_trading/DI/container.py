@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 from dependency_injector import containers, providers
 
 from polymarket_copy_trading.clients.clob_client import AsyncClobClient
@@ -27,6 +29,7 @@ from polymarket_copy_trading.persistence.repositories.in_memory import (
     InMemorySeenTradeRepository,
     InMemoryTrackingRepository,
     InMemoryTrackingSessionRepository,
+    StateFile,
 )
 from polymarket_copy_trading.queue import InMemoryQueue, QueueMessage
 from polymarket_copy_trading.services.account_value import AccountValueService
@@ -54,6 +57,38 @@ from polymarket_copy_trading.services.trade_processing import (
 )
 
 
+def _state_file(settings: Settings, name: str) -> StateFile | None:
+    """Return the state file for a repository when PERSISTENCE__STATE_DIR is set."""
+    state_dir = settings.persistence.state_dir
+    if not state_dir:
+        return None
+    return StateFile(Path(state_dir) / name, flush_every=settings.persistence.flush_every)
+
+
+def _build_tracking_repository(settings: Settings) -> InMemoryTrackingRepository:
+    """Build the tracking ledger repository, mirrored to disk if configured."""
+    return InMemoryTrackingRepository(_state_file(settings, "tracking_ledgers.pickle"))
+
+
+def _build_tracking_session_repository(settings: Settings) -> InMemoryTrackingSessionRepository:
+    """Build the tracking session repository, mirrored to disk if configured."""
+    return InMemoryTrackingSessionRepository(_state_file(settings, "tracking_sessions.pickle"))
+
+
+def _build_account_value_service(
+    settings: Settings,
+    *,
+    rpc_client: RpcClient,
+    data_api: DataApiClient,
+) -> AccountValueService:
+    """Build AccountValueService with the result cache TTL from settings."""
+    return AccountValueService(
+        rpc_client,
+        data_api,
+        cache_ttl_seconds=settings.api.account_value_cache_seconds,
+    )
+
+
 def _build_trade_queue(
     settings: Settings,
 ) -> InMemoryQueue[QueueMessage[DataApiTradeDTO]]:
@@ -123,13 +158,13 @@ class Container(containers.DeclarativeContainer):
 
     trade_queue = providers.Singleton(_build_trade_queue, config)
 
-    tracking_repository = providers.Singleton(InMemoryTrackingRepository)
+    tracking_repository = providers.Singleton(_build_tracking_repository, config)
 
     bot_position_repository = providers.Singleton(InMemoryBotPositionRepository)
 
     seen_trade_repository = providers.Singleton(InMemorySeenTradeRepository)
 
-    tracking_session_repository = providers.Singleton(InMemoryTrackingSessionRepository)
+    tracking_session_repository = providers.Singleton(_build_tracking_session_repository, config)
 
     snapshot_builder_service = providers.Singleton(
         SnapshotBuilderService,
@@ -139,7 +174,8 @@ class Container(containers.DeclarativeContainer):
     )
 
     account_value_service = providers.Singleton(
-        AccountValueService,
+        _build_account_value_service,
+        config,
         rpc_client=rpc_client,
         data_api=data_api_client,
     )
@@ -1,16 +1,52 @@
-"""Polymarket copy trading: async clients and tracking services."""
-
-from polymarket_copy_trading.clients import (
-    AsyncHttpClient,
-    DataApiClient,
-    GammaApiClient,
-    GammaCache,
-)
-from polymarket_copy_trading.config import get_settings
-from polymarket_copy_trading.DI import Container
-from polymarket_copy_trading.services import TradeTracker
+"""Polymarket copy trading: async clients and tracking services.
+
+Exports are loaded lazily (PEP 562), so importing a submodule does not first pull
+in the DI container, every client and every service.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from polymarket_copy_trading.clients import (
+        AsyncHttpClient,
+        DataApiClient,
+        GammaApiClient,
+        GammaCache,
+    )
+    from polymarket_copy_trading.config import get_settings
+    from polymarket_copy_trading.DI import Container
+    from polymarket_copy_trading.services import TradeTracker
 
 __version__ = "0.0.1"
+
+_EXPORTS: dict[str, str] = {
+    "AsyncHttpClient": ".clients",
+    "DataApiClient": ".clients",
+    "GammaApiClient": ".clients",
+    "GammaCache": ".clients",
+    "Container": ".DI",
+    "TradeTracker": ".services",
+    "get_settings": ".config",
+}
+"""Exported name -> subpackage (relative to this package) that defines it."""
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
+
+
 __all__ = [
     "AsyncHttpClient",
     "DataApiClient",
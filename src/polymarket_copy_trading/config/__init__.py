@@ -7,6 +7,7 @@ from polymarket_copy_trading.config.config import (
     LoggingSettings,
     OrderAnalysisSettings,
     OrderExecutionSettings,
+    PersistenceSettings,
     PolymarketClobSettings,
     Settings,
     StrategySettings,
@@ -21,6 +22,7 @@ __all__ = [
     "LoggingSettings",
     "OrderAnalysisSettings",
     "OrderExecutionSettings",
+    "PersistenceSettings",
     "PolymarketClobSettings",
     "Settings",
     "StrategySettings",
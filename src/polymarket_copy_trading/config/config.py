@@ -101,6 +101,12 @@ class ApiSettings(BaseSettings):
         le=20,
         description="Maximum number of retries for failed requests.",
     )
+    account_value_cache_seconds: float = Field(
+        default=5.0,
+        ge=0.0,
+        le=300.0,
+        description="Reuse a wallet's computed account value for this many seconds (0 disables). Env: API__ACCOUNT_VALUE_CACHE_SECONDS.",
+    )
     polygon_rpc_url: str = Field(
         default="https://polygon-rpc.com",
         description="Polygon RPC endpoint for JSON-RPC (eth_call, etc.). Env: API__POLYGON_RPC_URL.",
@@ -276,6 +282,23 @@ class TrackingSettings(BaseSettings):
     )
 
 
+class PersistenceSettings(BaseSettings):
+    """Configuration for the on-disk mirror of the in-memory repositories."""
+
+    model_config = SettingsConfigDict(extra="ignore")
+
+    state_dir: str | None = Field(
+        default=None,
+        description="Directory for tracking ledger/session state files; unset keeps state in memory only. Env: PERSISTENCE__STATE_DIR.",
+    )
+    flush_every: int = Field(
+        default=50,
+        ge=1,
+        le=10000,
+        description="Write state back to disk every N repository saves (and on shutdown). Env: PERSISTENCE__FLUSH_EVERY.",
+    )
+
+
 class Settings(BaseSettings):
     """Root application configuration.
 
@@ -332,6 +355,10 @@ class Settings(BaseSettings):
         default_factory=StrategySettings,
         description="Copy-trading strategy: sizing, open/close thresholds (STRATEGY__*).",
     )
+    persistence: PersistenceSettings = Field(
+        default_factory=PersistenceSettings,
+        description="On-disk mirror of tracking state across restarts (PERSISTENCE__*).",
+    )
 
     @classmethod
     def from_env(cls, **overrides: Any) -> Settings:
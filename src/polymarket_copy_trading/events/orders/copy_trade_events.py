@@ -2,11 +2,26 @@
 
 from __future__ import annotations
 
+import sys
 from datetime import datetime
-from typing import Literal
+from typing import Final, Literal
 from uuid import UUID
 
 from bubus import BaseEvent  # type: ignore[import-untyped]
+from pydantic import field_validator
+
+REASONS: Final = frozenset(
+    {
+        "order_placement_failed",
+        "trade_not_found",
+        "position_not_found",
+        "position_update_failed",
+        "queue_full",
+        "parse_trade_error",
+        "get_trades_error",
+    }
+)
+"""Known CopyTradeFailedEvent.reason values."""
 
 
 class CopyTradeFailedEvent(BaseEvent[None]):
@@ -16,7 +31,7 @@ class CopyTradeFailedEvent(BaseEvent[None]):
     """
 
     reason: str
-    """One of: order_placement_failed, trade_not_found, position_not_found,
+    """One of REASONS: order_placement_failed, trade_not_found, position_not_found,
     position_update_failed, queue_full, parse_trade_error, get_trades_error."""
 
     position_id: UUID | None = None
@@ -31,6 +46,12 @@ class CopyTradeFailedEvent(BaseEvent[None]):
     close_requested_at: datetime | None = None
     close_attempts: int | None = None
 
+    @field_validator("reason", "tracked_wallet", "amount_kind")
+    @classmethod
+    def _intern(cls, v: str | None) -> str | None:
+        """Intern low-cardinality strings so events share storage and compare by identity."""
+        return sys.intern(v) if v is not None else None
+
 
 class CopyTradeOrderPlacedEvent(BaseEvent[None]):
     """Emitted when the copy-trading engine places an order (open or close position).
@@ -1,5 +1,5 @@
 """Logging subpackage."""
 
-from polymarket_copy_trading.logging.config import configure_logging
+from polymarket_copy_trading.logging.config import configure_logging, stop_logging
 
-__all__ = ["configure_logging"]
+__all__ = ["configure_logging", "stop_logging"]
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
-from logging.handlers import TimedRotatingFileHandler
+import queue
+from decimal import Decimal
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import logfire
@@ -13,14 +18,28 @@ from structlog.types import EventDict, Processor
 
 from polymarket_copy_trading.config import get_settings
 
-# Map standard logging levels to Logfire levels
-LOG_LEVEL_TO_LOGFIRE: dict[str, str] = {
-    "DEBUG": "debug",
-    "INFO": "info",
-    "WARNING": "warn",
-    "ERROR": "error",
-    "CRITICAL": "fatal",
-}
+# Map standard logging levels to Logfire levels (read-only)
+LOG_LEVEL_TO_LOGFIRE: MappingProxyType[str, str] = MappingProxyType(
+    {
+        "DEBUG": "debug",
+        "INFO": "info",
+        "WARNING": "warn",
+        "ERROR": "error",
+        "CRITICAL": "fatal",
+    }
+)
+
+
+# Background writer for the file handler (file I/O and rollover off the event loop thread)
+_file_listener: QueueListener | None = None
+_atexit_registered = False
+"""stop_logging is registered with atexit once, however often configure_logging runs."""
+
+
+@lru_cache(maxsize=8)
+def _resolve_logfire_level(name: str) -> str:
+    """Return the Logfire level for a standard level name (case-insensitive). Defaults to info."""
+    return LOG_LEVEL_TO_LOGFIRE.get(name.upper(), "info")
 
 
 def _add_service_context(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
@@ -37,8 +56,33 @@ def _add_service_context(logger: Any, method_name: str, event_dict: EventDict) -
     return event_dict
 
 
+def _decimals_to_float(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
+    """Render Decimal values as floats.
+
+    Callers log Decimals as-is; this runs after filter_by_level, so the conversion
+    only happens for records that are actually emitted.
+    """
+    for key, value in event_dict.items():
+        if isinstance(value, Decimal):
+            event_dict[key] = float(value)
+    return event_dict
+
+
+def stop_logging() -> None:
+    """Flush and stop the background file writer, if running. Safe to call more than once."""
+    global _file_listener
+    if _file_listener is not None:
+        _file_listener.stop()
+        _file_listener = None
+
+
 def configure_logging() -> None:
-    """Configure structlog + Logfire using settings."""
+    """Configure structlog + Logfire using settings.
+
+    File output goes through a QueueHandler drained by a QueueListener thread, so
+    callers (including the asyncio loop) never block on disk writes or rollover.
+    """
+    global _file_listener, _atexit_registered
     app_settings = get_settings().app
     logging_settings = get_settings().logging
 
@@ -67,7 +111,14 @@ def configure_logging() -> None:
         )
         file_handler.setLevel(file_level)
         file_handler.setFormatter(logging.Formatter("%(message)s"))
-        handlers.append(file_handler)
+        stop_logging()
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        _file_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _file_listener.start()
+        if not _atexit_registered:
+            atexit.register(stop_logging)
+            _atexit_registered = True
+        handlers.append(QueueHandler(log_queue))
         enabled_levels.append(file_level)
 
     if handlers:
@@ -75,7 +126,7 @@ def configure_logging() -> None:
 
     # Configure Logfire only if enabled
     if logging_settings.logfire_enabled:
-        logfire_min_level = LOG_LEVEL_TO_LOGFIRE.get(logging_settings.logfire_level, "info")
+        logfire_min_level = _resolve_logfire_level(logging_settings.logfire_level)
 
         logfire.configure(
             token=logging_settings.logfire_token,
@@ -95,6 +146,7 @@ def configure_logging() -> None:
         structlog.dev.set_exc_info,
         structlog.processors.TimeStamper(fmt="iso", utc=True),
         _add_service_context,  # Add service context to all logs
+        _decimals_to_float,
     ]
 
     # Add Logfire processor only if enabled
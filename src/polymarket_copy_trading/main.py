@@ -23,18 +23,17 @@ import structlog
 from polymarket_copy_trading.config import get_settings
 from polymarket_copy_trading.DI import Container
 from polymarket_copy_trading.exceptions import MissingRequiredConfigError
-from polymarket_copy_trading.logging.config import configure_logging
+from polymarket_copy_trading.logging.config import configure_logging, stop_logging
+from polymarket_copy_trading.models._normalize import sanitize_wallet
 from polymarket_copy_trading.notifications.types import NotificationMessage
 from polymarket_copy_trading.utils import mask_address
 
 
-def _setup_sigint(shutdown_event: asyncio.Event) -> None:
+def _setup_sigint(task: asyncio.Task[Any]) -> None:
+    """Cancel task on SIGINT; its CancelledError is the shutdown signal."""
     try:
         loop = asyncio.get_running_loop()
-        loop.add_signal_handler(
-            signal.SIGINT,
-            lambda: shutdown_event.set(),
-        )
+        loop.add_signal_handler(signal.SIGINT, task.cancel)
     except NotImplementedError:
         pass  # Windows has no add_signal_handler
 
@@ -48,7 +47,7 @@ async def run() -> None:
     configure_logging()
     logger = structlog.get_logger("main")
     settings = get_settings()
-    target_wallet = settings.tracking.target_wallet.strip()
+    target_wallet = sanitize_wallet(settings.tracking.target_wallet)
     if not target_wallet:
         logger.error(
             "main_missing_target_wallet",
@@ -58,6 +57,7 @@ async def run() -> None:
 
     container = Container()
     snapshot_builder = container.snapshot_builder_service()
+    tracking_repo = container.tracking_repository()
     tracking_session_repo = container.tracking_session_repository()
     tracker = container.trade_tracker()
     consumer = container.trade_consumer()
@@ -68,8 +68,6 @@ async def run() -> None:
     await notification_service.initialize()
     trade_failed_notifier.start()
     await order_analysis_worker.start()
-    shutdown_event = asyncio.Event()
-    _setup_sigint(shutdown_event)
 
     tr = settings.tracking
     result = await snapshot_builder.build_snapshot_t0(target_wallet)
@@ -101,16 +99,19 @@ async def run() -> None:
             limit=tr.trades_limit,
         )
     )
+    _setup_sigint(track_task)
 
     await consumer.start()
     try:
         try:
-            await shutdown_event.wait()
+            await track_task
         except asyncio.CancelledError:
             await _do_shutdown(logger)
-            raise
-
-        await _do_shutdown(logger)
+            current = asyncio.current_task()
+            if current is not None and current.cancelling():
+                raise  # run() itself was cancelled (e.g. notebook interrupt)
+        else:
+            await _do_shutdown(logger)
     finally:
         active = await tracking_session_repo.get_active_for_wallet(target_wallet)
         if active is not None:
@@ -125,6 +126,8 @@ async def run() -> None:
         trade_queue.shutdown()
         await trade_queue.join()
         await consumer.stop()
+        tracking_repo.flush()
+        tracking_session_repo.flush()
 
         notification_service.notify(
             NotificationMessage(
@@ -133,7 +136,10 @@ async def run() -> None:
                 payload={},
             )
         )
-        await notification_service.shutdown()
+        try:
+            await notification_service.close()
+        finally:
+            stop_logging()  # last: shutdown records above still reach the log file
 
 
 def main() -> None:
@@ -0,0 +1,19 @@
+"""Canonical form for identity strings (wallet, asset) at the ingest boundary.
+
+Sanitize once where raw API/config data enters the app; model create() factories
+then store the value as-is.
+"""
+
+from __future__ import annotations
+
+import sys
+
+
+def sanitize_asset(asset: str) -> str:
+    """Return the stripped, interned token_id (positionId)."""
+    return sys.intern(asset.strip())
+
+
+def sanitize_wallet(wallet: str) -> str:
+    """Return the stripped, interned wallet address."""
+    return sys.intern(wallet.strip())
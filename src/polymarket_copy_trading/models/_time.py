@@ -0,0 +1,28 @@
+"""Integer-nanosecond timestamps for models (UTC epoch), with exact datetime conversion.
+
+Conversions go through whole microseconds (datetime resolution), so a datetime
+round-trips unchanged and no float precision is lost.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import UTC, datetime, timedelta
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def datetime_to_ns(value: datetime) -> int:
+    """Convert an aware datetime to nanoseconds since the Unix epoch."""
+    return (value - _EPOCH) // _ONE_MICROSECOND * 1_000
+
+
+def ns_to_datetime(value: int) -> datetime:
+    """Convert nanoseconds since the Unix epoch to an aware UTC datetime (microsecond floor)."""
+    return _EPOCH + timedelta(microseconds=value // 1_000)
+
+
+def ns_or_now(value: datetime | None) -> int:
+    """Return value as epoch nanoseconds, or the current time (time.time_ns) if None."""
+    return time.time_ns() if value is None else datetime_to_ns(value)
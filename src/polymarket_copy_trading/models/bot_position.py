@@ -3,6 +3,8 @@
 Used to track positions for closing in FIFO order (oldest opened_at first).
 Linked to TrackingLedger for the same (wallet, asset).
 Fields for entry_cost_usdc, close_proceeds_usdc and fees support PnL and net PnL later.
+USDC amounts are stored as integer micro-USDC (6 decimals, like on-chain USDC) and
+exposed as Decimal properties; conversion happens once at the boundary.
 """
 
 from __future__ import annotations
@@ -11,17 +13,52 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from decimal import Decimal
 from enum import Enum
+from typing import Any
 from uuid import UUID, uuid4
 
+from polymarket_copy_trading.models._time import ns_or_now, ns_to_datetime
+
+_MICRO = Decimal(1_000_000)
+
+
+def to_micro_usdc(value: Decimal) -> int:
+    """Convert a USDC Decimal to integer micro-USDC (rounded half-even to 6 decimals)."""
+    return int((value * _MICRO).to_integral_value())
+
+
+def from_micro_usdc(value: int) -> Decimal:
+    """Convert integer micro-USDC to a USDC Decimal."""
+    return Decimal(value) / _MICRO
+
 
 class PositionStatus(str, Enum):
-    """Position lifecycle state."""
+    """Position lifecycle state (stored on BotPosition as a 2-bit code in flags)."""
 
     OPEN = "OPEN"
     CLOSING_PENDING = "CLOSING_PENDING"
     CLOSED = "CLOSED"
 
 
+# BotPosition.flags layout: bits 0-1 status code, bits 2+ close_attempts
+_STATUS_MASK = 0b11
+_ATTEMPTS_SHIFT = 2
+STATUS_CODES: dict[PositionStatus, int] = {
+    PositionStatus.OPEN: 0,
+    PositionStatus.CLOSING_PENDING: 1,
+    PositionStatus.CLOSED: 2,
+}
+"""Status code stored in the low bits of BotPosition.flags for each PositionStatus."""
+_STATUS_BY_CODE = (PositionStatus.OPEN, PositionStatus.CLOSING_PENDING, PositionStatus.CLOSED)
+_OPEN = STATUS_CODES[PositionStatus.OPEN]
+_CLOSING_PENDING = STATUS_CODES[PositionStatus.CLOSING_PENDING]
+_CLOSED = STATUS_CODES[PositionStatus.CLOSED]
+
+
+def pack_flags(status: PositionStatus, close_attempts: int = 0) -> int:
+    """Pack status and close_attempts into a BotPosition.flags value."""
+    return STATUS_CODES[status] | (close_attempts << _ATTEMPTS_SHIFT)
+
+
 @dataclass(frozen=True, slots=True)
 class BotPosition:
     """One position opened by the bot: fixed size and status.
@@ -42,27 +79,27 @@ class BotPosition:
 
     shares_held: Decimal
     entry_price: Decimal | None
-    status: PositionStatus
-
-    opened_at: datetime
-    closed_at: datetime | None
-    """None while OPEN; set when status is CLOSED."""
-
-    # PnL / cost basis (for realized and net PnL later)
-    entry_cost_usdc: Decimal | None = None
-    """Total USDC cost to open (shares cost + open fees). Cost basis."""
-    close_proceeds_usdc: Decimal | None = None
-    """USDC received when closed (after fees). Set when status is CLOSED."""
-    fees: Decimal = Decimal("0")
-    """Total fees in USDC (open + close). For reporting and net PnL."""
+    flags: int
+    """Packed status code (bits 0-1) and close_attempts (bits 2+); see status, close_attempts."""
+
+    opened_at_ns: int
+    """Open time as nanoseconds since the Unix epoch (see opened_at)."""
+    closed_at_ns: int | None
+    """None while OPEN; set when status is CLOSED (see closed_at)."""
+
+    # PnL / cost basis in micro-USDC (see entry_cost_usdc, close_proceeds_usdc, fees)
+    entry_cost_micro_usdc: int | None = None
+    """Total cost to open (shares cost + open fees). Cost basis."""
+    close_proceeds_micro_usdc: int | None = None
+    """Amount received when closed (after fees). Set when status is CLOSED."""
+    fees_micro_usdc: int = 0
+    """Total fees (open + close). For reporting and net PnL."""
     close_order_id: str | None = None
     """Last close order id sent to CLOB (if any)."""
     close_transaction_hash: str | None = None
     """Last close transaction hash observed/sent (if any)."""
     close_requested_at: datetime | None = None
     """Timestamp when close request was last sent."""
-    close_attempts: int = 0
-    """Number of close requests sent for this position."""
 
     def with_close_proceeds_updated(
         self,
@@ -74,24 +111,10 @@ class BotPosition:
         Use when a position was already closed (status CLOSED) but we now have
         the real close amounts from the CLOB trade. Only valid for CLOSED positions.
         """
-        new_fees = self.fees + close_fees
-        return BotPosition(
-            id=self.id,
-            ledger_id=self.ledger_id,
-            tracked_wallet=self.tracked_wallet,
-            asset=self.asset,
-            shares_held=self.shares_held,
-            entry_price=self.entry_price,
-            status=self.status,
-            opened_at=self.opened_at,
-            closed_at=self.closed_at,
-            entry_cost_usdc=self.entry_cost_usdc,
-            close_proceeds_usdc=close_proceeds_usdc,
-            fees=new_fees,
-            close_order_id=self.close_order_id,
-            close_transaction_hash=self.close_transaction_hash,
-            close_requested_at=self.close_requested_at,
-            close_attempts=self.close_attempts,
+        new_fees = self.fees_micro_usdc + to_micro_usdc(close_fees)
+        return self._clone(
+            close_proceeds_micro_usdc=to_micro_usdc(close_proceeds_usdc),
+            fees_micro_usdc=new_fees,
         )
 
     def with_closing_pending(
@@ -102,23 +125,12 @@ class BotPosition:
         close_requested_at: datetime | None = None,
     ) -> BotPosition:
         """Return a copy with status CLOSING_PENDING and close tracking metadata."""
-        return BotPosition(
-            id=self.id,
-            ledger_id=self.ledger_id,
-            tracked_wallet=self.tracked_wallet,
-            asset=self.asset,
-            shares_held=self.shares_held,
-            entry_price=self.entry_price,
-            status=PositionStatus.CLOSING_PENDING,
-            opened_at=self.opened_at,
-            closed_at=None,
-            entry_cost_usdc=self.entry_cost_usdc,
-            close_proceeds_usdc=self.close_proceeds_usdc,
-            fees=self.fees,
+        return self._clone(
+            flags=_CLOSING_PENDING | ((self.close_attempts + 1) << _ATTEMPTS_SHIFT),
+            closed_at_ns=None,
             close_order_id=close_order_id or self.close_order_id,
             close_transaction_hash=close_transaction_hash or self.close_transaction_hash,
             close_requested_at=close_requested_at or datetime.now(UTC),
-            close_attempts=self.close_attempts + 1,
         )
 
     def with_closed(
@@ -130,51 +142,102 @@ class BotPosition:
         close_transaction_hash: str | None = None,
     ) -> BotPosition:
         """Return a copy with status CLOSED, closed_at set, and optional close amounts."""
-        now = closed_at or datetime.now(UTC)
-        new_fees = self.fees + (close_fees or Decimal("0"))
-        return BotPosition(
-            id=self.id,
-            ledger_id=self.ledger_id,
-            tracked_wallet=self.tracked_wallet,
-            asset=self.asset,
-            shares_held=self.shares_held,
-            entry_price=self.entry_price,
-            status=PositionStatus.CLOSED,
-            opened_at=self.opened_at,
-            closed_at=now,
-            entry_cost_usdc=self.entry_cost_usdc,
-            close_proceeds_usdc=close_proceeds_usdc
+        new_fees = self.fees_micro_usdc
+        if close_fees is not None:
+            new_fees += to_micro_usdc(close_fees)
+        return self._clone(
+            flags=(self.flags & ~_STATUS_MASK) | _CLOSED,
+            closed_at_ns=ns_or_now(closed_at),
+            close_proceeds_micro_usdc=to_micro_usdc(close_proceeds_usdc)
             if close_proceeds_usdc is not None
-            else self.close_proceeds_usdc,
-            fees=new_fees,
+            else self.close_proceeds_micro_usdc,
+            fees_micro_usdc=new_fees,
             close_order_id=close_order_id or self.close_order_id,
             close_transaction_hash=close_transaction_hash or self.close_transaction_hash,
-            close_requested_at=self.close_requested_at,
-            close_attempts=self.close_attempts,
         )
 
+    def with_entry_cost_updated(self, entry_cost_usdc: Decimal, open_fees: Decimal) -> BotPosition:
+        """Return a copy with the real entry cost set and fees increased by open_fees."""
+        return self._clone(
+            entry_cost_micro_usdc=to_micro_usdc(entry_cost_usdc),
+            fees_micro_usdc=self.fees_micro_usdc + to_micro_usdc(open_fees),
+        )
+
+    def _clone(self, **changes: Any) -> BotPosition:
+        """Return a copy with the given fields replaced, skipping __init__ (slot-by-slot copy)."""
+        new = object.__new__(type(self))
+        for name in self.__slots__:
+            object.__setattr__(new, name, changes[name] if name in changes else getattr(self, name))
+        return new
+
+    @property
+    def status(self) -> PositionStatus:
+        """Lifecycle state (decoded from flags)."""
+        return _STATUS_BY_CODE[self.flags & _STATUS_MASK]
+
+    @property
+    def status_code(self) -> int:
+        """Status as its int code (see STATUS_CODES)."""
+        return self.flags & _STATUS_MASK
+
+    @property
+    def close_attempts(self) -> int:
+        """Number of close requests sent for this position (decoded from flags)."""
+        return self.flags >> _ATTEMPTS_SHIFT
+
+    @property
+    def opened_at(self) -> datetime:
+        """When the position was opened (UTC)."""
+        return ns_to_datetime(self.opened_at_ns)
+
+    @property
+    def closed_at(self) -> datetime | None:
+        """When the position was closed (UTC); None while not CLOSED."""
+        v = self.closed_at_ns
+        return None if v is None else ns_to_datetime(v)
+
+    @property
+    def entry_cost_usdc(self) -> Decimal | None:
+        """Total USDC cost to open (shares cost + open fees). Cost basis."""
+        v = self.entry_cost_micro_usdc
+        return None if v is None else from_micro_usdc(v)
+
+    @property
+    def close_proceeds_usdc(self) -> Decimal | None:
+        """USDC received when closed (after fees). Set when status is CLOSED."""
+        v = self.close_proceeds_micro_usdc
+        return None if v is None else from_micro_usdc(v)
+
+    @property
+    def fees(self) -> Decimal:
+        """Total fees in USDC (open + close). For reporting and net PnL."""
+        return from_micro_usdc(self.fees_micro_usdc)
+
     @property
     def is_open(self) -> bool:
-        return self.status == PositionStatus.OPEN
+        return self.flags & _STATUS_MASK == _OPEN
 
     @property
     def is_closing_pending(self) -> bool:
-        return self.status == PositionStatus.CLOSING_PENDING
+        return self.flags & _STATUS_MASK == _CLOSING_PENDING
 
     def realized_pnl_usdc(self) -> Decimal | None:
         """Realized PnL in USDC when closed. None if OPEN or missing cost/proceeds."""
-        if self.status != PositionStatus.CLOSED:
+        if self.flags & _STATUS_MASK != _CLOSED:
             return None
-        if self.entry_cost_usdc is None or self.close_proceeds_usdc is None:
+        entry, proceeds = self.entry_cost_micro_usdc, self.close_proceeds_micro_usdc
+        if entry is None or proceeds is None:
             return None
-        return self.close_proceeds_usdc - self.entry_cost_usdc
+        return from_micro_usdc(proceeds - entry)
 
     def net_pnl_usdc(self) -> Decimal | None:
         """Net PnL in USDC (after fees) when closed. None if OPEN or missing data."""
-        pnl = self.realized_pnl_usdc()
-        if pnl is None:
+        if self.flags & _STATUS_MASK != _CLOSED:
             return None
-        return pnl - self.fees
+        entry, proceeds = self.entry_cost_micro_usdc, self.close_proceeds_micro_usdc
+        if entry is None or proceeds is None:
+            return None
+        return from_micro_usdc(proceeds - entry - self.fees_micro_usdc)
 
     @classmethod
     def create(
@@ -192,27 +255,30 @@ class BotPosition:
     ) -> BotPosition:
         """Create a new OPEN position (e.g. when bot opens at a threshold).
 
+        tracked_wallet and asset are stored as given; sanitize them at ingest
+        (models._normalize).
+
         Raises:
             ValueError: If shares_held <= 0.
         """
         if shares_held <= 0:
             raise ValueError("shares_held must be > 0 when opening a position")
-        now = datetime.now(UTC)
         return cls(
             id=id or uuid4(),
             ledger_id=ledger_id,
             tracked_wallet=tracked_wallet,
-            asset=asset.strip(),
+            asset=asset,
             shares_held=shares_held,
             entry_price=entry_price,
-            status=PositionStatus.OPEN,
-            opened_at=opened_at or now,
-            closed_at=None,
-            entry_cost_usdc=entry_cost_usdc,
-            close_proceeds_usdc=None,
-            fees=fees if fees is not None else Decimal("0"),
+            flags=pack_flags(PositionStatus.OPEN),
+            opened_at_ns=ns_or_now(opened_at),
+            closed_at_ns=None,
+            entry_cost_micro_usdc=to_micro_usdc(entry_cost_usdc)
+            if entry_cost_usdc is not None
+            else None,
+            close_proceeds_micro_usdc=None,
+            fees_micro_usdc=to_micro_usdc(fees) if fees is not None else 0,
             close_order_id=None,
             close_transaction_hash=None,
             close_requested_at=None,
-            close_attempts=0,
         )
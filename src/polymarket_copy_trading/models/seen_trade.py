@@ -32,10 +32,9 @@ class SeenTrade:
         *,
         seen_at: datetime | None = None,
     ) -> SeenTrade:
-        """Create a new SeenTrade record."""
-        wallet = wallet.strip()
+        """Create a new SeenTrade record. wallet is stored as given (sanitized at ingest)."""
         trade_key = trade_key.strip()
-        if not wallet or not trade_key:
+        if not wallet or wallet.isspace() or not trade_key:
             raise ValueError("wallet and trade_key must be non-empty")
         return cls(
             wallet=wallet,
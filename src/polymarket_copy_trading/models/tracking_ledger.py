@@ -8,15 +8,21 @@ and to evaluate open/close thresholds. See docs on Prediction Markets Copy Tradi
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import datetime
 from decimal import Decimal
 from uuid import UUID, uuid4
 
+from polymarket_copy_trading.models._normalize import sanitize_asset, sanitize_wallet
+from polymarket_copy_trading.models._time import ns_or_now, ns_to_datetime
+
 
 @dataclass(frozen=True, slots=True)
 class TrackingLedger:
     """Per (tracked_wallet, asset): snapshot at t0 and post-tracking shares.
 
+    The with_* methods stamp updated_at with now (default: current UTC time); pass one
+    shared now when chaining several updates for the same event.
+
     - asset: positionId / token_id (primary identity with tracked_wallet).
     - snapshot_t0_shares: shares the trader had at follow start (reference only; not copied).
     - post_tracking_shares: shares bought/sold after t0; starts at 0, increases on BUY, decreases on SELL.
@@ -33,13 +39,27 @@ class TrackingLedger:
     post_tracking_shares: Decimal
     """Current post-tracking balance (increases on BUY, decreases on SELL after t0)."""
 
-    created_at: datetime
-    updated_at: datetime
+    created_at_ns: int
+    """Creation time as nanoseconds since the Unix epoch (see created_at)."""
+    updated_at_ns: int
+    """Last update time as nanoseconds since the Unix epoch (see updated_at)."""
 
     close_stage_ref_post_tracking_shares: Decimal | None = None
     """Baseline ref_pt for progressive close: post_tracking_shares at start of current close stage. Updated when bot closes positions."""
 
-    def with_snapshot_t0(self, new_snapshot: Decimal) -> TrackingLedger:
+    @property
+    def created_at(self) -> datetime:
+        """When the ledger was created (UTC)."""
+        return ns_to_datetime(self.created_at_ns)
+
+    @property
+    def updated_at(self) -> datetime:
+        """When the ledger was last updated (UTC)."""
+        return ns_to_datetime(self.updated_at_ns)
+
+    def with_snapshot_t0(
+        self, new_snapshot: Decimal, *, now: datetime | None = None
+    ) -> TrackingLedger:
         """Return a copy with updated snapshot_t0_shares (e.g. when setting t0 or reducing on SELL)."""
         return TrackingLedger(
             id=self.id,
@@ -48,11 +68,13 @@ class TrackingLedger:
             snapshot_t0_shares=new_snapshot,
             post_tracking_shares=self.post_tracking_shares,
             close_stage_ref_post_tracking_shares=self.close_stage_ref_post_tracking_shares,
-            created_at=self.created_at,
-            updated_at=datetime.now(UTC),
+            created_at_ns=self.created_at_ns,
+            updated_at_ns=ns_or_now(now),
         )
 
-    def with_post_tracking(self, new_post_tracking: Decimal) -> TrackingLedger:
+    def with_post_tracking(
+        self, new_post_tracking: Decimal, *, now: datetime | None = None
+    ) -> TrackingLedger:
         """Return a copy with updated post_tracking_shares."""
         return TrackingLedger(
             id=self.id,
@@ -61,11 +83,13 @@ class TrackingLedger:
             snapshot_t0_shares=self.snapshot_t0_shares,
             post_tracking_shares=new_post_tracking,
             close_stage_ref_post_tracking_shares=self.close_stage_ref_post_tracking_shares,
-            created_at=self.created_at,
-            updated_at=datetime.now(UTC),
+            created_at_ns=self.created_at_ns,
+            updated_at_ns=ns_or_now(now),
         )
 
-    def with_close_stage_ref(self, new_ref: Decimal | None) -> TrackingLedger:
+    def with_close_stage_ref(
+        self, new_ref: Decimal | None, *, now: datetime | None = None
+    ) -> TrackingLedger:
         """Return a copy with updated close_stage_ref_post_tracking_shares (ref_pt for progressive close)."""
         return TrackingLedger(
             id=self.id,
@@ -74,13 +98,38 @@ class TrackingLedger:
             snapshot_t0_shares=self.snapshot_t0_shares,
             post_tracking_shares=self.post_tracking_shares,
             close_stage_ref_post_tracking_shares=new_ref,
-            created_at=self.created_at,
-            updated_at=datetime.now(UTC),
+            created_at_ns=self.created_at_ns,
+            updated_at_ns=ns_or_now(now),
+        )
+
+    def with_shares(
+        self,
+        *,
+        snapshot_t0_shares: Decimal | None = None,
+        post_tracking_shares: Decimal | None = None,
+        now: datetime | None = None,
+    ) -> TrackingLedger:
+        """Return a copy with snapshot_t0_shares and/or post_tracking_shares updated in one step."""
+        return TrackingLedger(
+            id=self.id,
+            tracked_wallet=self.tracked_wallet,
+            asset=self.asset,
+            snapshot_t0_shares=self.snapshot_t0_shares
+            if snapshot_t0_shares is None
+            else snapshot_t0_shares,
+            post_tracking_shares=self.post_tracking_shares
+            if post_tracking_shares is None
+            else post_tracking_shares,
+            close_stage_ref_post_tracking_shares=self.close_stage_ref_post_tracking_shares,
+            created_at_ns=self.created_at_ns,
+            updated_at_ns=ns_or_now(now),
         )
 
-    def add_post_tracking_delta(self, delta: Decimal) -> TrackingLedger:
+    def add_post_tracking_delta(
+        self, delta: Decimal, *, now: datetime | None = None
+    ) -> TrackingLedger:
         """Return a copy with post_tracking_shares = current + delta (e.g. +size on BUY, -size on SELL)."""
-        return self.with_post_tracking(self.post_tracking_shares + delta)
+        return self.with_post_tracking(self.post_tracking_shares + delta, now=now)
 
     @classmethod
     def create(
@@ -95,15 +144,19 @@ class TrackingLedger:
         created_at: datetime | None = None,
         updated_at: datetime | None = None,
     ) -> TrackingLedger:
-        """Create a new ledger entry (e.g. for a new position/token or at t0)."""
-        now = datetime.now(UTC)
+        """Create a new ledger entry (e.g. for a new position/token or at t0).
+
+        tracked_wallet and asset are canonicalized here once (models._normalize);
+        with_* copies and repositories then use them as-is.
+        """
+        now_ns = ns_or_now(None)
         return cls(
             id=id or uuid4(),
-            tracked_wallet=tracked_wallet,
-            asset=asset.strip(),
+            tracked_wallet=sanitize_wallet(tracked_wallet),
+            asset=sanitize_asset(asset),
             snapshot_t0_shares=snapshot_t0_shares,
             post_tracking_shares=post_tracking_shares,
             close_stage_ref_post_tracking_shares=close_stage_ref_post_tracking_shares,
-            created_at=created_at or now,
-            updated_at=updated_at or now,
+            created_at_ns=now_ns if created_at is None else ns_or_now(created_at),
+            updated_at_ns=now_ns if updated_at is None else ns_or_now(updated_at),
         )
@@ -11,6 +11,8 @@ from datetime import UTC, datetime
 from enum import Enum
 from uuid import UUID, uuid4
 
+from polymarket_copy_trading.models._normalize import sanitize_wallet
+
 
 class SessionStatus(str, Enum):
     """Session lifecycle state."""
@@ -99,7 +101,7 @@ class TrackingSession:
         id: UUID | None = None,
     ) -> TrackingSession:
         """Create a new tracking session (status RUNNING)."""
-        wallet = wallet.strip()
+        wallet = sanitize_wallet(wallet)
         if not wallet:
             raise ValueError("wallet must be non-empty")
         now = started_at or datetime.now(UTC)
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
-from dataclasses import dataclass, field
+from collections import defaultdict, deque
+from collections.abc import Awaitable, Callable
+from dataclasses import replace
 from typing import Any
 
 import structlog
@@ -12,20 +13,72 @@ import structlog
 from polymarket_copy_trading.notifications.strategies import BaseNotificationStrategy
 from polymarket_copy_trading.notifications.types import NotificationMessage
 
+_STARVATION_RATIO = 0.8
+"""Backlog fill ratio above which the worker switches to newest-first, coalesced draining."""
+
 
-@dataclass
 class NotificationService:
-    """Dispatch notifications to all configured channels."""
+    """Dispatch notifications to all configured channels.
+
+    Messages are buffered in a bounded deque (single producer loop, single worker).
+    When full, a new message replaces the newest pending one of the same event_type,
+    otherwise the oldest pending message is dropped; drops are counted per event_type
+    and logged as a periodic summary. The worker drains the whole buffer per wake-up;
+    if the backlog is above 80% of queue_size it sends newest first (by priority),
+    keeping only the latest message per coalesce_key.
+    """
+
+    __slots__ = (
+        "notifiers",
+        "queue_size",
+        "drop_report_interval_seconds",
+        "get_logger",
+        "_buffer",
+        "_nonempty",
+        "_closing",
+        "_starved",
+        "_worker_task",
+        "_send_batch",
+        "_drop_reporter_task",
+        "_dropped_by_event",
+        "_dropped_total",
+        "_logger",
+    )
 
-    notifiers: list[BaseNotificationStrategy]
-    queue_size: int = 1000
-    get_logger: Callable[[str], Any] = field(default=structlog.get_logger)
-    _queue: asyncio.Queue[NotificationMessage] | None = field(init=False, default=None)
-    _worker_task: asyncio.Task[None] | None = field(init=False, default=None)
-    _logger: Any = field(init=False)
+    def __init__(
+        self,
+        notifiers: list[BaseNotificationStrategy],
+        queue_size: int = 1000,
+        drop_report_interval_seconds: float = 60.0,
+        get_logger: Callable[[str], Any] = structlog.get_logger,
+    ) -> None:
+        """Initialize the service.
 
-    def __post_init__(self) -> None:
-        self._logger = self.get_logger("NotificationService")
+        Args:
+            notifiers: Channels to deliver to (injected).
+            queue_size: Max pending messages; 0 or less means unbounded.
+            drop_report_interval_seconds: How often dropped-message counts are logged (> 0).
+            get_logger: Logger factory (injected).
+
+        Raises:
+            ValueError: If drop_report_interval_seconds <= 0.
+        """
+        if drop_report_interval_seconds <= 0:
+            raise ValueError("drop_report_interval_seconds must be > 0")
+        self.notifiers = notifiers
+        self.queue_size = queue_size
+        self.drop_report_interval_seconds = drop_report_interval_seconds
+        self.get_logger = get_logger
+        self._buffer: deque[NotificationMessage] | None = None
+        self._nonempty: asyncio.Event | None = None
+        self._closing = False
+        self._starved = False
+        self._worker_task: asyncio.Task[None] | None = None
+        self._send_batch: Callable[[list[NotificationMessage]], Awaitable[None]] = self._dispatch
+        self._drop_reporter_task: asyncio.Task[None] | None = None
+        self._dropped_by_event: defaultdict[str, int] = defaultdict(int)
+        self._dropped_total = 0
+        self._logger: Any = get_logger("NotificationService")
 
     async def initialize(self) -> None:
         """Initialize all notifiers."""
@@ -37,12 +90,16 @@ class NotificationService:
         for notifier in self.notifiers:
             await notifier.initialize()
         if not self.notifiers:
-            self._queue = None
+            self._buffer = None
             self._worker_task = None
             self._logger.info("notification_init_no_notifiers")
             return
-        self._queue = asyncio.Queue[NotificationMessage](maxsize=self.queue_size)
+        self._buffer = deque(maxlen=self.queue_size if self.queue_size > 0 else None)
+        self._nonempty = asyncio.Event()
+        self._closing = False
+        self._send_batch = self._build_dispatcher()
         self._worker_task = asyncio.create_task(self._worker_loop())
+        self._drop_reporter_task = asyncio.create_task(self._drop_reporter())
         self._logger.debug(
             "notification_init_complete",
             notification_queue_size=self.queue_size,
@@ -52,54 +109,194 @@ class NotificationService:
     async def shutdown(self) -> None:
         """Shutdown all notifiers."""
         self._logger.debug("notification_shutdown_started")
-        if self._queue is not None:
-            self._queue.shutdown()
-            await self._queue.join()
-            self._logger.debug("notification_shutdown_queue_drained")
+        if self._nonempty is not None:
+            self._closing = True
+            self._nonempty.set()
         if self._worker_task is not None:
             await self._worker_task
             self._worker_task = None
-        self._queue = None
+            self._logger.debug("notification_shutdown_queue_drained")
+        if self._drop_reporter_task is not None:
+            self._drop_reporter_task.cancel()
+            await asyncio.gather(self._drop_reporter_task, return_exceptions=True)
+            self._drop_reporter_task = None
+        self._report_drops()
+        self._buffer = None
+        self._nonempty = None
 
         for notifier in self.notifiers:
             await notifier.shutdown()
         self._logger.debug("notification_shutdown_complete")
 
+    async def close(self) -> None:
+        """Shutdown (draining pending messages) and release every notifier's resources."""
+        await self.shutdown()
+        for notifier in self.notifiers:
+            await notifier.close()
+
+    @property
+    def dropped_count(self) -> int:
+        """Total notifications dropped or superseded because the buffer was full."""
+        return self._dropped_total
+
     def notify(self, message: NotificationMessage) -> None:
         """Enqueue a notification (non-blocking for callers)."""
-        queue = self._queue
-        if queue is None:
+        buffer = self._buffer
+        nonempty = self._nonempty
+        if buffer is None or nonempty is None or self._closing:
             if not self.notifiers:
                 return
             raise RuntimeError("NotificationService not initialized")
+        if len(buffer) == buffer.maxlen:
+            if buffer[-1].event_type == message.event_type:
+                # Coalesce: the newer message of the same type takes the last slot
+                self._count_drop(buffer.pop().event_type)
+            else:
+                self._count_drop(buffer[0].event_type)
+        buffer.append(message)
+        nonempty.set()
+
+    def _count_drop(self, event_type: str) -> None:
+        self._dropped_by_event[event_type] += 1
+        self._dropped_total += 1
+
+    def _report_drops(self) -> None:
+        """Log and reset the per-event_type drop counters (no-op when nothing was dropped)."""
+        if not self._dropped_by_event:
+            return
+        dropped = dict(self._dropped_by_event)
+        self._dropped_by_event.clear()
+        self._logger.warning(
+            "notification_queue_full_dropped",
+            notification_dropped_by_event_type=dropped,
+            notification_dropped_count=sum(dropped.values()),
+            notification_dropped_total=self._dropped_total,
+        )
+
+    async def _drop_reporter(self) -> None:
+        while True:
+            await asyncio.sleep(self.drop_report_interval_seconds)
+            self._report_drops()
+
+    async def _worker_loop(self) -> None:
+        buffer = self._buffer
+        nonempty = self._nonempty
+        send_batch = self._send_batch
+        if buffer is None or nonempty is None:
+            return
+        while True:
+            if not buffer:
+                if self._closing:
+                    self._logger.debug("notification_worker_shutting_down")
+                    break
+                nonempty.clear()
+                await nonempty.wait()
+                continue
+            batch = list(buffer)
+            buffer.clear()
+            starved = buffer.maxlen is not None and len(batch) > buffer.maxlen * _STARVATION_RATIO
+            if starved != self._starved:
+                self._starved = starved
+                if starved:
+                    self._logger.warning(
+                        "notification_queue_starved_lifo",
+                        notification_backlog=len(batch),
+                        notification_queue_size=self.queue_size,
+                    )
+            if starved:
+                batch = _newest_first_coalesced(batch)
+            # Lazy messages are formatted here, after drops/coalescing, off the producer's path
+            batch = [m if m.message_args is None else self._resolve(m) for m in batch]
+            await send_batch(batch)
+
+    def _resolve(self, message: NotificationMessage) -> NotificationMessage:
+        """Format a lazy message; on a bad format/args pair, log and send the raw template."""
         try:
-            queue.put_nowait(message)
-        except asyncio.QueueFull:
+            return message.resolved()
+        except Exception as exc:
             self._logger.warning(
-                "notification_queue_full_dropped",
+                "notification_format_failed",
                 notification_event_type=message.event_type,
+                error_type=type(exc).__name__,
+                error_message=str(exc),
             )
+            return replace(message, message_args=None)
 
-    async def _worker_loop(self) -> None:
-        queue = self._queue
-        if queue is None:
-            return
-        while True:
-            try:
-                msg = await queue.get()
-            except asyncio.QueueShutDown:
-                self._logger.debug("notification_worker_shutting_down")
-                break
+    def _build_dispatcher(self) -> Callable[[list[NotificationMessage]], Awaitable[None]]:
+        """Return the batch sender for the (fixed) notifier list.
+
+        With a single notifier the batch is sent straight to it, skipping gather and
+        the per-result loop; otherwise the generic concurrent fan-out is used.
+        """
+        if len(self.notifiers) != 1:
+            return self._dispatch
+        notifier = self.notifiers[0]
+        send = notifier.send_notifications_batch
+        wants = notifier.wants
+        logger = self._logger
+
+        async def _dispatch_single(messages: list[NotificationMessage]) -> None:
+            logger.debug(
+                "notification_dispatch",
+                notification_batch_size=len(messages),
+                notification_notifiers_count=1,
+            )
+            messages = [m for m in messages if wants(m)]
+            if not messages:
+                return
             try:
-                await self._dispatch(msg)
-            finally:
-                queue.task_done()
+                await send(messages)
+            except Exception as exc:
+                self._log_dispatch_failure(notifier, messages, exc)
 
-    async def _dispatch(self, message: NotificationMessage) -> None:
+        return _dispatch_single
+
+    async def _dispatch(self, messages: list[NotificationMessage]) -> None:
+        """Send a batch to every notifier concurrently; one failing channel does not block the others."""
         self._logger.debug(
             "notification_dispatch",
-            notification_event_type=message.event_type,
+            notification_batch_size=len(messages),
             notification_notifiers_count=len(self.notifiers),
         )
+        # Strategies that would not deliver (disabled, stopped) never get to render
+        targets: list[tuple[BaseNotificationStrategy, list[NotificationMessage]]] = []
         for notifier in self.notifiers:
-            await notifier.send_notification(message)
+            wanted = [m for m in messages if notifier.wants(m)]
+            if wanted:
+                targets.append((notifier, wanted))
+        results = await asyncio.gather(
+            *(notifier.send_notifications_batch(wanted) for notifier, wanted in targets),
+            return_exceptions=True,
+        )
+        for (notifier, wanted), result in zip(targets, results, strict=True):
+            if isinstance(result, BaseException):
+                self._log_dispatch_failure(notifier, wanted, result)
+
+    def _log_dispatch_failure(
+        self,
+        notifier: BaseNotificationStrategy,
+        messages: list[NotificationMessage],
+        exc: BaseException,
+    ) -> None:
+        self._logger.error(
+            "notification_dispatch_failed",
+            notification_notifier=type(notifier).__name__,
+            notification_batch_size=len(messages),
+            error_type=type(exc).__name__,
+            error_message=str(exc),
+        )
+
+
+def _newest_first_coalesced(batch: list[NotificationMessage]) -> list[NotificationMessage]:
+    """Order a backlog newest first (higher priority first) and keep the newest per coalesce_key."""
+    seen: set[str] = set()
+    newest: list[NotificationMessage] = []
+    for message in reversed(batch):
+        key = message.coalesce_key
+        if key is not None:
+            if key in seen:
+                continue
+            seen.add(key)
+        newest.append(message)
+    newest.sort(key=lambda m: -m.priority)
+    return newest
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 from polymarket_copy_trading.notifications.types import NotificationMessage
@@ -39,6 +40,25 @@ class BaseNotificationStrategy(ABC):
         """Shuts down the strategy."""
         pass
 
+    async def close(self) -> None:
+        """
+        Shuts down the strategy and releases its resources (e.g. HTTP connection pools).
+
+        Called once on process teardown; default only shuts down.
+        """
+        await self.shutdown()
+
+    def wants(self, message: NotificationMessage) -> bool:
+        """
+        Cheap precheck: whether send_notification would deliver message.
+
+        Lets the dispatcher skip disabled or stopped strategies before any rendering.
+
+        Args:
+            message: Notification message about to be sent.
+        """
+        return self.is_running
+
     @abstractmethod
     async def send_notification(
         self,
@@ -51,3 +71,18 @@ class BaseNotificationStrategy(ABC):
             message: Notification message to send (NotificationMessage).
         """
         pass
+
+    async def send_notifications_batch(
+        self,
+        messages: Sequence[NotificationMessage],
+    ) -> None:
+        """
+        Sends several pending notifications in order.
+
+        Default sends them one by one; strategies override it to coalesce deliveries.
+
+        Args:
+            messages: Notification messages to send, oldest first.
+        """
+        for message in messages:
+            await self.send_notification(message)
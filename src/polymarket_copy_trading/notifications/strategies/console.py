@@ -1,7 +1,10 @@
-"""Console notifier (print-based)."""
+"""Console notifier (stdout-based)."""
 
 from __future__ import annotations
 
+import asyncio
+import sys
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 from polymarket_copy_trading.config import Settings
@@ -13,14 +16,18 @@ from polymarket_copy_trading.notifications.types import NotificationMessage
 if TYPE_CHECKING:  # pragma: no cover
     from polymarket_copy_trading.notifications.types import NotificationStyler
 
+_FLUSH_DELAY_SECONDS = 0.01
+"""Writes within this window share one stdout flush."""
+
 
 class ConsoleNotifier(BaseNotificationStrategy):
-    """Print notifications to stdout."""
+    """Write notifications to stdout (one write per message or batch, flushes coalesced)."""
 
     def __init__(self, settings: Settings, styler: NotificationStyler) -> None:
         super().__init__(settings)
         self._running = False
         self._styler = styler
+        self._flush_handle: asyncio.TimerHandle | None = None
 
     @property
     def is_running(self) -> bool:
@@ -31,10 +38,35 @@ class ConsoleNotifier(BaseNotificationStrategy):
 
     async def shutdown(self) -> None:
         self._running = False
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush()
+
+    def wants(self, message: NotificationMessage) -> bool:
+        return self._running and self.settings.console.enabled
 
     async def send_notification(self, message: NotificationMessage) -> None:
         """Send a notification to the console."""
-        if not self.is_running or not self.settings.console.enabled:
+        if not self.wants(message):
+            return
+        self._write(self._render(message) + "\n")
+
+    async def send_notifications_batch(self, messages: Sequence[NotificationMessage]) -> None:
+        """Write all pending notifications to the console in a single write."""
+        if not self._running or not self.settings.console.enabled:
             return
-        body = self._styler.render(message) if self._styler else message.message
-        print(body)
+        self._write("".join(self._render(message) + "\n" for message in messages))
+
+    def _render(self, message: NotificationMessage) -> str:
+        return self._styler.render(message) if self._styler else message.message
+
+    def _write(self, text: str) -> None:
+        sys.stdout.write(text)
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                _FLUSH_DELAY_SECONDS, self._flush
+            )
+
+    def _flush(self) -> None:
+        self._flush_handle = None
+        sys.stdout.flush()
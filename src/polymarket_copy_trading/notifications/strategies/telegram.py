@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
+import random
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING, Any
 
 import structlog
@@ -29,8 +32,38 @@ if TYPE_CHECKING:
     from polymarket_copy_trading.notifications.types import NotificationStyler
 
 
+_MAX_MESSAGE_LENGTH = 4096
+"""Telegram sendMessage text limit (characters)."""
+_BATCH_SEPARATOR = "\n\n"
+_COALESCE_WINDOW_SECONDS = 0.1
+"""How long the sender waits for more rendered messages before flushing a Telegram message."""
+
+_EVENT_PRIORITIES = {
+    "trade_failed": 3,
+    "system_stopped": 3,
+    "position_closed": 2,
+    "position_opened": 2,
+    "system_started": 1,
+    "trade_new": 1,
+}
+"""Default outbox priority per event_type for messages that leave NotificationMessage.priority at 0.
+
+Same scale as NotificationMessage.priority: higher is sent first; other event types get 0.
+"""
+
+
 class TelegramNotifier(BaseNotificationStrategy):
-    """Send notifications to Telegram using python-telegram-bot."""
+    """Send notifications to Telegram using python-telegram-bot.
+
+    Rendered messages go through an internal bounded priority outbox (queue_size); a
+    sender task joins whatever arrives within a short window into one Telegram message
+    (up to the 4096-character limit), so bursts cost one API call and one rate-limit
+    slot instead of one per notification. Messages with a higher priority
+    (NotificationMessage.priority, defaulting per event type to _EVENT_PRIORITIES) are
+    sent ahead of lower ones while the rate limit holds the sender back; each Telegram
+    message keeps its parts in arrival order. When the outbox is full the least
+    important (newest on ties) pending message is dropped.
+    """
 
     def __init__(
         self,
@@ -63,8 +96,19 @@ class TelegramNotifier(BaseNotificationStrategy):
         self.pool_timeout = cfg.pool_timeout
 
         self._bot: Bot | None = None
+        # Owned by this notifier (one connection pool per event loop); released in close()
+        self._request: HTTPXRequest | None = None
         self._running = False
-        self._message_timestamps: list[float] = []
+        # Token bucket: messages_per_minute burst capacity, refilled continuously
+        self._tokens = float(self.messages_per_minute)
+        self._last_refill = time.monotonic()
+        self._rate_limit_lock = asyncio.Lock()
+        # Heap of (-priority, seq, text): most important first, FIFO within a priority
+        self._outbox: list[tuple[int, int, str]] = []
+        self._outbox_seq = itertools.count()
+        self._outbox_ready: asyncio.Event | None = None
+        self._closing = False
+        self._sender_task: asyncio.Task[None] | None = None
 
     @property
     def is_running(self) -> bool:
@@ -77,30 +121,57 @@ class TelegramNotifier(BaseNotificationStrategy):
             self._logger.warning("telegram_already_running")
             return
 
-        try:
-            request = HTTPXRequest(
-                connect_timeout=self.connect_timeout,
-                read_timeout=self.read_timeout,
-                write_timeout=self.write_timeout,
-                pool_timeout=self.pool_timeout,
-            )
-            self._bot = Bot(token=self.token, request=request)
-        except Exception as exc:  # pragma: no cover - fallback path
-            self._logger.warning(
-                "telegram_http_request_fallback",
-                error_type=type(exc).__name__,
-                error_message=str(exc),
-            )
-            self._bot = Bot(token=self.token)
+        if self._bot is None:
+            try:
+                self._request = HTTPXRequest(
+                    connect_timeout=self.connect_timeout,
+                    read_timeout=self.read_timeout,
+                    write_timeout=self.write_timeout,
+                    pool_timeout=self.pool_timeout,
+                )
+                self._bot = Bot(token=self.token, request=self._request)
+            except Exception as exc:  # pragma: no cover - fallback path
+                self._logger.warning(
+                    "telegram_http_request_fallback",
+                    error_type=type(exc).__name__,
+                    error_message=str(exc),
+                )
+                self._bot = Bot(token=self.token)
 
+        self._outbox = []
+        self._outbox_ready = asyncio.Event()
+        self._closing = False
+        self._sender_task = asyncio.create_task(self._sender_loop())
         self._running = True
 
     async def shutdown(self) -> None:
         if not self._running:
             return
 
-        self._bot = None
         self._running = False
+        if self._outbox_ready is not None:
+            # Pending messages are still flushed; the sender exits once the outbox is empty
+            self._closing = True
+            self._outbox_ready.set()
+        if self._sender_task is not None:
+            await self._sender_task
+            self._sender_task = None
+        self._outbox_ready = None
+        # The Bot (and its HTTPXRequest pool) is kept for a later initialize(); see close()
+
+    async def close(self) -> None:
+        """Shut down, close the HTTP connection pool and drop the Bot.
+
+        The next initialize() builds a new Bot and pool.
+        """
+        await self.shutdown()
+        request, self._request = self._request, None
+        self._bot = None
+        if request is not None:
+            await request.shutdown()
+
+    def wants(self, message: NotificationMessage) -> bool:
+        return self._running and self.settings.telegram.enabled
 
     async def send_notification(self, message: NotificationMessage) -> None:
         if not self.settings.telegram.enabled:
@@ -109,81 +180,165 @@ class TelegramNotifier(BaseNotificationStrategy):
             self._logger.warning("telegram_not_running_cannot_send")
             return
 
-        formatted = self._styler.render(message, parse_html=True)
-        await self._send_message(formatted)
+        self._enqueue(message, self._styler.render(message, parse_html=True))
 
-    async def _send_message(self, message: str) -> None:
-        if self._bot is None:
+    async def send_notifications_batch(self, messages: Sequence[NotificationMessage]) -> None:
+        """Render pending messages into the outbox; the sender coalesces them into few Telegram messages."""
+        if not self.settings.telegram.enabled:
+            return
+        if not self._running:
+            self._logger.warning("telegram_not_running_cannot_send")
+            return
+
+        for message in messages:
+            self._enqueue(message, self._styler.render(message, parse_html=True))
+
+    def _enqueue(self, message: NotificationMessage, formatted: str) -> None:
+        """Push a rendered message; when full, evict a less important one or drop this one."""
+        ready = self._outbox_ready
+        if ready is None:
             self._logger.error("telegram_bot_not_initialized")
             return
+        outbox = self._outbox
+        priority = message.priority or _EVENT_PRIORITIES.get(message.event_type, 0)
+        if len(outbox) >= self.queue_size:
+            # Least important pending entry, newest on ties
+            worst = max(outbox)
+            if -worst[0] >= priority:
+                self._logger.warning(
+                    "telegram_outbox_full_dropped",
+                    event_type=message.event_type,
+                    priority=priority,
+                )
+                return
+            outbox.remove(worst)
+            heapq.heapify(outbox)
+            self._logger.warning("telegram_outbox_full_evicted", priority=-worst[0])
+        heapq.heappush(outbox, (-priority, next(self._outbox_seq), formatted))
+        ready.set()
+
+    async def _sender_loop(self) -> None:
+        """Pop messages (most important first) and send them joined in arrival order, up to the length limit."""
+        outbox = self._outbox
+        ready = self._outbox_ready
+        if ready is None:
+            return
+        while True:
+            if not outbox:
+                if self._closing:
+                    return
+                ready.clear()
+                await ready.wait()
+                if not self._closing:
+                    # Let the rest of a burst arrive so it shares one Telegram message
+                    await asyncio.sleep(_COALESCE_WINDOW_SECONDS)
+                continue
+            chunk = [heapq.heappop(outbox)]
+            chunk_len = len(chunk[0][2])
+            while outbox:
+                added = len(_BATCH_SEPARATOR) + len(outbox[0][2])
+                if chunk_len + added > _MAX_MESSAGE_LENGTH:
+                    break
+                chunk.append(heapq.heappop(outbox))
+                chunk_len += added
+            # Priority picks what goes out now; within one Telegram message keep arrival order
+            chunk.sort(key=lambda entry: entry[1])
+            await self._send_message(_BATCH_SEPARATOR.join(entry[2] for entry in chunk))
+
+    async def _send_message(self, message: str) -> None:
+        bot = self._bot
+        logger = self._logger
+        if bot is None:
+            logger.error("telegram_bot_not_initialized")
+            return
+
+        # Bound once: the retry loop below only touches locals
+        send = bot.send_message
+        warn = logger.warning
+        backoff_seconds = self._backoff_seconds
+        chat_id = self.chat_id
+        max_retries = self.max_retries
 
         await self._apply_rate_limit()
         attempt = 1
-        while attempt <= self.max_retries:
+        while attempt <= max_retries:
             try:
-                await self._bot.send_message(
-                    chat_id=self.chat_id,
+                await send(
+                    chat_id=chat_id,
                     text=message,
                     parse_mode="HTML",
                 )
-                self._message_timestamps.append(time.time())
                 return
             except RetryAfter as exc:
                 retry_seconds = float(getattr(exc, "retry_after", 1.0))
-                self._logger.warning(
+                warn(
                     "telegram_rate_limit_retry_after",
                     retry_seconds=retry_seconds,
                 )
                 await asyncio.sleep(retry_seconds)
             except (NetworkError, TimedOut) as exc:
-                backoff = min(60.0, self.backoff_base_seconds * (2 ** (attempt - 1)))
-                self._logger.warning(
+                backoff = backoff_seconds(attempt)
+                warn(
                     "telegram_network_error_retry",
                     error_type=type(exc).__name__,
                     attempt=attempt,
-                    max_retries=self.max_retries,
+                    max_retries=max_retries,
                     backoff_seconds=backoff,
                 )
                 await asyncio.sleep(backoff)
             except (BadRequest, Forbidden) as exc:
-                self._logger.error(
+                logger.error(
                     "telegram_fatal_error",
                     error_type=type(exc).__name__,
                     error_message=str(exc),
                 )
                 return
             except TelegramError as exc:
-                backoff = min(60.0, self.backoff_base_seconds * (2 ** (attempt - 1)))
-                self._logger.warning(
+                backoff = backoff_seconds(attempt)
+                warn(
                     "telegram_error_retry",
                     error_type=type(exc).__name__,
                     attempt=attempt,
-                    max_retries=self.max_retries,
+                    max_retries=max_retries,
                     backoff_seconds=backoff,
                 )
                 await asyncio.sleep(backoff)
             except Exception as exc:  # pragma: no cover
-                backoff = min(60.0, self.backoff_base_seconds * (2 ** (attempt - 1)))
-                self._logger.warning(
+                backoff = backoff_seconds(attempt)
+                warn(
                     "telegram_unexpected_error_retry",
                     error_type=type(exc).__name__,
                     attempt=attempt,
-                    max_retries=self.max_retries,
+                    max_retries=max_retries,
                     backoff_seconds=backoff,
                 )
                 await asyncio.sleep(backoff)
             attempt += 1
 
-        self._logger.error("telegram_max_retries_exceeded_message_dropped")
+        logger.error("telegram_max_retries_exceeded_message_dropped")
+
+    def _backoff_seconds(self, attempt: int) -> float:
+        """Exponential backoff (capped at 60s) with 0.5x-1.5x jitter so retries do not align."""
+        backoff = min(60.0, self.backoff_base_seconds * (2 ** (attempt - 1)))
+        return backoff * (0.5 + random.random())
 
     async def _apply_rate_limit(self) -> None:
-        if self.messages_per_minute <= 0:
+        """Take one token from the bucket, sleeping until it refills if empty.
+
+        The lock serializes concurrent senders so each waiter gets its own token.
+        """
+        capacity = self.messages_per_minute
+        if capacity <= 0:
             return
 
-        now = time.time()
-        window_start = now - 60
-        self._message_timestamps = [t for t in self._message_timestamps if t >= window_start]
-        if len(self._message_timestamps) >= self.messages_per_minute:
-            sleep_time = 60 - (now - self._message_timestamps[0])
-            if sleep_time > 0:
-                await asyncio.sleep(sleep_time)
+        rate = capacity / 60.0
+        async with self._rate_limit_lock:
+            now = time.monotonic()
+            self._tokens = min(capacity, self._tokens + (now - self._last_refill) * rate)
+            self._last_refill = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / rate)
+            self._tokens = 0.0
+            self._last_refill = time.monotonic()
@@ -7,7 +7,12 @@ Polymarket copy-trading context (USDC, shares, condition_id, etc.).
 from __future__ import annotations
 
 import re
+import time
+from collections.abc import Callable, Mapping
 from datetime import UTC, datetime
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Any, cast
 
 from polymarket_copy_trading.notifications.types import (
@@ -15,10 +20,160 @@ from polymarket_copy_trading.notifications.types import (
     NotificationStyler,
 )
 
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_SEP = "─" * 12
+"""Section divider under each block heading."""
+
+# Static heading blocks of the short system messages, built once
+_HEAD_SYSTEM_STARTED = f"▶️ <b>System Started</b>\n\n🚀 <b>Status</b>\n{_SEP}\n"
+_HEAD_SYSTEM_STOPPED = f"⏹️ <b>System Stopped</b>\n\n🛑 <b>Status</b>\n{_SEP}\n"
+
+# Message skeletons, parsed once; renderers fill them via the bound str.format
+_TPL_POSITION_OPENED = (
+    "🟢 <b>Position Opened</b>\n\n"
+    "📊 <b>Trade Summary</b>\n"
+    f"{_SEP}\n"
+    "🪙  <b>Asset:</b> {asset}\n"
+    "🔗 <b>Condition ID:</b> {condition_id}\n"
+    "📉 <b>Outcome:</b> {outcome}\n\n"
+    "👤 <b>Trader Info</b>\n"
+    f"{_SEP}\n"
+    "🔗 <b>Wallet:</b> {wallet}\n\n"
+    "💰 <b>Trade Details</b>\n"
+    f"{_SEP}\n"
+    "🔑 <b>Position ID:</b> {position_id}\n"
+    "🔗 <b>Transaction Hash:</b> {tx_hash}\n"
+    "📥 <b>Amount:</b> {amount_usdc} USDC\n"
+    "🪙  <b>Shares:</b> {shares}\n"
+    "💵 <b>Price:</b> {price} USDC\n\n"
+    "⏰ <b>Time:</b> {time_str}"
+).format
+_TPL_POSITION_CLOSED = (
+    "🔴 <b>Position Closed</b>\n\n"
+    "📊 <b>Trade Summary</b>\n"
+    f"{_SEP}\n"
+    "🪙 <b>Asset:</b> {asset}\n"
+    "🔗 <b>Condition ID:</b> {condition_id}\n"
+    "📉 <b>Outcome:</b> {outcome}\n\n"
+    "👤 <b>Trader Info</b>\n"
+    f"{_SEP}\n"
+    "🔗 <b>Wallet:</b> {wallet}\n\n"
+    "💰 <b>Trade Details</b>\n"
+    f"{_SEP}\n"
+    "🔑 <b>Position ID:</b> {position_id}\n"
+    "🔗 <b>Transaction Hash:</b> {tx_hash}\n"
+    "📥 <b>Entry:</b> {entry_usdc} USDC\n"
+    "📤 <b>Close Proceeds:</b> {close_usdc} USDC\n"
+    "🪙 <b>Shares:</b> {shares}\n"
+    "🧾 <b>Fees:</b> {fees_usdc} USDC\n\n"
+    "🧭 <b>Close Tracking</b>\n"
+    f"{_SEP}\n"
+    "📋 <b>Close Order ID:</b> {close_order_id}\n"
+    "🔗 <b>Close Transaction Hash:</b> {close_tx_hash}\n"
+    "⏳ <b>Close Requested At:</b> {close_requested_at}\n"
+    "🔁 <b>Close Attempts:</b> {close_attempts}\n\n"
+    "📈 <b>P&L</b>\n"
+    f"{_SEP}\n"
+    "📊 <b>Realized:</b> {realized_str} USDC\n"
+    "{pnl_indicator} <b>Net:</b> {net_str} USDC\n\n"
+    "⏰ <b>Time:</b> {time_str}"
+).format
+_TPL_CLOSE_TRACKING = (
+    "\n🧭 <b>Close Tracking</b>\n"
+    f"{_SEP}\n"
+    "📋 <b>Close Order ID:</b> {close_order_id}\n"
+    "🔗 <b>Close Transaction Hash:</b> {close_tx_hash}\n"
+    "⏳ <b>Close Requested At:</b> {close_requested_at}\n"
+    "🔁 <b>Close Attempts:</b> {close_attempts}\n"
+).format
+_TPL_TRADE_FAILED = (
+    "❌ <b>Trade Failed</b>\n\n"
+    "📊 <b>Trade Summary</b>\n"
+    f"{_SEP}\n"
+    "🪙 <b>Asset:</b> {asset}\n"
+    "📈 <b>Side:</b> {side_str}\n"
+    "📋 <b>Reason:</b> {reason}\n\n"
+    "👤 <b>Trader Info</b>\n"
+    f"{_SEP}\n"
+    "🔗 <b>Wallet:</b> {wallet}\n\n"
+    "💰 <b>Failure Details</b>\n"
+    f"{_SEP}\n"
+    "🔑 <b>Position ID:</b> {position_id}\n"
+    "📋 <b>Order ID:</b> {order_id}\n"
+    "🔗 <b>Transaction Hash:</b> {tx_hash}\n"
+    "{amount_line}"
+    "⚠️ <b>Error:</b> {error_msg}\n\n"
+    "{close_tracking_block}\n"
+    "⏰ <b>Time:</b> {time_str}"
+).format
+
+type _Renderer = Callable[[NotificationMessage, dict[str, Any], dict[str, Any]], str]
+"""Bound renderer: (message, payload, trade) -> text."""
+
+_RENDERER_NAMES: Mapping[str, str] = MappingProxyType(
+    {
+        "position_opened": "_render_position_opened",
+        "position_closed": "_render_position_closed",
+        "trade_failed": "_render_trade_failed",
+        "system_started": "_render_system_started",
+        "system_stopped": "_render_system_stopped",
+        "trade_new": "_render_trade_new",
+    }
+)
+"""event_type -> renderer method; unknown types fall back to _render_generic."""
+
+_NA = "N/A"
+_EMPTY: dict[str, Any] = {}
+"""Shared stand-in for a missing payload/trade; renderers only read from it."""
+
+
+def _or_na(*values: Any) -> Any:
+    """First value that is not None (0, False and "" are kept as real values), else "N/A"."""
+    for value in values:
+        if value is not None:
+            return value
+    return _NA
+
+
+@lru_cache(maxsize=32)
+def _generic_header(event_type: str) -> str:
+    """Heading line for an event type without a dedicated renderer (e.g. "ℹ️ <b>Custom Event</b>")."""
+    return f"ℹ️ <b>{event_type.replace('_', ' ').title()}</b>\n"
+
+
+def _format_amount_uncached(value: Any) -> str:
+    if type(value) is float or type(value) is int:
+        return format(value, ",.4f")
+    try:
+        return format(float(value), ",.4f")
+    except (TypeError, ValueError):
+        return str(value)
+
+
+_format_amount_cached = lru_cache(maxsize=4096)(_format_amount_uncached)
+"""Prices sit on a 0.01 grid and sizes repeat, so formatted amounts are highly reusable."""
+
+
+_now_cache: tuple[int, str] = (0, "")
+"""(epoch second, formatted) of the last rendered "Time:" line, shared within that second."""
+
 
 class EventNotificationStyler(NotificationStyler):
     """Render notifications by event_type. One protected method per type."""
 
+    _STRIP_HTML_SUB = _HTML_TAG_RE.sub
+    _CACHE_SIZE = 64
+
+    def __init__(self) -> None:
+        # (id(message), parse_html) -> (message, text); keeping the message pins its id
+        self._cache: dict[tuple[int, bool], tuple[NotificationMessage, str]] = {}
+        # Bound once, so dispatch is one dict lookup and subclass overrides are honored
+        self._renderers: dict[str, _Renderer] = {
+            event_type: getattr(self, name) for event_type, name in _RENDERER_NAMES.items()
+        }
+        self._render_fallback: _Renderer = self._render_generic
+        self._encoded: dict[str, bytes] = {}
+
     def render(self, message: NotificationMessage, *, parse_html: bool = False) -> str:
         """Dispatch to the appropriate renderer based on event_type.
 
@@ -26,136 +181,143 @@ class EventNotificationStyler(NotificationStyler):
             message: Notification message to render.
             parse_html: If True, output includes HTML tags (e.g. <b>) for rich display.
                 If False (default), output is plain text without HTML.
+
+        The same message rendered again (e.g. by another channel) reuses the cached text.
         """
-        if message.event_type == "position_opened":
-            result = self._render_position_opened(message)
-        elif message.event_type == "position_closed":
-            result = self._render_position_closed(message)
-        elif message.event_type == "trade_failed":
-            result = self._render_trade_failed(message)
-        elif message.event_type == "system_started":
-            result = self._render_system_started(message)
-        elif message.event_type == "system_stopped":
-            result = self._render_system_stopped(message)
-        elif message.event_type == "trade_new":
-            result = self._render_trade_new(message)
-        else:
-            result = self._render_generic(message)
+        key = (id(message), parse_html)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] is message:
+            return cached[1]
+
+        payload = message.payload or _EMPTY
+        trade = self._extract_trade(payload)
+        result = self._renderers.get(message.event_type, self._render_fallback)(
+            message, payload, trade
+        )
 
         if not parse_html:
             result = self._strip_html(result)
+        if len(self._cache) >= self._CACHE_SIZE:
+            self._cache.clear()
+        self._cache[key] = (message, result)
         return result
 
+    def render_bytes(self, message: NotificationMessage, *, parse_html: bool = False) -> bytes:
+        """Like render(), but UTF-8 encoded for writing straight into a request body.
+
+        Identical texts (e.g. repeated system messages) reuse the encoded bytes.
+        """
+        text = self.render(message, parse_html=parse_html)
+        encoded = self._encoded.get(text)
+        if encoded is None:
+            if len(self._encoded) >= 2 * self._CACHE_SIZE:
+                self._encoded.clear()
+            encoded = self._encoded[text] = text.encode("utf-8")
+        return encoded
+
     @staticmethod
     def _strip_html(text: str) -> str:
         """Remove HTML tags from text. Returns plain text."""
-        return re.sub(r"<[^>]+>", "", text)
+        return EventNotificationStyler._STRIP_HTML_SUB("", text)
 
-    def _render_position_opened(self, message: NotificationMessage) -> str:
+    def _render_position_opened(
+        self,
+        message: NotificationMessage,
+        payload: dict[str, Any],
+        trade: dict[str, Any],
+    ) -> str:
         """Render position opened notification."""
-        payload = message.payload or {}
-        trade = self._extract_trade(payload)
-        wallet = trade.get("wallet") or payload.get("wallet") or "N/A"
-        asset = trade.get("asset") or "N/A"
-        position_id = trade.get("position_id") or "N/A"
-        tx_hash = trade.get("transaction_hash") or "N/A"
+        wallet = _or_na(trade.get("wallet"), payload.get("wallet"))
+        asset = _or_na(trade.get("asset"))
+        position_id = _or_na(trade.get("position_id"))
+        tx_hash = _or_na(trade.get("transaction_hash"))
         amount_usdc = self._format_amount(trade.get("entry_cost_usdc"))
         shares = self._format_amount(trade.get("size"))
         price = self._format_amount(trade.get("price"))
-        condition_id = trade.get("condition_id") or "N/A"
-        outcome = trade.get("outcome") or "N/A"
+        condition_id = _or_na(trade.get("condition_id"))
+        outcome = _or_na(trade.get("outcome"))
         time_str = self._format_datetime_now()
 
-        return (
-            f"🟢 <b>Position Opened</b>\n\n"
-            f"📊 <b>Trade Summary</b>\n"
-            f"{'─' * 12}\n"
-            f"🪙  <b>Asset:</b> {asset}\n"
-            f"🔗 <b>Condition ID:</b> {condition_id}\n"
-            f"📉 <b>Outcome:</b> {outcome}\n\n"
-            f"👤 <b>Trader Info</b>\n"
-            f"{'─' * 12}\n"
-            f"🔗 <b>Wallet:</b> {wallet}\n\n"
-            f"💰 <b>Trade Details</b>\n"
-            f"{'─' * 12}\n"
-            f"🔑 <b>Position ID:</b> {position_id}\n"
-            f"🔗 <b>Transaction Hash:</b> {tx_hash}\n"
-            f"📥 <b>Amount:</b> {amount_usdc} USDC\n"
-            f"🪙  <b>Shares:</b> {shares}\n"
-            f"💵 <b>Price:</b> {price} USDC\n\n"
-            f"⏰ <b>Time:</b> {time_str}"
+        return _TPL_POSITION_OPENED(
+            asset=asset,
+            condition_id=condition_id,
+            outcome=outcome,
+            wallet=wallet,
+            position_id=position_id,
+            tx_hash=tx_hash,
+            amount_usdc=amount_usdc,
+            shares=shares,
+            price=price,
+            time_str=time_str,
         )
 
-    def _render_position_closed(self, message: NotificationMessage) -> str:
+    def _render_position_closed(
+        self,
+        message: NotificationMessage,
+        payload: dict[str, Any],
+        trade: dict[str, Any],
+    ) -> str:
         """Render position closed notification with PnL."""
-        payload = message.payload or {}
-        trade = self._extract_trade(payload)
-        wallet = trade.get("wallet") or payload.get("wallet") or "N/A"
-        asset = trade.get("asset") or "N/A"
-        position_id = trade.get("position_id") or "N/A"
-        tx_hash = trade.get("transaction_hash") or "N/A"
+        wallet = _or_na(trade.get("wallet"), payload.get("wallet"))
+        asset = _or_na(trade.get("asset"))
+        position_id = _or_na(trade.get("position_id"))
+        tx_hash = _or_na(trade.get("transaction_hash"))
         entry_usdc = self._format_amount(trade.get("entry_cost_usdc"))
         close_usdc = self._format_amount(trade.get("close_proceeds_usdc"))
         shares = self._format_amount(trade.get("size"))
         fees_usdc = self._format_amount(trade.get("fees_usdc"))
         realized_pnl = trade.get("realized_pnl_usdc")
         net_pnl = trade.get("net_pnl_usdc")
-        close_order_id = trade.get("close_order_id") or "N/A"
-        close_tx_hash = trade.get("close_transaction_hash") or tx_hash
+        close_order_id = _or_na(trade.get("close_order_id"))
+        close_tx_hash = _or_na(trade.get("close_transaction_hash"), tx_hash)
         close_requested_at_raw = trade.get("close_requested_at")
         close_attempts = trade.get("close_attempts")
-        condition_id = trade.get("condition_id") or "N/A"
-        outcome = trade.get("outcome") or "N/A"
+        condition_id = _or_na(trade.get("condition_id"))
+        outcome = _or_na(trade.get("outcome"))
         time_str = self._format_datetime_now()
 
         pnl_indicator = self._pnl_indicator(net_pnl)
         realized_str = self._format_amount(realized_pnl)
         net_str = self._format_amount(net_pnl)
 
-        return (
-            f"🔴 <b>Position Closed</b>\n\n"
-            f"📊 <b>Trade Summary</b>\n"
-            f"{'─' * 12}\n"
-            f"🪙 <b>Asset:</b> {asset}\n"
-            f"🔗 <b>Condition ID:</b> {condition_id}\n"
-            f"📉 <b>Outcome:</b> {outcome}\n\n"
-            f"👤 <b>Trader Info</b>\n"
-            f"{'─' * 12}\n"
-            f"🔗 <b>Wallet:</b> {wallet}\n\n"
-            f"💰 <b>Trade Details</b>\n"
-            f"{'─' * 12}\n"
-            f"🔑 <b>Position ID:</b> {position_id}\n"
-            f"🔗 <b>Transaction Hash:</b> {tx_hash}\n"
-            f"📥 <b>Entry:</b> {entry_usdc} USDC\n"
-            f"📤 <b>Close Proceeds:</b> {close_usdc} USDC\n"
-            f"🪙 <b>Shares:</b> {shares}\n"
-            f"🧾 <b>Fees:</b> {fees_usdc} USDC\n\n"
-            f"🧭 <b>Close Tracking</b>\n"
-            f"{'─' * 12}\n"
-            f"📋 <b>Close Order ID:</b> {close_order_id}\n"
-            f"🔗 <b>Close Transaction Hash:</b> {close_tx_hash}\n"
-            f"⏳ <b>Close Requested At:</b> {self._format_iso_or_value(close_requested_at_raw)}\n"
-            f"🔁 <b>Close Attempts:</b> {close_attempts if close_attempts is not None else 'N/A'}\n\n"
-            f"📈 <b>P&L</b>\n"
-            f"{'─' * 12}\n"
-            f"📊 <b>Realized:</b> {realized_str} USDC\n"
-            f"{pnl_indicator} <b>Net:</b> {net_str} USDC\n\n"
-            f"⏰ <b>Time:</b> {time_str}"
+        return _TPL_POSITION_CLOSED(
+            asset=asset,
+            condition_id=condition_id,
+            outcome=outcome,
+            wallet=wallet,
+            position_id=position_id,
+            tx_hash=tx_hash,
+            entry_usdc=entry_usdc,
+            close_usdc=close_usdc,
+            shares=shares,
+            fees_usdc=fees_usdc,
+            close_order_id=close_order_id,
+            close_tx_hash=close_tx_hash,
+            close_requested_at=self._format_iso_or_value(close_requested_at_raw),
+            close_attempts=_or_na(close_attempts),
+            realized_str=realized_str,
+            pnl_indicator=pnl_indicator,
+            net_str=net_str,
+            time_str=time_str,
         )
 
-    def _render_trade_failed(self, message: NotificationMessage) -> str:
+    def _render_trade_failed(
+        self,
+        message: NotificationMessage,
+        payload: dict[str, Any],
+        trade: dict[str, Any],
+    ) -> str:
         """Render trade failed notification."""
-        payload = message.payload or {}
-        wallet = payload.get("wallet") or "N/A"
-        asset = payload.get("asset") or "N/A"
-        reason = payload.get("reason") or "Unknown"
+        wallet = _or_na(payload.get("wallet"))
+        asset = _or_na(payload.get("asset"))
+        reason = _or_na(payload.get("reason"), "Unknown")
         is_open = payload.get("is_open", True)
-        position_id = payload.get("position_id") or "N/A"
-        order_id = payload.get("order_id") or "N/A"
-        close_order_id = payload.get("close_order_id") or order_id
-        error_msg = payload.get("error_message") or "N/A"
-        tx_hash = payload.get("transaction_hash") or "N/A"
-        close_tx_hash = payload.get("close_transaction_hash") or tx_hash
+        position_id = _or_na(payload.get("position_id"))
+        order_id = _or_na(payload.get("order_id"))
+        close_order_id = _or_na(payload.get("close_order_id"), order_id)
+        error_msg = _or_na(payload.get("error_message"))
+        tx_hash = _or_na(payload.get("transaction_hash"))
+        close_tx_hash = _or_na(payload.get("close_transaction_hash"), tx_hash)
         close_requested_at_raw = payload.get("close_requested_at")
         close_attempts = payload.get("close_attempts")
         amount = payload.get("amount")
@@ -179,39 +341,34 @@ class EventNotificationStyler(NotificationStyler):
         )
         close_tracking_block = ""
         if has_close_tracking:
-            close_tracking_block = (
-                f"\n🧭 <b>Close Tracking</b>\n"
-                f"{'─' * 12}\n"
-                f"📋 <b>Close Order ID:</b> {close_order_id}\n"
-                f"🔗 <b>Close Transaction Hash:</b> {close_tx_hash}\n"
-                f"⏳ <b>Close Requested At:</b> {self._format_iso_or_value(close_requested_at_raw)}\n"
-                f"🔁 <b>Close Attempts:</b> {close_attempts if close_attempts is not None else 'N/A'}\n"
+            close_tracking_block = _TPL_CLOSE_TRACKING(
+                close_order_id=close_order_id,
+                close_tx_hash=close_tx_hash,
+                close_requested_at=self._format_iso_or_value(close_requested_at_raw),
+                close_attempts=_or_na(close_attempts),
             )
 
-        return (
-            f"❌ <b>Trade Failed</b>\n\n"
-            f"📊 <b>Trade Summary</b>\n"
-            f"{'─' * 12}\n"
-            f"🪙 <b>Asset:</b> {asset}\n"
-            f"📈 <b>Side:</b> {side_str}\n"
-            f"📋 <b>Reason:</b> {reason}\n\n"
-            f"👤 <b>Trader Info</b>\n"
-            f"{'─' * 12}\n"
-            f"🔗 <b>Wallet:</b> {wallet}\n\n"
-            f"💰 <b>Failure Details</b>\n"
-            f"{'─' * 12}\n"
-            f"🔑 <b>Position ID:</b> {position_id}\n"
-            f"📋 <b>Order ID:</b> {order_id}\n"
-            f"🔗 <b>Transaction Hash:</b> {tx_hash}\n"
-            f"{amount_line}"
-            f"⚠️ <b>Error:</b> {error_msg}\n\n"
-            f"{close_tracking_block}\n"
-            f"⏰ <b>Time:</b> {time_str}"
+        return _TPL_TRADE_FAILED(
+            asset=asset,
+            side_str=side_str,
+            reason=reason,
+            wallet=wallet,
+            position_id=position_id,
+            order_id=order_id,
+            tx_hash=tx_hash,
+            amount_line=amount_line,
+            error_msg=error_msg,
+            close_tracking_block=close_tracking_block,
+            time_str=time_str,
         )
 
-    def _render_system_started(self, message: NotificationMessage) -> str:
+    def _render_system_started(
+        self,
+        message: NotificationMessage,
+        payload: dict[str, Any],
+        trade: dict[str, Any],
+    ) -> str:
         """Render system started notification."""
-        payload = message.payload or {}
         raw_wallet = payload.get("target_wallet")
         raw_wallets = payload.get("target_wallets")
         wallet_strs: list[str] = []
@@ -219,55 +376,60 @@ class EventNotificationStyler(NotificationStyler):
             wallet_strs = [raw_wallet]
         elif isinstance(raw_wallets, list):
             wallet_strs = [str(w) for w in cast(list[Any], raw_wallets)]
-        wallets_str = ", ".join(wallet_strs) if wallet_strs else "N/A"
+        wallets_str = ", ".join(wallet_strs) if wallet_strs else _NA
         time_str = self._format_datetime_now()
 
         return (
-            f"▶️ <b>System Started</b>\n\n"
-            f"🚀 <b>Status</b>\n"
-            f"{'─' * 12}\n"
+            f"{_HEAD_SYSTEM_STARTED}"
             f"{message.message}\n\n"
             f"👛 <b>Target Wallet:</b> {wallets_str}\n\n"
             f"⏰ <b>Time:</b> {time_str}"
         )
 
-    def _render_system_stopped(self, message: NotificationMessage) -> str:
+    def _render_system_stopped(
+        self,
+        message: NotificationMessage,
+        payload: dict[str, Any],
+        trade: dict[str, Any],
+    ) -> str:
         """Render system stopped notification."""
         time_str = self._format_datetime_now()
-        return (
-            f"⏹️ <b>System Stopped</b>\n\n"
-            f"🛑 <b>Status</b>\n"
-            f"{'─' * 12}\n"
-            f"{message.message}\n\n"
-            f"⏰ <b>Time:</b> {time_str}"
-        )
+        return f"{_HEAD_SYSTEM_STOPPED}{message.message}\n\n⏰ <b>Time:</b> {time_str}"
 
-    def _render_trade_new(self, message: NotificationMessage) -> str:
+    def _render_trade_new(
+        self,
+        message: NotificationMessage,
+        payload: dict[str, Any],
+        trade: dict[str, Any],
+    ) -> str:
         """Render trade_new (generic new trade). Falls back to position_opened style if trade present."""
-        payload = message.payload or {}
-        trade = self._extract_trade(payload)
         if trade and trade.get("position_id"):
-            return self._render_position_opened(message)
-        return self._render_generic(message)
+            return self._render_position_opened(message, payload, trade)
+        return self._render_generic(message, payload, trade)
 
-    def _render_generic(self, message: NotificationMessage) -> str:
+    def _render_generic(
+        self,
+        message: NotificationMessage,
+        payload: dict[str, Any],
+        trade: dict[str, Any],
+    ) -> str:
         """Render unknown event types using message and payload."""
-        event_title = message.event_type.replace("_", " ").title()
-        lines = [f"ℹ️ <b>{event_title}</b>\n", message.message]
-        if message.payload:
-            lines.append("")
-            for key in sorted(message.payload.keys()):
-                value = message.payload.get(key)
-                if value is not None:
-                    lines.append(f"<b>{key}:</b> {value}")
-        return "\n".join(lines).strip()
+        text = f"{_generic_header(message.event_type)}\n{message.message}"
+        if payload:
+            body = "\n".join(
+                f"<b>{key}:</b> {value}"
+                for key, value in sorted(payload.items(), key=itemgetter(0))
+                if value is not None
+            )
+            text = f"{text}\n\n{body}"
+        return text.strip()
 
     def _extract_trade(self, payload: dict[str, Any]) -> dict[str, Any]:
         """Extract trade dict from payload (payload.trade or empty)."""
         trade_raw = payload.get("trade")
         if isinstance(trade_raw, dict):
             return cast(dict[str, Any], trade_raw)
-        return {}
+        return _EMPTY
 
     @staticmethod
     def _format_amount(value: Any) -> str:
@@ -275,10 +437,9 @@ class EventNotificationStyler(NotificationStyler):
         if value is None:
             return "N/A"
         try:
-            number = float(value)
-        except (TypeError, ValueError):
-            return str(value)
-        return f"{number:,.4f}"
+            return _format_amount_cached(value)
+        except TypeError:  # unhashable value: format without the cache
+            return _format_amount_uncached(value)
 
     @staticmethod
     def _pnl_indicator(value: Any) -> str:
@@ -297,8 +458,12 @@ class EventNotificationStyler(NotificationStyler):
 
     @staticmethod
     def _format_datetime_now() -> str:
-        """Format current datetime for display."""
-        return datetime.now(UTC).isoformat()
+        """Format current datetime for display (second resolution, reused within a second)."""
+        global _now_cache
+        second = int(time.time())
+        if _now_cache[0] != second:
+            _now_cache = (second, datetime.fromtimestamp(second, tz=UTC).isoformat())
+        return _now_cache[1]
 
     @staticmethod
     def _format_timestamp(value: Any) -> str:
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, replace
 from typing import Any, Protocol
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NotificationMessage:
     """Message to be sent via one or more notification channels."""
 
@@ -14,6 +15,44 @@ class NotificationMessage:
     message: str
     title: str | None = None
     payload: dict[str, Any] | None = None
+    coalesce_key: str | None = None
+    """Messages sharing a key supersede each other; under backlog only the newest is sent."""
+    priority: int = 0
+    """Higher values are sent first when the notification backlog is starved."""
+    message_args: tuple[Any, ...] | None = None
+    """If set, message is a %-format string rendered with these args by the worker (see lazy)."""
+
+    def __post_init__(self) -> None:
+        # Interned so renderer/priority table lookups by event_type hit the identity fast path
+        object.__setattr__(self, "event_type", sys.intern(self.event_type))
+
+    @classmethod
+    def lazy(
+        cls,
+        event_type: str,
+        fmt: str,
+        *args: Any,
+        title: str | None = None,
+        payload: dict[str, Any] | None = None,
+        coalesce_key: str | None = None,
+        priority: int = 0,
+    ) -> NotificationMessage:
+        """Build a message whose text (fmt % args) is only formatted when it is dispatched."""
+        return cls(
+            event_type=event_type,
+            message=fmt,
+            title=title,
+            payload=payload,
+            coalesce_key=coalesce_key,
+            priority=priority,
+            message_args=args,
+        )
+
+    def resolved(self) -> NotificationMessage:
+        """Return this message with the lazy text formatted (self if it is not lazy)."""
+        if self.message_args is None:
+            return self
+        return replace(self, message=self.message % self.message_args, message_args=None)
 
 
 class NotificationStyler(Protocol):
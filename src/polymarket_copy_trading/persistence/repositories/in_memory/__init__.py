@@ -1,5 +1,6 @@
 """In-memory repository implementations."""
 
+from polymarket_copy_trading.persistence.repositories.in_memory._state_file import StateFile
 from polymarket_copy_trading.persistence.repositories.in_memory.bot_position_repository import (
     InMemoryBotPositionRepository,
 )
@@ -18,4 +19,5 @@ __all__ = [
     "InMemoryTrackingRepository",
     "InMemoryTrackingSessionRepository",
     "InMemoryBotPositionRepository",
+    "StateFile",
 ]
@@ -0,0 +1,148 @@
+"""Write-back on-disk mirror for in-memory repository state (pickle, atomic replace)."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import pickle
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+_LOAD_ERRORS = (
+    pickle.UnpicklingError,
+    EOFError,
+    AttributeError,
+    ImportError,
+    IndexError,
+    TypeError,
+    ValueError,
+)
+"""What pickle.load raises for truncated/corrupt files or classes that moved or changed."""
+
+
+class StateFile:
+    """Pickle mirror of one repository's state.
+
+    load() is called once at startup; note_write() counts saves and reports when
+    flush_every of them are pending, so the repository only serializes its state
+    every N writes (and once more on close). Periodic flushes run in the default
+    executor (flush_in_background) so pickling and disk I/O stay off the event
+    loop; flush() writes synchronously for shutdown. Writes go to a temp file that
+    is os.replace'd over the target, so a crash never leaves a half-written file,
+    and a write never replaces the file with an older state than the last one written.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        flush_every: int = 50,
+        *,
+        get_logger: Callable[[str], Any] = structlog.get_logger,
+        logger_name: str | None = None,
+    ) -> None:
+        """Initialize the mirror.
+
+        Args:
+            path: File the state is stored in; parent directories are created on flush.
+            flush_every: Number of writes after which the state is flushed (>= 1).
+            get_logger: Logger factory (injected).
+            logger_name: Optional logger name (defaults to class name).
+        """
+        self.path = Path(path)
+        self._flush_every = max(1, flush_every)
+        self._pending = 0
+        self._generation = 0
+        self._written_generation = 0
+        self._write_lock = threading.Lock()
+        self._background: asyncio.Future[None] | None = None
+        self._logger = get_logger(logger_name or self.__class__.__name__)
+
+    def load(self) -> Any | None:
+        """Return the stored state, or None if there is no usable state file.
+
+        An unreadable file (truncated, corrupt, or pickled from an older model
+        layout) is moved aside to <name>.corrupt and the repository starts empty.
+        """
+        try:
+            with self.path.open("rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except _LOAD_ERRORS as e:
+            aside = self.path.with_name(f"{self.path.name}.corrupt")
+            os.replace(self.path, aside)
+            self._logger.warning(
+                "state_file_load_failed",
+                state_file_path=str(self.path),
+                state_file_moved_to=str(aside),
+                error_type=type(e).__name__,
+                error=str(e),
+            )
+            return None
+
+    def note_write(self) -> bool:
+        """Count one write; return True when the state should be flushed now."""
+        self._pending += 1
+        return self._pending >= self._flush_every
+
+    def flush(self, state: Any) -> None:
+        """Atomically replace the state file with state now and reset the pending count."""
+        self._pending = 0
+        self._generation += 1
+        self._write(state, self._generation)
+
+    def flush_in_background(self, state: Any) -> None:
+        """Write state from the default executor; synchronous when no loop is running.
+
+        state must be a snapshot the caller no longer mutates (e.g. a fresh list of
+        immutable models). While a previous background write is still running this
+        is a no-op: the pending count is kept, so the next write retries.
+        """
+        background = self._background
+        if background is not None and not background.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush(state)
+            return
+        self._pending = 0
+        self._generation += 1
+        self._background = loop.run_in_executor(None, self._write, state, self._generation)
+        self._background.add_done_callback(self._background_done)
+
+    def _background_done(self, future: asyncio.Future[None]) -> None:
+        """Log a failed background write and keep the state dirty so it is retried."""
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            self._pending += 1
+            self._logger.error(
+                "state_file_flush_failed",
+                state_file_path=str(self.path),
+                error_type=type(exc).__name__,
+                error=str(exc),
+            )
+
+    def _write(self, state: Any, generation: int) -> None:
+        """Pickle state to a temp file and os.replace it over path (skipped if already superseded)."""
+        with self._write_lock:
+            if generation <= self._written_generation:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.tmp")
+            with tmp.open("wb") as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.path)
+            self._written_generation = generation
+
+    @property
+    def dirty(self) -> bool:
+        """True if writes happened since the last flush or a background flush is still running."""
+        background = self._background
+        return self._pending > 0 or (background is not None and not background.done())
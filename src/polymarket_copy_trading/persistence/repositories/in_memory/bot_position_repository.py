@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import bisect
+from collections import defaultdict
+from collections.abc import Callable, Iterable
 from datetime import datetime
 from decimal import Decimal
+from operator import attrgetter
 from uuid import UUID
 
 from polymarket_copy_trading.models.bot_position import BotPosition
@@ -11,18 +15,30 @@ from polymarket_copy_trading.persistence.repositories.interfaces.bot_position_re
     IBotPositionRepository,
 )
 
-
-def _by_opened_at(position: BotPosition) -> str:
-    """Sort key: opened_at (FIFO = oldest first)."""
-    return position.opened_at.isoformat()
+_by_opened_at = attrgetter("opened_at_ns")
+"""Sort key: opened_at as epoch ns (FIFO = oldest first)."""
+_wallet_of = attrgetter("tracked_wallet")
+_ledger_of = attrgetter("ledger_id")
 
 
 class InMemoryBotPositionRepository(IBotPositionRepository):
-    """In-memory implementation of IBotPositionRepository."""
+    """In-memory implementation of IBotPositionRepository.
+
+    Besides the id store, positions are indexed by tracked_wallet and by ledger_id
+    (kept in sync by save), so list queries only touch that wallet's or ledger's rows.
+    OPEN positions are also kept in per-wallet and per-ledger lists sorted by
+    opened_at, so the FIFO open queries are a copy, with no filter or sort, and the
+    ledgers with open positions are tracked per wallet for count_active_ledgers.
+    """
 
     def __init__(self) -> None:
         """Initialize an empty in-memory store."""
         self._store: dict[UUID, BotPosition] = {}
+        self._by_wallet: defaultdict[str, dict[UUID, BotPosition]] = defaultdict(dict)
+        self._by_ledger: defaultdict[UUID, dict[UUID, BotPosition]] = defaultdict(dict)
+        self._open_by_wallet: dict[str, list[BotPosition]] = {}
+        self._open_by_ledger: dict[UUID, list[BotPosition]] = {}
+        self._active_ledgers: dict[str, set[UUID]] = {}
 
     async def get(self, position_id: UUID) -> BotPosition | None:
         """Return the position by id, or None if missing."""
@@ -30,28 +46,105 @@ class InMemoryBotPositionRepository(IBotPositionRepository):
 
     async def save(self, position: BotPosition) -> None:
         """Insert or update a position (by id)."""
-        self._store[position.id] = position
+        position_id = position.id
+        previous = self._store.get(position_id)
+        if previous is not None:
+            if previous.tracked_wallet != position.tracked_wallet:
+                self._discard(self._by_wallet, previous.tracked_wallet, position_id)
+            if previous.ledger_id != position.ledger_id:
+                self._discard(self._by_ledger, previous.ledger_id, position_id)
+        self._store[position_id] = position
+        self._by_wallet[position.tracked_wallet][position_id] = position
+        self._by_ledger[position.ledger_id][position_id] = position
+        self._update_open(self._open_by_wallet, previous, position, _wallet_of)
+        self._update_open(self._open_by_ledger, previous, position, _ledger_of)
+        if previous is not None and (
+            previous.ledger_id != position.ledger_id
+            or previous.tracked_wallet != position.tracked_wallet
+        ):
+            self._sync_active_ledger(previous.tracked_wallet, previous.ledger_id)
+        self._sync_active_ledger(position.tracked_wallet, position.ledger_id)
+
+    def _sync_active_ledger(self, tracked_wallet: str, ledger_id: UUID) -> None:
+        """Record ledger_id as active for the wallet iff it still has OPEN positions."""
+        if ledger_id in self._open_by_ledger:
+            self._active_ledgers.setdefault(tracked_wallet, set()).add(ledger_id)
+            return
+        active = self._active_ledgers.get(tracked_wallet)
+        if active is not None:
+            active.discard(ledger_id)
+            if not active:
+                del self._active_ledgers[tracked_wallet]
+
+    @staticmethod
+    def _update_open[K](
+        index: dict[K, list[BotPosition]],
+        previous: BotPosition | None,
+        position: BotPosition,
+        key_of: Callable[[BotPosition], K],
+    ) -> None:
+        """Keep index[key] holding exactly the OPEN positions, sorted by opened_at."""
+        key = key_of(position)
+        if previous is not None and previous.is_open:
+            old_key = key_of(previous)
+            rows = index[old_key]
+            if (
+                position.is_open
+                and old_key == key
+                and previous.opened_at_ns == position.opened_at_ns
+            ):
+                rows[rows.index(previous)] = position  # same FIFO slot: replace in place
+                return
+            rows.remove(previous)
+            if not rows:
+                del index[old_key]
+        if position.is_open:
+            # insort_right: equal opened_at stay in save order, like a stable sort
+            bisect.insort_right(index.setdefault(key, []), position, key=_by_opened_at)
+
+    @staticmethod
+    def _discard[K](
+        index: defaultdict[K, dict[UUID, BotPosition]], key: K, position_id: UUID
+    ) -> None:
+        """Remove position_id from index[key], dropping the bucket once empty."""
+        bucket = index.get(key)
+        if bucket is None:
+            return
+        bucket.pop(position_id, None)
+        if not bucket:
+            del index[key]
 
     async def list_by_wallet(self, tracked_wallet: str) -> list[BotPosition]:
         """Return all positions for the given tracked wallet (any status), ordered by opened_at (FIFO)."""
         return sorted(
-            (p for p in self._store.values() if p.tracked_wallet == tracked_wallet),
+            self._rows(self._by_wallet, tracked_wallet),
             key=_by_opened_at,
         )
 
     async def list_open_by_wallet(self, tracked_wallet: str) -> list[BotPosition]:
         """Return open positions for the given tracked wallet, ordered by opened_at (FIFO)."""
-        return sorted(
-            (p for p in self._store.values() if p.tracked_wallet == tracked_wallet and p.is_open),
-            key=_by_opened_at,
-        )
+        return list(self._open_by_wallet.get(tracked_wallet, ()))
 
-    async def list_open_by_ledger(self, ledger_id: UUID) -> list[BotPosition]:
+    async def list_open_by_ledger(
+        self, ledger_id: UUID, limit: int | None = None
+    ) -> list[BotPosition]:
         """Return open positions for the given ledger, ordered by opened_at (FIFO, oldest first)."""
-        return sorted(
-            (p for p in self._store.values() if p.ledger_id == ledger_id and p.is_open),
-            key=_by_opened_at,
-        )
+        rows = self._open_by_ledger.get(ledger_id, [])
+        return rows[:limit] if limit is not None else list(rows)
+
+    async def count_open_by_ledger(self, ledger_id: UUID) -> int:
+        """Return the number of OPEN positions for the given ledger."""
+        return len(self._open_by_ledger.get(ledger_id, ()))
+
+    async def count_active_ledgers(self, tracked_wallet: str) -> int:
+        """Return how many distinct ledgers of the wallet have at least one OPEN position."""
+        return len(self._active_ledgers.get(tracked_wallet, ()))
+
+    @staticmethod
+    def _rows[K](index: defaultdict[K, dict[UUID, BotPosition]], key: K) -> Iterable[BotPosition]:
+        """Positions in index[key] (without creating an empty bucket for unknown keys)."""
+        bucket = index.get(key)
+        return bucket.values() if bucket is not None else ()
 
     async def mark_closing_pending(
         self,
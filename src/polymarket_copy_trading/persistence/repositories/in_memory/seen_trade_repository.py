@@ -1,38 +1,72 @@
-"""In-memory seen trade repository (keyed by (wallet, trade_key))."""
+"""In-memory seen trade repository (set of hashed (wallet, trade_key) digests)."""
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from polymarket_copy_trading.models.seen_trade import SeenTrade
 from polymarket_copy_trading.persistence.repositories.interfaces.seen_trade_repository import (
     ISeenTradeRepository,
 )
+from polymarket_copy_trading.utils.dedupe import seen_digest, strip_padded
+
+_FILTER_BITS = 1 << 20
+"""Size of the negative-lookup bit filter (128 KiB)."""
+_FILTER_MASK = _FILTER_BITS - 1
 
 
-def _key(wallet: str, trade_key: str) -> tuple[str, str]:
-    """Normalize key for storage."""
-    return (wallet.strip(), trade_key.strip())
+def _filter_slot(wallet: str, trade_key: str) -> tuple[int, int]:
+    """(byte index, bit mask) of (wallet, trade_key) in the bit filter; same stripping as seen_digest."""
+    bit = (hash(strip_padded(wallet)) ^ hash(strip_padded(trade_key))) & _FILTER_MASK
+    return bit >> 3, 1 << (bit & 7)
 
 
 class InMemorySeenTradeRepository(ISeenTradeRepository):
-    """In-memory implementation of ISeenTradeRepository."""
+    """In-memory implementation of ISeenTradeRepository.
+
+    Only membership matters for dedupe, so each (wallet, trade_key) is kept as a
+    16-byte digest (see utils.dedupe.seen_digest) instead of a SeenTrade record.
+    Most contains() calls are for new trades, so a one-bit-per-key filter in
+    front of the set answers those from cached str hashes; only filter hits pay
+    for the digest and the exact set lookup.
+    """
 
     def __init__(self) -> None:
         """Initialize an empty in-memory store."""
-        self._store: dict[tuple[str, str], SeenTrade] = {}
+        self._seen: set[bytes] = set()
+        self._filter = bytearray(_FILTER_BITS >> 3)
+
+    def __len__(self) -> int:
+        return len(self._seen)
 
     async def contains(self, wallet: str, trade_key: str) -> bool:
         """Return True if (wallet, trade_key) has been seen."""
-        return _key(wallet, trade_key) in self._store
+        idx, mask = _filter_slot(wallet, trade_key)
+        if not self._filter[idx] & mask:
+            return False
+        return seen_digest(wallet, trade_key) in self._seen
 
     async def add(self, seen_trade: SeenTrade) -> None:
         """Record that a trade has been seen. Idempotent."""
-        k = _key(seen_trade.wallet, seen_trade.trade_key)
-        if k not in self._store:
-            self._store[k] = seen_trade
+        self._record(seen_trade.wallet, seen_trade.trade_key)
+
+    async def add_key(self, wallet: str, trade_key: str) -> None:
+        """Record (wallet, trade_key) as seen. Idempotent."""
+        self._record(wallet, trade_key)
+
+    async def add_keys(self, wallet: str, trade_keys: Iterable[str]) -> None:
+        """Record many trade_keys of one wallet in one pass."""
+        wallet = strip_padded(wallet)
+        for key in trade_keys:
+            self._record(wallet, key)
 
     async def add_batch(self, seen_trades: list[SeenTrade]) -> None:
         """Record multiple trades in one pass."""
         for st in seen_trades:
-            k = _key(st.wallet, st.trade_key)
-            if k not in self._store:
-                self._store[k] = st
+            self._record(st.wallet, st.trade_key)
+
+    def _record(self, wallet: str, trade_key: str) -> None:
+        """Set the filter bit and store the digest for (wallet, trade_key)."""
+        idx, mask = _filter_slot(wallet, trade_key)
+        self._filter[idx] |= mask
+        self._seen.add(seen_digest(wallet, trade_key))
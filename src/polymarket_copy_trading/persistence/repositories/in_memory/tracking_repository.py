@@ -1,23 +1,101 @@
-"""In-memory tracking repository (keyed by tracked_wallet, asset)."""
+"""In-memory tracking repository (partitioned by tracked_wallet, then asset)."""
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from datetime import datetime
+from decimal import Decimal
+
+from polymarket_copy_trading.models._normalize import sanitize_asset, sanitize_wallet
 from polymarket_copy_trading.models.tracking_ledger import TrackingLedger
+from polymarket_copy_trading.persistence.repositories.in_memory._state_file import StateFile
 from polymarket_copy_trading.persistence.repositories.interfaces.tracking_repository import (
     ITrackingRepository,
 )
 
 
-def _key(wallet: str, asset: str) -> tuple[str, str]:
-    return (wallet.strip(), asset.strip())
+class InMemoryTrackingRepository(ITrackingRepository):
+    """In-memory implementation of ITrackingRepository.
 
+    Ledgers are stored as wallet -> asset -> ledger, so per-wallet operations
+    (including list_by_wallet) only touch that wallet's partition. Keys are
+    interned (models._normalize), so dict probes short-circuit on identity.
+    Ledgers carry canonical keys from TrackingLedger.create, so only the raw
+    lookup arguments are sanitized. list_by_wallet results are memoized per
+    wallet as tuples until the next write to that wallet.
 
-class InMemoryTrackingRepository(ITrackingRepository):
-    """In-memory implementation of ITrackingRepository."""
+    Nothing here awaits, so the store operations have *_sync twins; the async
+    interface methods (and the get-modify-save helpers) run on them directly
+    instead of awaiting one coroutine per step.
+
+    With a state_file, ledgers are reloaded from it at startup and written back
+    every flush_every saves from the default executor (and synchronously on
+    flush()), so a restart resumes from the current ledgers instead of starting empty.
+    """
+
+    def __init__(self, state_file: StateFile | None = None) -> None:
+        """Initialize the store, empty or from state_file.
+
+        Args:
+            state_file: Optional on-disk mirror (see StateFile); None keeps state in memory only.
+        """
+        self._store: dict[str, dict[str, TrackingLedger]] = {}
+        self._listed: dict[str, tuple[TrackingLedger, ...]] = {}
+        self._state_file = state_file
+        if state_file is not None:
+            for ledger in state_file.load() or ():
+                ledgers = self._store.setdefault(sanitize_wallet(ledger.tracked_wallet), {})
+                ledgers[sanitize_asset(ledger.asset)] = ledger
 
-    def __init__(self) -> None:
-        """Initialize an empty in-memory store."""
-        self._store: dict[tuple[str, str], TrackingLedger] = {}
+    def flush(self) -> None:
+        """Write pending changes to the state file (no-op without one or when clean)."""
+        state_file = self._state_file
+        if state_file is not None and state_file.dirty:
+            state_file.flush(self._state())
+
+    def _state(self) -> list[TrackingLedger]:
+        """Snapshot of every ledger for the state file (ledgers are immutable)."""
+        return [ledger for ledgers in self._store.values() for ledger in ledgers.values()]
+
+    def get_sync(self, tracked_wallet: str, asset: str) -> TrackingLedger | None:
+        """Return the ledger for (wallet, asset), or None if missing."""
+        ledgers = self._store.get(sanitize_wallet(tracked_wallet))
+        if ledgers is None:
+            return None
+        return ledgers.get(sanitize_asset(asset))
+
+    def get_or_create_sync(self, tracked_wallet: str, asset: str) -> TrackingLedger:
+        """Return existing ledger or create one with snapshot_t0=0 and post_tracking=0."""
+        wallet = sanitize_wallet(tracked_wallet)
+        asset = sanitize_asset(asset)
+        # Hits (the steady state) cost two subscripts: no default {} built, no second probe
+        try:
+            return self._store[wallet][asset]
+        except KeyError:
+            pass
+        ledger = self._store.setdefault(wallet, {})[asset] = TrackingLedger.create(
+            tracked_wallet=wallet,
+            asset=asset,
+        )
+        self._listed.pop(wallet, None)
+        self._note_write()
+        return ledger
+
+    def save_sync(self, ledger: TrackingLedger) -> None:
+        """Upsert a ledger (by tracked_wallet, asset; canonical since TrackingLedger.create)."""
+        wallet = ledger.tracked_wallet
+        try:
+            self._store[wallet][ledger.asset] = ledger
+        except KeyError:
+            self._store[wallet] = {ledger.asset: ledger}
+        self._listed.pop(wallet, None)
+        self._note_write()
+
+    def _note_write(self) -> None:
+        """Count a write against the state file, flushing every flush_every writes (off-loop)."""
+        state_file = self._state_file
+        if state_file is not None and state_file.note_write():
+            state_file.flush_in_background(self._state())
 
     async def get(
         self,
@@ -25,7 +103,7 @@ class InMemoryTrackingRepository(ITrackingRepository):
         asset: str,
     ) -> TrackingLedger | None:
         """Return the ledger for (wallet, asset), or None if missing."""
-        return self._store.get(_key(tracked_wallet, asset))
+        return self.get_sync(tracked_wallet, asset)
 
     async def get_or_create(
         self,
@@ -33,21 +111,72 @@ class InMemoryTrackingRepository(ITrackingRepository):
         asset: str,
     ) -> TrackingLedger:
         """Return existing ledger or create one with snapshot_t0=0 and post_tracking=0."""
-        k = _key(tracked_wallet, asset)
-        if k in self._store:
-            return self._store[k]
-        ledger = TrackingLedger.create(
-            tracked_wallet=tracked_wallet,
-            asset=asset,
-        )
-        self._store[k] = ledger
-        return ledger
+        return self.get_or_create_sync(tracked_wallet, asset)
 
     async def save(self, ledger: TrackingLedger) -> None:
         """Upsert a ledger (by tracked_wallet, asset)."""
-        k = _key(ledger.tracked_wallet, ledger.asset)
-        self._store[k] = ledger
+        self.save_sync(ledger)
 
-    async def list_by_wallet(self, tracked_wallet: str) -> list[TrackingLedger]:
-        """Return all ledgers for the given tracked wallet."""
-        return [ledger for (w, _), ledger in self._store.items() if w == tracked_wallet.strip()]
+    async def list_by_wallet(self, tracked_wallet: str) -> Sequence[TrackingLedger]:
+        """Return all ledgers for the given tracked wallet (a shared tuple; copy to mutate)."""
+        wallet = sanitize_wallet(tracked_wallet)
+        listed = self._listed.get(wallet)
+        if listed is None:
+            ledgers = self._store.get(wallet)
+            if ledgers is None:
+                return ()
+            listed = self._listed[wallet] = tuple(ledgers.values())
+        return listed
+
+    async def update_snapshot_t0(
+        self,
+        tracked_wallet: str,
+        asset: str,
+        new_snapshot: Decimal,
+    ) -> TrackingLedger:
+        """Get-or-create ledger, set snapshot_t0_shares to new_snapshot, save and return updated."""
+        updated = self.get_or_create_sync(tracked_wallet, asset).with_snapshot_t0(new_snapshot)
+        self.save_sync(updated)
+        return updated
+
+    async def update_post_tracking(
+        self,
+        tracked_wallet: str,
+        asset: str,
+        new_post_tracking: Decimal,
+    ) -> TrackingLedger:
+        """Get-or-create ledger, set post_tracking_shares to new_post_tracking, save and return updated."""
+        updated = self.get_or_create_sync(tracked_wallet, asset).with_post_tracking(
+            new_post_tracking
+        )
+        self.save_sync(updated)
+        return updated
+
+    async def add_post_tracking_delta(
+        self,
+        tracked_wallet: str,
+        asset: str,
+        delta: Decimal,
+        *,
+        now: datetime | None = None,
+    ) -> TrackingLedger:
+        """Get-or-create ledger, add delta to post_tracking_shares, save and return."""
+        updated = self.get_or_create_sync(tracked_wallet, asset).add_post_tracking_delta(
+            delta, now=now
+        )
+        self.save_sync(updated)
+        return updated
+
+    async def update_close_stage_ref(
+        self,
+        tracked_wallet: str,
+        asset: str,
+        new_ref: Decimal | None,
+    ) -> TrackingLedger:
+        """Get ledger, set close_stage_ref_post_tracking_shares to new_ref, save and return. Ledger must exist."""
+        ledger = self.get_sync(tracked_wallet, asset)
+        if ledger is None:
+            raise ValueError(f"No ledger for ({tracked_wallet!r}, {asset!r})")
+        updated = ledger.with_close_stage_ref(new_ref)
+        self.save_sync(updated)
+        return updated
@@ -2,28 +2,58 @@
 
 from __future__ import annotations
 
+import bisect
+from operator import attrgetter
 from uuid import UUID
 
+from polymarket_copy_trading.models._normalize import sanitize_wallet
 from polymarket_copy_trading.models.tracking_session import (
     SessionStatus,
     TrackingSession,
 )
+from polymarket_copy_trading.persistence.repositories.in_memory._state_file import StateFile
 from polymarket_copy_trading.persistence.repositories.interfaces.tracking_session_repository import (
     ITrackingSessionRepository,
 )
 
-
-def _by_started_at_desc(session: TrackingSession) -> str:
-    """Sort key: started_at descending (newest first)."""
-    return session.started_at.isoformat()
+_by_started_at = attrgetter("started_at")
+"""Sort key for the per-wallet session lists (native datetime compare)."""
+_RUNNING = SessionStatus.RUNNING
+"""Enum members are singletons: status checks are identity tests against this global."""
 
 
 class InMemoryTrackingSessionRepository(ITrackingSessionRepository):
-    """In-memory implementation of ITrackingSessionRepository."""
+    """In-memory implementation of ITrackingSessionRepository.
+
+    Sessions are stored by id and indexed by wallet (a list kept sorted by
+    started_at), plus the active (RUNNING, not ended) session per wallet; save
+    keeps both indexes in sync, so wallet queries never scan or sort.
+    """
 
-    def __init__(self) -> None:
-        """Initialize an empty in-memory store."""
+    def __init__(self, state_file: StateFile | None = None) -> None:
+        """Initialize the store, empty or from state_file.
+
+        Args:
+            state_file: Optional on-disk mirror (see StateFile); None keeps state in memory only.
+                Sessions are reloaded at startup (RUNNING ones as STOPPED) and written back
+                every flush_every saves.
+        """
         self._store: dict[UUID, TrackingSession] = {}
+        self._by_wallet: dict[str, list[TrackingSession]] = {}
+        self._active: dict[str, TrackingSession] = {}
+        self._state_file = state_file
+        if state_file is not None:
+            for session in state_file.load() or ():
+                # The process that ran it is gone: a restored RUNNING session is not active
+                if session.status is _RUNNING:
+                    session = session.with_status(SessionStatus.STOPPED)
+                self._put(session)
+
+    def flush(self) -> None:
+        """Write pending changes to the state file (no-op without one or when clean)."""
+        state_file = self._state_file
+        if state_file is not None and state_file.dirty:
+            state_file.flush(list(self._store.values()))
 
     async def get(self, session_id: UUID) -> TrackingSession | None:
         """Return the session by id, or None if missing."""
@@ -31,18 +61,48 @@ class InMemoryTrackingSessionRepository(ITrackingSessionRepository):
 
     async def save(self, session: TrackingSession) -> None:
         """Insert or update a session (by id)."""
-        self._store[session.id] = session
+        self._put(session)
+        state_file = self._state_file
+        if state_file is not None and state_file.note_write():
+            state_file.flush_in_background(list(self._store.values()))
 
     async def get_active_for_wallet(self, wallet: str) -> TrackingSession | None:
         """Return the active (RUNNING) session for the wallet, or None."""
-        wallet = wallet.strip()
-        for s in self._store.values():
-            if s.wallet == wallet and s.status == SessionStatus.RUNNING and s.ended_at is None:
-                return s
-        return None
+        return self._active.get(sanitize_wallet(wallet))
 
     async def list_by_wallet(self, wallet: str) -> list[TrackingSession]:
         """Return all sessions for the wallet, ordered by started_at descending."""
-        wallet = wallet.strip()
-        sessions = [s for s in self._store.values() if s.wallet == wallet]
-        return sorted(sessions, key=_by_started_at_desc, reverse=True)
+        sessions = self._by_wallet.get(sanitize_wallet(wallet))
+        return sessions[::-1] if sessions is not None else []
+
+    def _put(self, session: TrackingSession) -> None:
+        """Store session by id and update the wallet and active indexes."""
+        previous = self._store.get(session.id)
+        self._store[session.id] = session
+        try:
+            sessions = self._by_wallet[session.wallet]
+        except KeyError:
+            sessions = self._by_wallet[session.wallet] = []
+        if (
+            previous is not None
+            and previous.wallet == session.wallet
+            and previous.started_at == session.started_at
+        ):
+            # Same slot in the sorted list: replace in place
+            sessions[sessions.index(previous)] = session
+        else:
+            if previous is not None:
+                self._by_wallet[previous.wallet].remove(previous)
+                self._discard_active(previous)
+            # insort_left + reversed reads keep equal started_at in save order
+            bisect.insort_left(sessions, session, key=_by_started_at)
+        if session.status is _RUNNING and session.ended_at is None:
+            self._active[session.wallet] = session
+        else:
+            self._discard_active(session)
+
+    def _discard_active(self, session: TrackingSession) -> None:
+        """Drop session from the active index if it is the one recorded for its wallet."""
+        active = self._active.get(session.wallet)
+        if active is not None and active.id == session.id:
+            del self._active[session.wallet]
@@ -34,8 +34,15 @@ class IBotPositionRepository(ABC):
         ...
 
     @abstractmethod
-    async def list_open_by_ledger(self, ledger_id: UUID) -> list[BotPosition]:
-        """Return open positions for the given ledger, ordered by opened_at (FIFO, oldest first)."""
+    async def list_open_by_ledger(
+        self, ledger_id: UUID, limit: int | None = None
+    ) -> list[BotPosition]:
+        """Return open positions for the given ledger, ordered by opened_at (FIFO, oldest first).
+
+        Args:
+            ledger_id: Ledger to list.
+            limit: If set, return at most this many (the oldest) positions.
+        """
         ...
 
     @abstractmethod
@@ -71,3 +78,19 @@ class IBotPositionRepository(ABC):
     ) -> BotPosition | None:
         """Update a CLOSED position with real close amounts. Save and return updated. None if not found or not closed."""
         ...
+
+    async def count_open_by_ledger(self, ledger_id: UUID) -> int:
+        """Return the number of OPEN positions for the given ledger.
+
+        Default derives it from list_open_by_ledger; stores should override with a
+        count query instead of loading the rows.
+        """
+        return len(await self.list_open_by_ledger(ledger_id))
+
+    async def count_active_ledgers(self, tracked_wallet: str) -> int:
+        """Return how many distinct ledgers of the wallet have at least one OPEN position.
+
+        Default derives it from list_open_by_wallet; stores should override with a
+        count query (e.g. COUNT(DISTINCT ledger_id)) instead of loading every row.
+        """
+        return len({p.ledger_id for p in await self.list_open_by_wallet(tracked_wallet)})
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 
 from polymarket_copy_trading.models.seen_trade import SeenTrade
 
@@ -20,6 +21,18 @@ class ISeenTradeRepository(ABC):
         """Record that a trade has been seen. Idempotent (re-adding same key is no-op)."""
         ...
 
+    async def add_key(self, wallet: str, trade_key: str) -> None:
+        """Record (wallet, trade_key) as seen without building a SeenTrade. Default impl calls add()."""
+        await self.add(SeenTrade.create(wallet, trade_key))
+
+    async def add_keys(self, wallet: str, trade_keys: Iterable[str]) -> None:
+        """Record many trade_keys of one wallet as seen. Default impl calls add_key() for each.
+
+        Implementations should override this with a single bulk write (set update, bulk INSERT).
+        """
+        for key in trade_keys:
+            await self.add_key(wallet, key)
+
     async def add_batch(self, seen_trades: list[SeenTrade]) -> None:
         """Record multiple trades. Default impl calls add() for each."""
         for st in seen_trades:
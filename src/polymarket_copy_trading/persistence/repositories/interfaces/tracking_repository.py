@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
 from decimal import Decimal
 
 from polymarket_copy_trading.models.tracking_ledger import TrackingLedger
@@ -35,8 +37,8 @@ class ITrackingRepository(ABC):
         ...
 
     @abstractmethod
-    async def list_by_wallet(self, tracked_wallet: str) -> list[TrackingLedger]:
-        """Return all ledgers for the given tracked wallet."""
+    async def list_by_wallet(self, tracked_wallet: str) -> Sequence[TrackingLedger]:
+        """Return all ledgers for the given tracked wallet (read-only; copy to mutate)."""
         ...
 
     # -------------------------------------------------------------------------
@@ -72,10 +74,12 @@ class ITrackingRepository(ABC):
         tracked_wallet: str,
         asset: str,
         delta: Decimal,
+        *,
+        now: datetime | None = None,
     ) -> TrackingLedger:
         """Get-or-create ledger, add delta to post_tracking_shares (e.g. +size BUY, -size SELL), save and return."""
         ledger = await self.get_or_create(tracked_wallet, asset)
-        updated = ledger.add_post_tracking_delta(delta)
+        updated = ledger.add_post_tracking_delta(delta, now=now)
         await self.save(updated)
         return updated
 
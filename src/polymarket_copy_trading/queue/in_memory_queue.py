@@ -13,7 +13,11 @@ from polymarket_copy_trading.queue.base import IAsyncQueue
 
 
 class InMemoryQueue[T](IAsyncQueue[T]):
-    """In-memory implementation of AsyncQueue using asyncio.Queue."""
+    """In-memory implementation of AsyncQueue using asyncio.Queue.
+
+    The *_nowait methods check shutdown/full/empty up front and raise the domain
+    exception directly, instead of letting asyncio raise and re-raising it chained.
+    """
 
     def __init__(self, maxsize: int = 0) -> None:
         """Initialize the queue.
@@ -22,6 +26,7 @@ class InMemoryQueue[T](IAsyncQueue[T]):
             maxsize: Maximum number of items. 0 means unbounded.
         """
         self._queue: asyncio.Queue[T] = asyncio.Queue(maxsize=maxsize)
+        self._is_shutdown = False
 
     def __len__(self) -> int:
         """Return the number of items in the queue."""
@@ -51,8 +56,13 @@ class InMemoryQueue[T](IAsyncQueue[T]):
             QueueFull: If the queue has reached its maximum size.
             QueueShutdown: If the queue has been shut down (no more items can be put).
         """
+        if self._is_shutdown:
+            raise QueueShutdown
+        queue = self._queue
+        if queue.full():
+            raise QueueFull
         try:
-            self._queue.put_nowait(item)
+            queue.put_nowait(item)
         except asyncio.QueueShutDown as e:
             raise QueueShutdown from e
         except asyncio.QueueFull as e:
@@ -84,8 +94,11 @@ class InMemoryQueue[T](IAsyncQueue[T]):
             QueueShutdown: If the queue has been shut down and is empty, or was shut down
                 with immediate=True.
         """
+        queue = self._queue
+        if queue.empty():
+            raise QueueShutdown if self._is_shutdown else QueueEmpty
         try:
-            return self._queue.get_nowait()
+            return queue.get_nowait()
         except asyncio.QueueShutDown as e:
             raise QueueShutdown from e
         except asyncio.QueueEmpty as e:
@@ -130,6 +143,7 @@ class InMemoryQueue[T](IAsyncQueue[T]):
             immediate: If True, shut down without waiting for in-flight items to be processed.
                 If False, existing items may still be consumed until the queue is empty.
         """
+        self._is_shutdown = True
         self._queue.shutdown(immediate)
 
     async def join(self) -> None:
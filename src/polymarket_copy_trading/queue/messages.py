@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import random
 import uuid
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, is_dataclass
 from datetime import UTC, datetime
 from typing import Any
 
+_id_bits = random.Random().getrandbits
+"""128 random bits per message id; seeded from os.urandom, no syscall per message."""
+_now = datetime.now
+_UUID = uuid.UUID
+
 
 @dataclass(frozen=True, slots=True)
 class QueueMessage[T]:
@@ -19,14 +25,34 @@ class QueueMessage[T]:
 
     @classmethod
     def create(cls, payload: T, metadata: dict[str, Any] | None = None) -> QueueMessage[T]:
-        """Create a new message with the given payload."""
+        """Create a new message with the given payload.
+
+        The id is a random version-4 UUID (unique, not meant to be unguessable).
+        """
         return cls(
-            id=uuid.uuid4(),
+            id=_UUID(int=_id_bits(128), version=4),
             payload=payload,
-            created_at=datetime.now(UTC),
+            created_at=_now(UTC),
             metadata=metadata,
         )
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert the message to a dictionary."""
-        return asdict(self)
+        """Convert the message to a dictionary.
+
+        Built field by field instead of asdict(self), which deep-copies the whole
+        message. A payload with its own to_dict() (e.g. DataApiTradeDTO) is converted
+        with it, other dataclass payloads with asdict(); metadata is copied shallowly.
+        """
+        payload: Any = self.payload
+        to_dict = getattr(payload, "to_dict", None)
+        if to_dict is not None:
+            payload = to_dict()
+        elif is_dataclass(payload) and not isinstance(payload, type):
+            payload = asdict(payload)
+        metadata = self.metadata
+        return {
+            "id": self.id,
+            "payload": payload,
+            "created_at": self.created_at,
+            "metadata": dict(metadata) if metadata is not None else None,
+        }
@@ -1,32 +1,78 @@
-"""Application services."""
-
-from polymarket_copy_trading.services.account_value import (
-    AccountValueResult,
-    AccountValueService,
-)
-from polymarket_copy_trading.services.copy_trading import CopyTradingEngineService
-from polymarket_copy_trading.services.order_execution import MarketOrderExecutionService
-from polymarket_copy_trading.services.pnl import PnLResult, PnLService
-from polymarket_copy_trading.services.snapshot import (
-    SnapshotBuilderService,
-    SnapshotResult,
-)
-from polymarket_copy_trading.services.strategy import (
-    ClosePolicy,
-    ClosePolicyInput,
-    ClosePolicyResult,
-    OpenPolicy,
-    OpenPolicyInput,
-    OpenPolicyResult,
-)
-from polymarket_copy_trading.services.tracking_trader import (
-    TrackingRunner,
-    TradeTracker,
-)
-from polymarket_copy_trading.services.trade_processing import (
-    PostTrackingEngine,
-    TradeProcessorService,
-)
+"""Application services.
+
+Exports are loaded lazily (PEP 562): importing one service subpackage, or this
+package, no longer imports every service and its clients up front.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from polymarket_copy_trading.services.account_value import (
+        AccountValueResult,
+        AccountValueService,
+    )
+    from polymarket_copy_trading.services.copy_trading import CopyTradingEngineService
+    from polymarket_copy_trading.services.order_execution import MarketOrderExecutionService
+    from polymarket_copy_trading.services.pnl import PnLResult, PnLService
+    from polymarket_copy_trading.services.snapshot import (
+        SnapshotBuilderService,
+        SnapshotResult,
+    )
+    from polymarket_copy_trading.services.strategy import (
+        ClosePolicy,
+        ClosePolicyInput,
+        ClosePolicyResult,
+        OpenPolicy,
+        OpenPolicyInput,
+        OpenPolicyResult,
+    )
+    from polymarket_copy_trading.services.tracking_trader import (
+        TrackingRunner,
+        TradeTracker,
+    )
+    from polymarket_copy_trading.services.trade_processing import (
+        PostTrackingEngine,
+        TradeProcessorService,
+    )
+
+_EXPORTS: dict[str, str] = {
+    "CopyTradingEngineService": ".copy_trading",
+    "PnLResult": ".pnl",
+    "PnLService": ".pnl",
+    "AccountValueResult": ".account_value",
+    "AccountValueService": ".account_value",
+    "OpenPolicy": ".strategy",
+    "OpenPolicyInput": ".strategy",
+    "OpenPolicyResult": ".strategy",
+    "ClosePolicy": ".strategy",
+    "ClosePolicyInput": ".strategy",
+    "ClosePolicyResult": ".strategy",
+    "PostTrackingEngine": ".trade_processing",
+    "TradeTracker": ".tracking_trader",
+    "TrackingRunner": ".tracking_trader",
+    "MarketOrderExecutionService": ".order_execution",
+    "SnapshotBuilderService": ".snapshot",
+    "SnapshotResult": ".snapshot",
+    "TradeProcessorService": ".trade_processing",
+}
+"""Exported name -> subpackage (relative to this package) that defines it."""
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
+
 
 __all__ = [
     "CopyTradingEngineService",
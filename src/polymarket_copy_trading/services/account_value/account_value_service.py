@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any
 
 import structlog
+from cachetools import TTLCache
 
 from polymarket_copy_trading.utils.validation import mask_address
 
@@ -15,8 +17,27 @@ if TYPE_CHECKING:
     from polymarket_copy_trading.clients.data_api import DataApiClient
     from polymarket_copy_trading.clients.rcp_client import RpcClient
 
+_ZERO = Decimal("0")
 
-@dataclass(frozen=True)
+type _CacheKey = tuple[str, tuple[str, ...]]
+
+
+def _sum_values(values: list[Any]) -> Decimal:
+    """Exact Decimal sum of API values, skipping any that do not parse as a number."""
+    try:
+        return sum(map(Decimal, map(str, values)), _ZERO)
+    except (ArithmeticError, TypeError, ValueError):  # decimal.InvalidOperation is arithmetic
+        pass
+    total = _ZERO
+    for value in values:
+        try:
+            total += Decimal(str(value))
+        except (ArithmeticError, TypeError, ValueError):
+            continue
+    return total
+
+
+@dataclass(frozen=True, slots=True)
 class AccountValueResult:
     """Total account value for a Polymarket wallet."""
 
@@ -42,6 +63,8 @@ class AccountValueService:
         rpc_client: RpcClient,
         data_api: DataApiClient,
         *,
+        cache_ttl_seconds: float = 5.0,
+        cache_maxsize: int = 64,
         get_logger: Callable[[str], Any] = structlog.get_logger,
         logger_name: str | None = None,
     ) -> None:
@@ -50,11 +73,20 @@ class AccountValueService:
         Args:
             rpc_client: For on-chain USDC.e balance (get_erc20_balance / get_usdc_e_balance).
             data_api: For positions value (get_positions_value).
+            cache_ttl_seconds: How long a computed value is reused for the same
+                (wallet, market); 0 disables the cache.
+            cache_maxsize: Maximum number of cached (wallet, market) results.
             get_logger: Logger factory (injected).
             logger_name: Optional logger name (defaults to class name).
         """
         self._rpc = rpc_client
         self._data_api = data_api
+        self._cache: TTLCache[_CacheKey, AccountValueResult] | None = (
+            TTLCache(maxsize=max(1, cache_maxsize), ttl=cache_ttl_seconds)
+            if cache_ttl_seconds > 0
+            else None
+        )
+        self._in_flight: dict[_CacheKey, asyncio.Future[AccountValueResult]] = {}
         self._logger = get_logger(logger_name or self.__class__.__name__)
 
     async def get_total_account_value(
@@ -73,32 +105,57 @@ class AccountValueService:
             wallet: Wallet address (0x...).
             market: Optional market filter for positions value (same as Data API).
 
+        Results are cached for cache_ttl_seconds per (wallet, market), and concurrent
+        calls for the same key share one lookup, so a burst of trades costs one
+        RPC + Data API round-trip.
+
         Returns:
             AccountValueResult with cash_usdc, positions_value_usdc, total_usdc.
         """
         wallet = wallet.strip()
+        if self._cache is None:
+            return await self._compute(wallet, market)
+        key: _CacheKey = (wallet, tuple(market) if market else ())
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._compute(wallet, market))
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._finish(key, done))
+        # shield: a cancelled caller must not cancel the lookup other callers share
+        return await asyncio.shield(future)
+
+    def _finish(self, key: _CacheKey, future: asyncio.Future[AccountValueResult]) -> None:
+        """Drop the in-flight entry and cache the result if the lookup succeeded."""
+        self._in_flight.pop(key, None)
+        if future.cancelled() or future.exception() is not None or self._cache is None:
+            return
+        self._cache[key] = future.result()
+
+    async def _compute(self, wallet: str, market: list[str] | None) -> AccountValueResult:
+        """Fetch cash and positions value and build the result (uncached)."""
         wallet_masked = mask_address(wallet)
 
-        cash_usdc = await self._rpc.get_usdc_e_balance(wallet)
-        value_items = await self._data_api.get_positions_value(wallet, market=market)
+        # Independent I/O (Polygon RPC + Data API): wait for the slower one, not both in turn
+        cash_usdc, value_items = await asyncio.gather(
+            self._rpc.get_usdc_e_balance(wallet),
+            self._data_api.get_positions_value(wallet, market=market),
+        )
 
-        positions_value = Decimal("0")
-        for item in value_items:
-            val = item.get("value")
-            if val is not None:
-                try:
-                    positions_value += Decimal(str(val))
-                except (TypeError, ValueError):
-                    pass
+        positions_value = _sum_values(
+            [v for v in (item.get("value") for item in value_items) if v is not None]
+        )
 
         total_usdc = cash_usdc + positions_value
 
         self._logger.info(
             "account_value_computed",
             wallet_masked=wallet_masked,
-            cash_usdc=float(cash_usdc),
-            positions_value_usdc=float(positions_value),
-            total_usdc=float(total_usdc),
+            cash_usdc=cash_usdc,
+            positions_value_usdc=positions_value,
+            total_usdc=total_usdc,
         )
 
         return AccountValueResult(
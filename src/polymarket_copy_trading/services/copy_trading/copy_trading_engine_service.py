@@ -6,9 +6,10 @@ or close positions and executes orders via MarketOrderExecutionService.
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from datetime import UTC, datetime
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 from typing import TYPE_CHECKING, Any, Literal
 
 import structlog
@@ -38,6 +39,10 @@ if TYPE_CHECKING:
         ITrackingRepository,
     )
     from polymarket_copy_trading.services.account_value import AccountValueService
+    from polymarket_copy_trading.services.order_execution.dto import (
+        OrderExecutionResult,
+        OrderResponse,
+    )
     from polymarket_copy_trading.services.order_execution.market_order_execution import (
         MarketOrderExecutionService,
     )
@@ -46,6 +51,10 @@ if TYPE_CHECKING:
     )
 
 
+_MAX_CONCURRENT_SELLS = 4
+"""Upper bound on sell orders in flight at once when closing several positions."""
+
+
 class CopyTradingEngineService:
     """Orchestrates open/close decisions and order execution based on ledger state."""
 
@@ -131,24 +140,20 @@ class CopyTradingEngineService:
     ) -> None:
         """Evaluate OpenPolicy and open a position if allowed."""
         strategy = self._settings.strategy
-        open_positions = await self._position_repo.list_open_by_ledger(ledger.id)
-        open_positions_count = len(open_positions)
-        active_ledgers_count = await self._count_active_ledgers(wallet)
-
-        try:
-            account_result = await self._account_value.get_total_account_value(wallet)
-            account_total_value_usdc = account_result.total_usdc
-        except Exception as e:
-            self._logger.warning(
-                "copy_engine_account_value_failed",
-                wallet_masked=mask_address(wallet),
-                asset=asset,
-                error=str(e),
-            )
-            account_total_value_usdc = Decimal("0")
-
-        post_tracking_value_usdc = await self._get_post_tracking_value_usdc(
-            wallet, asset, ledger.post_tracking_shares
+        log = self._logger.bind(wallet_masked=mask_address(wallet), asset=asset)
+        # Independent lookups: one gather, so a failing repo call cannot orphan the others
+        (
+            account_total_value_usdc,
+            post_tracking_value_usdc,
+            open_positions_count,
+            active_ledgers_count,
+        ) = await asyncio.gather(
+            self._get_account_total_value_usdc(wallet, asset),
+            self._get_post_tracking_value_usdc(
+                wallet, asset, ledger.post_tracking_shares, trade.condition_id
+            ),
+            self._position_repo.count_open_by_ledger(ledger.id),
+            self._position_repo.count_active_ledgers(wallet),
         )
 
         inp = OpenPolicyInput(
@@ -161,10 +166,8 @@ class CopyTradingEngineService:
         result = self._open_policy.should_open(inp, strategy)
 
         if not result.should_open:
-            self._logger.debug(
+            log.debug(
                 "copy_engine_open_skipped",
-                wallet_masked=mask_address(wallet),
-                asset=asset,
                 reason=result.reason,
             )
             return
@@ -175,10 +178,8 @@ class CopyTradingEngineService:
             amount=amount_usdc,
         )
         if not exec_result.success:
-            self._logger.warning(
+            log.warning(
                 "copy_engine_buy_failed",
-                wallet_masked=mask_address(wallet),
-                asset=asset,
                 error=exec_result.error,
             )
             self._emit_order_failed(
@@ -194,20 +195,18 @@ class CopyTradingEngineService:
             )
             return
 
-        price = trade.price if trade.price and trade.price > 0 else None
-        shares_held = (
-            Decimal(str(amount_usdc / price)) if price is not None else Decimal(str(amount_usdc))
-        )
-        if shares_held <= 0:
-            shares_held = Decimal(str(amount_usdc))
+        # Convert each float once and divide in Decimal (no float quotient round-trip)
+        amount = Decimal(str(amount_usdc))
+        price = Decimal(str(trade.price)) if trade.price and trade.price > 0 else None
+        shares_held = amount / price if price is not None else amount
 
         position = BotPosition.create(
             ledger_id=ledger.id,
             tracked_wallet=wallet,
             asset=asset,
             shares_held=shares_held,
-            entry_price=Decimal(str(price)) if price else None,
-            entry_cost_usdc=Decimal(str(amount_usdc)),
+            entry_price=price,
+            entry_cost_usdc=amount,
         )
         await self._position_repo.save(position)
         resp = exec_result.response
@@ -230,12 +229,10 @@ class CopyTradingEngineService:
                 wallet, asset, ledger.post_tracking_shares
             )
 
-        self._logger.info(
+        log.info(
             "copy_engine_position_opened",
-            wallet_masked=mask_address(wallet),
-            asset=asset,
             position_id=str(position.id),
-            shares_held=float(shares_held),
+            shares_held=shares_held,
             amount_usdc=amount_usdc,
             reason=result.reason,
         )
@@ -248,8 +245,8 @@ class CopyTradingEngineService:
         asset: str,
     ) -> None:
         """Evaluate ClosePolicy and close positions if required."""
-        open_positions = await self._position_repo.list_open_by_ledger(ledger.id)
-        open_positions_count = len(open_positions)
+        log = self._logger.bind(wallet_masked=mask_address(wallet), asset=asset)
+        open_positions_count = await self._position_repo.count_open_by_ledger(ledger.id)
         if open_positions_count == 0:
             return
 
@@ -260,32 +257,44 @@ class CopyTradingEngineService:
         result = self._close_policy.positions_to_close(inp, self._settings.strategy)
 
         if result.positions_to_close <= 0:
-            self._logger.debug(
+            log.debug(
                 "copy_engine_close_skipped",
-                wallet_masked=mask_address(wallet),
-                asset=asset,
                 reason=result.reason,
             )
             return
 
         n = min(result.positions_to_close, open_positions_count)
-        to_close = open_positions[:n]
+        # Only the n oldest positions are closed, so only those are loaded
+        to_close = await self._position_repo.list_open_by_ledger(ledger.id, limit=n)
         close_requests_sent = 0
 
-        for position in to_close:
-            exec_result = await self._market_exec.place_sell_shares(
-                token_id=asset,
-                amount=float(position.shares_held),
-            )
-            resp = exec_result.response
+        # Independent orders: place them concurrently (bounded), then record results in FIFO order
+        limit = asyncio.Semaphore(_MAX_CONCURRENT_SELLS)
+
+        async def place_sell(position: BotPosition) -> OrderExecutionResult[OrderResponse]:
+            async with limit:
+                return await self._market_exec.place_sell_shares(
+                    token_id=asset,
+                    amount=float(position.shares_held),
+                )
+
+        # return_exceptions: one raising order must not hide the orders that did go through
+        exec_results = await asyncio.gather(
+            *(place_sell(position) for position in to_close), return_exceptions=True
+        )
+
+        for position, exec_result in zip(to_close, exec_results, strict=True):
+            if isinstance(exec_result, BaseException):
+                resp, success = None, False
+                error: str | None = f"{type(exec_result).__name__}: {exec_result}"
+            else:
+                resp, success, error = exec_result.response, exec_result.success, exec_result.error
             tx_hash = resp.transactions_hashes[0] if resp and resp.transactions_hashes else None
-            if not exec_result.success:
-                self._logger.warning(
+            if not success:
+                log.warning(
                     "copy_engine_sell_failed",
-                    wallet_masked=mask_address(wallet),
-                    asset=asset,
                     position_id=str(position.id),
-                    error=exec_result.error,
+                    error=error,
                 )
                 self._emit_order_failed(
                     reason="order_placement_failed",
@@ -294,7 +303,7 @@ class CopyTradingEngineService:
                     tracked_wallet=wallet,
                     asset=asset,
                     is_open=False,
-                    error_message=exec_result.error,
+                    error_message=error,
                     transaction_hash=tx_hash,
                     amount=float(position.shares_held),
                     amount_kind="shares",
@@ -310,10 +319,8 @@ class CopyTradingEngineService:
                 close_requested_at=datetime.now(UTC),
             )
             if pending is None:
-                self._logger.warning(
+                log.warning(
                     "copy_engine_position_not_found_for_close",
-                    wallet_masked=mask_address(wallet),
-                    asset=asset,
                     position_id=str(position.id),
                 )
                 self._emit_order_failed(
@@ -340,16 +347,14 @@ class CopyTradingEngineService:
                 is_open=False,
                 amount=float(position.shares_held),
                 amount_kind="shares",
-                success=exec_result.success,
+                success=success,
                 transaction_hash=tx_hash,
             )
             close_requests_sent += 1
-            self._logger.info(
+            log.info(
                 "copy_engine_position_close_requested",
-                wallet_masked=mask_address(wallet),
-                asset=asset,
                 position_id=str(position.id),
-                shares_sold=float(position.shares_held),
+                shares_sold=position.shares_held,
                 reason=result.reason,
             )
 
@@ -420,34 +425,48 @@ class CopyTradingEngineService:
         )
         self._event_bus.dispatch(event)
 
-    async def _count_active_ledgers(self, wallet: str) -> int:
-        """Count ledgers that have at least one open position."""
-        open_positions = await self._position_repo.list_open_by_wallet(wallet)
-        ledger_ids = {p.ledger_id for p in open_positions}
-        return len(ledger_ids)
+    async def _get_account_total_value_usdc(self, wallet: str, asset: str) -> Decimal:
+        """Total account value in USDC, or 0 if it cannot be fetched (logged)."""
+        try:
+            account_result = await self._account_value.get_total_account_value(wallet)
+        except Exception as e:
+            self._logger.warning(
+                "copy_engine_account_value_failed",
+                wallet_masked=mask_address(wallet),
+                asset=asset,
+                error=str(e),
+            )
+            return Decimal("0")
+        return account_result.total_usdc
 
     async def _get_post_tracking_value_usdc(
         self,
         wallet: str,
         asset: str,
         post_tracking_shares: Decimal,
+        condition_id: str | None = None,
     ) -> Decimal:
-        """Compute mark-to-market value of post_tracking_shares for the asset."""
+        """Compute mark-to-market value of post_tracking_shares for the asset.
+
+        When the trade's condition_id is known, only that market's positions are
+        fetched (at most one row per outcome) instead of the wallet's full list.
+        """
         if post_tracking_shares <= 0:
             return Decimal("0")
         try:
-            positions = await self._data_api.get_positions(user=wallet)
-            for p in positions:
-                if str(p.get("asset", "")).strip() == asset:
-                    cur_price = p.get("curPrice")
-                    if cur_price is not None:
-                        try:
-                            price = float(cur_price)
-                            if price > 0:
-                                return post_tracking_shares * Decimal(str(price))
-                        except (TypeError, ValueError):
-                            pass
-                    break
+            positions = await self._data_api.get_positions(
+                user=wallet,
+                market=[condition_id] if condition_id else None,
+            )
+            p = next((p for p in positions if str(p.get("asset", "")).strip() == asset), None)
+            cur_price = p.get("curPrice") if p is not None else None
+            if cur_price is not None:
+                try:
+                    price = Decimal(str(cur_price))
+                    if price.is_finite() and price > 0:
+                        return post_tracking_shares * price
+                except InvalidOperation:
+                    pass
         except Exception as e:
             self._logger.debug(
                 "copy_engine_post_tracking_value_failed",
@@ -98,17 +98,20 @@ class TradeConfirmedNotifier:
             pnl_result = self._pnl_service.compute(position)
 
         trade_payload = _build_trade_payload(position, trade, is_open, pnl_result)
-        message = (
-            "Position opened"
-            if is_open
-            else f"Position closed (PnL: {_dec_to_str(pnl_result.net_pnl_usdc) if pnl_result and pnl_result.net_pnl_usdc is not None else 'N/A'} USDC)"
-        )
-
-        notification = NotificationMessage(
-            event_type=event_type,
-            message=message,
-            payload={"trade": trade_payload},
-        )
+        if is_open:
+            notification = NotificationMessage(
+                event_type=event_type,
+                message="Position opened",
+                payload={"trade": trade_payload},
+            )
+        else:
+            net_pnl = pnl_result.net_pnl_usdc if pnl_result else None
+            notification = NotificationMessage.lazy(
+                event_type,
+                "Position closed (PnL: %s USDC)",
+                net_pnl if net_pnl is not None else "N/A",
+                payload={"trade": trade_payload},
+            )
         self._notification_service.notify(notification)
         self._logger.debug(
             "trade_confirmed_notified",
@@ -101,6 +101,8 @@ class TradeFailedNotifier:
             event_type="trade_failed",
             message=message,
             payload=payload,
+            coalesce_key=f"trade_failed:{event.position_id}" if event.position_id else None,
+            priority=3,
         )
         self._notification_service.notify(notification)
         self._logger.debug(
@@ -368,14 +368,7 @@ class OrderAnalysisWorker:
         self, position: BotPosition, entry_cost_usdc: Decimal, open_fee_usdc: Decimal
     ) -> BotPosition:
         """Update an OPEN position with real entry cost and fees."""
-        from dataclasses import replace
-
-        new_fees = position.fees + open_fee_usdc
-        updated = replace(
-            position,
-            entry_cost_usdc=entry_cost_usdc,
-            fees=new_fees,
-        )
+        updated = position.with_entry_cost_updated(entry_cost_usdc, open_fee_usdc)
         await self._position_repo.save(updated)
         return updated
 
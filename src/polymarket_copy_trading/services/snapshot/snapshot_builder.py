@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from decimal import Decimal
@@ -13,6 +13,7 @@ from uuid import UUID
 import structlog
 
 from polymarket_copy_trading.clients.data_api import DataApiClient, PositionSchema
+from polymarket_copy_trading.models._normalize import sanitize_asset
 from polymarket_copy_trading.models.tracking_ledger import TrackingLedger
 from polymarket_copy_trading.models.tracking_session import (
     SessionStatus,
@@ -50,7 +51,7 @@ def _parse_position(p: PositionSchema) -> tuple[str, float] | None:
         size_f = float(size_raw)
     except (TypeError, ValueError):
         return None
-    return (str(asset).strip(), size_f)
+    return (sanitize_asset(str(asset)), size_f)
 
 
 class SnapshotBuilderService:
@@ -159,15 +160,20 @@ class SnapshotBuilderService:
                 pages_fetched=page_count + 1,
             )
 
+            now = datetime.now(UTC)
             for asset, total_size in aggregated.items():
                 ledger = await self._repo.get_or_create(wallet, asset)
-                updated = ledger.with_snapshot_t0(Decimal(str(total_size))).with_post_tracking(
-                    Decimal("0")
+                updated = ledger.with_shares(
+                    snapshot_t0_shares=Decimal(str(total_size)),
+                    post_tracking_shares=Decimal("0"),
+                    now=now,
                 )
+                if updated.close_stage_ref_post_tracking_shares is not None:
+                    updated = updated.with_close_stage_ref(None, now=now)
                 await self._repo.save(updated)
                 ledgers.append(updated)
+            ledgers_reset = await self._reset_untouched_ledgers(wallet, aggregated, now)
 
-            now = datetime.now(UTC)
             session = session.with_snapshot_completed(now, source="positions")
             await self._session_repo.save(session)
 
@@ -175,6 +181,7 @@ class SnapshotBuilderService:
                 "snapshot_t0_built",
                 tracking_wallet_masked=mask_address(wallet),
                 positions_added=len(ledgers),
+                ledgers_reset=ledgers_reset,
                 session_id=str(session.id),
             )
             return SnapshotResult(
@@ -203,3 +210,27 @@ class SnapshotBuilderService:
                 error=str(e),
                 session_id=session.id,
             )
+
+    async def _reset_untouched_ledgers(
+        self, wallet: str, held: Mapping[str, float], now: datetime
+    ) -> int:
+        """Zero the wallet's ledgers for assets it no longer holds; return how many changed.
+
+        Ledgers can outlive a restart (PERSISTENCE__STATE_DIR) while bot positions do
+        not, so post-tracking and close-stage state from before t0 would be stale.
+        """
+        reset = 0
+        zero = Decimal("0")
+        for ledger in tuple(await self._repo.list_by_wallet(wallet)):
+            if ledger.asset in held or (
+                ledger.snapshot_t0_shares == zero
+                and ledger.post_tracking_shares == zero
+                and ledger.close_stage_ref_post_tracking_shares is None
+            ):
+                continue
+            cleared = ledger.with_shares(
+                snapshot_t0_shares=zero, post_tracking_shares=zero, now=now
+            ).with_close_stage_ref(None, now=now)
+            await self._repo.save(cleared)
+            reset += 1
+        return reset
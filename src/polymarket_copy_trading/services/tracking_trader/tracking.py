@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING, Any, cast
 
 import structlog
 
-from polymarket_copy_trading.models.seen_trade import SeenTrade
+from polymarket_copy_trading.models._normalize import sanitize_wallet
 from polymarket_copy_trading.queue import QueueMessage
 from polymarket_copy_trading.services.tracking_trader.trade_dto import (
     DataApiTradeDTO,
@@ -73,6 +73,7 @@ class TradeTracker:
         """
         if not is_hex_address(wallet):
             raise ValueError("wallet must be a valid 0x wallet address (42 chars)")
+        wallet = sanitize_wallet(wallet)
 
         tr = self._settings.tracking
         poll_seconds = poll_seconds if poll_seconds is not None else tr.poll_seconds
@@ -84,9 +85,10 @@ class TradeTracker:
 
         # Baseline fetch: mark all current trades as seen
         latest = await self._data_api.get_trades(wallet, limit=limit, offset=0)
-        baseline = [SeenTrade.create(wallet, trade_key(cast(dict[str, Any], t))) for t in latest]
-        if baseline:
-            await self._seen_repo.add_batch(baseline)
+        if latest:
+            await self._seen_repo.add_keys(
+                wallet, [trade_key(cast(dict[str, Any], t)) for t in latest]
+            )
 
         wallet_masked = mask_address(wallet)
         self._logger.debug(
@@ -109,7 +111,7 @@ class TradeTracker:
                     k = trade_key(t_dict)
                     if await self._seen_repo.contains(wallet, k):
                         continue
-                    await self._seen_repo.add(SeenTrade.create(wallet, k))
+                    await self._seen_repo.add_key(wallet, k)
                     trade = DataApiTradeDTO.from_response(t_dict)
                     self._logger.debug(
                         "tracking_new_trade",
@@ -17,7 +17,7 @@ if TYPE_CHECKING:
 
 
 class TrackingRunner:
-    """Runs tracker.track() for each wallet in parallel until shutdown_event or CancelledError."""
+    """Runs tracker.track() for each wallet in parallel until cancelled (e.g. SIGINT)."""
 
     def __init__(
         self,
@@ -42,18 +42,15 @@ class TrackingRunner:
         self._snapshot_builder = snapshot_builder
         self._logger = get_logger(logger_name or self.__class__.__name__)
 
-    async def run(
-        self,
-        wallets: list[str],
-        shutdown_event: asyncio.Event,
-    ) -> None:
-        """Start one track task per wallet; wait for shutdown_event or CancelledError; cancel all tasks.
+    async def run(self, wallets: list[str]) -> None:
+        """Start one track task per wallet and wait on them; on CancelledError cancel all tasks.
 
+        Shutdown is signalled by cancelling the task running this coroutine (e.g. the
+        caller registers ``loop.add_signal_handler(SIGINT, runner_task.cancel)``).
         If snapshot_builder was injected, builds snapshot t0 for each wallet before starting track tasks.
 
         Args:
             wallets: List of 0x wallet addresses to track.
-            shutdown_event: When set, stop all tasks and return.
         """
         tr = self._settings.tracking
         self._logger.info(
@@ -79,26 +76,14 @@ class TrackingRunner:
         ]
 
         try:
-            await shutdown_event.wait()
+            await asyncio.gather(*track_tasks)
         except asyncio.CancelledError:
             self._logger.info(
                 "tracking_runner_shutdown_cancelled",
-                message="Kernel or task cancelled; stopping system",
+                message="Signal, kernel or task cancelled; stopping system",
             )
+            raise
+        finally:
             for t in track_tasks:
                 t.cancel()
-            for t in track_tasks:
-                try:
-                    await t
-                except asyncio.CancelledError:
-                    pass
-            raise
-
-        self._logger.info("tracking_runner_shutdown_started")
-        for t in track_tasks:
-            t.cancel()
-        for t in track_tasks:
-            try:
-                await t
-            except asyncio.CancelledError:
-                pass
+            await asyncio.gather(*track_tasks, return_exceptions=True)
@@ -6,10 +6,12 @@ DTOs. TrackingTradeDTO composes them without mixing fields.
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from time import time
 from typing import Any, Literal
 
+from polymarket_copy_trading.models._normalize import sanitize_asset
+
 TradeSide = Literal["BUY", "SELL"]
 
 
@@ -51,8 +53,12 @@ class DataApiTradeDTO:
     slug: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        """Snake_case dict; do not mix with Gamma fields."""
-        return asdict(self)
+        """Snake_case dict; do not mix with Gamma fields.
+
+        All fields are scalars, so a flat slot walk is equivalent to asdict() without
+        its recursive deep copy.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> DataApiTradeDTO:
@@ -66,6 +72,7 @@ class DataApiTradeDTO:
         price_val = response.get("price")
         size_val = response.get("size")
         oi = response.get("outcomeIndex")
+        asset = response.get("asset")
         return cls(
             timestamp=int(ts) if ts is not None else int(time()),
             condition_id=response.get("conditionId"),
@@ -75,7 +82,7 @@ class DataApiTradeDTO:
             size=float(size_val) if size_val is not None else None,
             transaction_hash=response.get("transactionHash"),
             proxy_wallet=response.get("proxyWallet"),
-            asset=str(response.get("asset")) if response.get("asset") is not None else None,
+            asset=sanitize_asset(str(asset)) if asset is not None else None,
             icon=response.get("icon"),
             event_slug=response.get("eventSlug"),
             event_id=response.get("eventId"),
@@ -71,9 +71,11 @@ class PostTrackingEngine:
             return None
         size_d = Decimal(str(size_raw))
 
+        # One read and one write per trade: compute the final ledger state, then save once
+        ledger = await self._repo.get_or_create(wallet, asset)
         if side == "BUY":
-            await self._repo.get_or_create(wallet, asset)
-            updated = await self._repo.add_post_tracking_delta(wallet, asset, size_d)
+            updated = ledger.add_post_tracking_delta(size_d)
+            await self._repo.save(updated)
             self._logger.debug(
                 "post_tracking_buy",
                 wallet_masked=mask_address(wallet),
@@ -83,8 +85,7 @@ class PostTrackingEngine:
             )
             return updated
 
-        # SELL: ensure ledger exists, then reduce post_tracking first; excess reduces snapshot_t0
-        ledger = await self._repo.get_or_create(wallet, asset)
+        # SELL: reduce post_tracking first; excess reduces snapshot_t0
         new_pt = ledger.post_tracking_shares - size_d
         if new_pt >= 0:
             updated = ledger.with_post_tracking(new_pt)
@@ -100,7 +101,9 @@ class PostTrackingEngine:
         # new_pt < 0: set post_tracking to 0, reduce snapshot by |new_pt|
         excess = -new_pt
         new_snapshot = max(Decimal(0), ledger.snapshot_t0_shares - excess)
-        updated = ledger.with_post_tracking(Decimal(0)).with_snapshot_t0(new_snapshot)
+        updated = ledger.with_shares(
+            snapshot_t0_shares=new_snapshot, post_tracking_shares=Decimal(0)
+        )
         await self._repo.save(updated)
         self._logger.debug(
             "post_tracking_sell_into_snapshot",
@@ -1,10 +1,17 @@
 """Utility modules."""
 
-from polymarket_copy_trading.utils.dedupe import trade_key
+from polymarket_copy_trading.utils.dedupe import seen_digest, strip_padded, trade_key
 from polymarket_copy_trading.utils.validation import (
     is_condition_id,
     is_hex_address,
     mask_address,
 )
 
-__all__ = ["is_hex_address", "is_condition_id", "mask_address", "trade_key"]
+__all__ = [
+    "is_hex_address",
+    "is_condition_id",
+    "mask_address",
+    "seen_digest",
+    "strip_padded",
+    "trade_key",
+]
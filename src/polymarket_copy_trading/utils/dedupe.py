@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from hashlib import blake2b
 from typing import Any
 
 
@@ -24,3 +25,41 @@ def trade_key(t: dict[str, Any]) -> str:
     price = str(t.get("price") or "")
     size = str(t.get("size") or "")
     return f"cmp:{ts}|{cid}|{outcome}|{price}|{size}"
+
+
+def strip_padded(value: str) -> str:
+    """Return value without surrounding whitespace, reusing value when it has none.
+
+    Shared by seen_digest and the seen-trade filter so both normalize keys identically.
+    """
+    if value[:1].isspace() or value[-1:].isspace():
+        return value.strip()
+    return value
+
+
+_WALLET_HASHERS: dict[str, blake2b] = {}
+"""Per-wallet blake2b state with "wallet|" already absorbed (wallets are a small, repeating set)."""
+_WALLET_HASHERS_MAX = 1024
+
+
+def _wallet_hasher(wallet: str) -> blake2b:
+    hasher = _WALLET_HASHERS.get(wallet)
+    if hasher is None:
+        if len(_WALLET_HASHERS) >= _WALLET_HASHERS_MAX:
+            _WALLET_HASHERS.clear()
+        hasher = _WALLET_HASHERS[wallet] = blake2b(
+            f"{strip_padded(wallet)}|".encode(), digest_size=16
+        )
+    return hasher
+
+
+def seen_digest(wallet: str, trade_key: str) -> bytes:
+    """Return a compact 16-byte digest of (wallet, trade_key) for seen-trade sets.
+
+    Both parts are stripped, so the digest matches SeenTrade.create normalization.
+    The wallet prefix is hashed once per wallet; trade_key is only stripped when it
+    actually has surrounding whitespace.
+    """
+    hasher = _wallet_hasher(wallet).copy()
+    hasher.update(strip_padded(trade_key).encode())
+    return hasher.digest()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 
@@ -29,8 +30,12 @@ def is_condition_id(x: Any) -> bool:
     return s.startswith("0x") and len(s) == 66
 
 
+@lru_cache(maxsize=256)
 def mask_address(addr: str | None) -> str:
-    """Return a masked wallet address for logging (e.g. 0x1234...abcd)."""
+    """Return a masked wallet address for logging (e.g. 0x1234...abcd).
+
+    Cached: the same few wallets are masked on every log line of the trade path.
+    """
     if not addr or len(addr) < 10:
         return "***"
     return f"{addr[:6]}...{addr[-4:]}"
@@ -226,3 +226,47 @@ def test_with_closed_without_closed_at_sets_current_utc_datetime(
 
     assert updated.closed_at is not None
     assert before <= updated.closed_at <= after
+
+
+def test_usdc_amounts_are_stored_as_micro_usdc_and_rounded_to_six_decimals(
+    bot_position_factory: Callable[..., BotPosition],
+) -> None:
+    position = bot_position_factory(
+        entry_cost_usdc=Decimal("10.1234565"),
+        fees=Decimal("0.25"),
+    ).with_closed(close_proceeds_usdc=Decimal("12.5"), close_fees=Decimal("0.000001"))
+
+    assert position.entry_cost_micro_usdc == 10_123_456
+    assert position.close_proceeds_micro_usdc == 12_500_000
+    assert position.fees_micro_usdc == 250_001
+    assert position.entry_cost_usdc == Decimal("10.123456")
+    assert position.fees == Decimal("0.250001")
+    assert position.net_pnl_usdc() == Decimal("2.126543")
+
+
+def test_timestamps_are_stored_as_epoch_ns_and_round_trip_exactly(
+    bot_position_factory: Callable[..., BotPosition],
+) -> None:
+    opened = datetime(2026, 3, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+    closed = datetime(2026, 3, 1, 13, 0, tzinfo=timezone.utc)
+
+    position = bot_position_factory(opened_at=opened).with_closed(closed_at=closed)
+
+    assert position.opened_at_ns == 1_772_368_215_123_456_000
+    assert position.opened_at == opened
+    assert position.closed_at == closed
+
+
+def test_status_and_close_attempts_are_packed_into_flags(
+    bot_position_factory: Callable[..., BotPosition],
+) -> None:
+    position = bot_position_factory()
+    for _ in range(200):
+        position = position.with_closing_pending()
+    closed = position.with_closed()
+
+    assert position.status is PositionStatus.CLOSING_PENDING
+    assert position.close_attempts == 200
+    assert closed.status is PositionStatus.CLOSED
+    assert closed.close_attempts == 200
+    assert closed.flags == (200 << 2) | 2
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for SeenTrade creation and validation."""
+
+from __future__ import annotations
+
+import pytest
+
+from polymarket_copy_trading.models.seen_trade import SeenTrade
+
+
+def test_create_strips_trade_key(wallet: str) -> None:
+    seen = SeenTrade.create(wallet, "  tx:0xabc ")
+
+    assert (seen.wallet, seen.trade_key) == (wallet, "tx:0xabc")
+
+
+@pytest.mark.parametrize(("wallet", "trade_key"), [("", "tx:1"), ("   ", "tx:1"), ("0xw", "  ")])
+def test_create_rejects_empty_or_blank_parts(wallet: str, trade_key: str) -> None:
+    with pytest.raises(ValueError, match="non-empty"):
+        SeenTrade.create(wallet, trade_key)
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for NotificationService buffering and dispatch."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from typing import Any, cast
+
+import pytest
+
+from polymarket_copy_trading.notifications.notification_manager import NotificationService
+from polymarket_copy_trading.notifications.strategies.base import BaseNotificationStrategy
+from polymarket_copy_trading.notifications.types import NotificationMessage
+
+
+class _RecordingNotifier(BaseNotificationStrategy):
+    """Minimal notifier that records every delivered message."""
+
+    def __init__(self, *, fail: bool = False, enabled: bool = True) -> None:
+        super().__init__(cast(Any, None))
+        self.sent: list[NotificationMessage] = []
+        self.batches = 0
+        self.running = False
+        self.fail = fail
+        self.enabled = enabled
+
+    @property
+    def is_running(self) -> bool:
+        return self.running
+
+    async def initialize(self) -> None:
+        self.running = True
+
+    async def shutdown(self) -> None:
+        self.running = False
+
+    def wants(self, message: NotificationMessage) -> bool:
+        return self.running and self.enabled
+
+    async def send_notifications_batch(self, messages: Sequence[NotificationMessage]) -> None:
+        self.batches += 1
+        await super().send_notifications_batch(messages)
+
+    async def send_notification(self, message: NotificationMessage) -> None:
+        if self.fail:
+            raise RuntimeError("channel down")
+        self.sent.append(message)
+
+
+def _message(n: int) -> NotificationMessage:
+    return NotificationMessage(event_type="test", message=f"m{n}")
+
+
+def _service(*notifiers: BaseNotificationStrategy, **kwargs: Any) -> NotificationService:
+    return NotificationService(notifiers=list(notifiers), **kwargs)
+
+
+async def test_notify_delivers_in_order_and_shutdown_drains_buffer() -> None:
+    notifier = _RecordingNotifier()
+    service = _service(notifier)
+    await service.initialize()
+
+    for n in range(5):
+        service.notify(_message(n))
+    await service.shutdown()
+
+    assert [m.message for m in notifier.sent] == ["m0", "m1", "m2", "m3", "m4"]
+    assert notifier.is_running is False
+
+
+async def test_notify_when_full_drops_oldest_pending_message() -> None:
+    notifier = _RecordingNotifier()
+    service = _service(notifier, queue_size=2)
+    await service.initialize()
+
+    for n, event_type in enumerate(("a", "b", "c")):
+        service.notify(NotificationMessage(event_type=event_type, message=f"m{n}"))
+    await service.shutdown()
+
+    assert sorted(m.message for m in notifier.sent) == ["m1", "m2"]
+    assert service.dropped_count == 1
+
+
+async def test_notify_when_full_coalesces_same_event_type_into_last_slot() -> None:
+    notifier = _RecordingNotifier()
+    service = _service(notifier, queue_size=2)
+    await service.initialize()
+
+    for n in range(4):
+        service.notify(_message(n))
+    await service.shutdown()
+
+    assert sorted(m.message for m in notifier.sent) == ["m0", "m3"]
+    assert service.dropped_count == 2
+
+
+async def test_starved_backlog_is_sent_newest_first_and_coalesced() -> None:
+    notifier = _RecordingNotifier()
+    service = _service(notifier, queue_size=5)
+    await service.initialize()
+
+    service.notify(NotificationMessage(event_type="test", message="m0", priority=1))
+    service.notify(NotificationMessage(event_type="test", message="m1", coalesce_key="k"))
+    service.notify(_message(2))
+    service.notify(NotificationMessage(event_type="test", message="m3", coalesce_key="k"))
+    service.notify(_message(4))
+    await service.shutdown()
+
+    assert [m.message for m in notifier.sent] == ["m0", "m4", "m3", "m2"]
+
+
+async def test_failing_notifier_does_not_block_other_channels() -> None:
+    broken = _RecordingNotifier(fail=True)
+    healthy = _RecordingNotifier()
+    service = _service(broken, healthy)
+    await service.initialize()
+
+    service.notify(_message(0))
+    service.notify(_message(1))
+    await service.shutdown()
+
+    assert [m.message for m in healthy.sent] == ["m0", "m1"]
+    assert broken.sent == []
+
+
+async def test_disabled_notifier_is_skipped_before_sending() -> None:
+    disabled = _RecordingNotifier(enabled=False)
+    enabled = _RecordingNotifier()
+    service = _service(disabled, enabled)
+    await service.initialize()
+
+    service.notify(_message(0))
+    await service.shutdown()
+
+    assert disabled.batches == 0
+    assert [m.message for m in enabled.sent] == ["m0"]
+
+
+async def test_single_failing_notifier_keeps_worker_running() -> None:
+    notifier = _RecordingNotifier(fail=True)
+    service = _service(notifier)
+    await service.initialize()
+
+    service.notify(_message(0))
+    await asyncio.sleep(0)
+    notifier.fail = False
+    service.notify(_message(1))
+    await service.shutdown()
+
+    assert [m.message for m in notifier.sent] == ["m1"]
+
+
+async def test_lazy_message_is_formatted_by_the_worker() -> None:
+    notifier = _RecordingNotifier()
+    service = _service(notifier)
+    await service.initialize()
+
+    lazy = NotificationMessage.lazy("position_closed", "Position closed (PnL: %s USDC)", "1.5")
+    service.notify(lazy)
+    await service.shutdown()
+
+    assert lazy.message_args == ("1.5",)
+    assert [m.message for m in notifier.sent] == ["Position closed (PnL: 1.5 USDC)"]
+    assert notifier.sent[0].message_args is None
+
+
+async def test_lazy_message_with_bad_args_falls_back_to_raw_template() -> None:
+    notifier = _RecordingNotifier()
+    service = _service(notifier)
+    await service.initialize()
+
+    service.notify(NotificationMessage.lazy("position_closed", "PnL: %s %s", "1.5"))
+    service.notify(_message(1))
+    await service.shutdown()
+
+    assert [m.message for m in notifier.sent] == ["PnL: %s %s", "m1"]
+
+
+async def test_notify_before_initialize_raises() -> None:
+    service = _service(_RecordingNotifier())
+
+    with pytest.raises(RuntimeError, match="not initialized"):
+        service.notify(_message(0))
+
+
+@pytest.mark.parametrize("interval", [0, -1.0])
+def test_non_positive_drop_report_interval_is_rejected(interval: float) -> None:
+    with pytest.raises(ValueError, match="drop_report_interval_seconds"):
+        _service(_RecordingNotifier(), drop_report_interval_seconds=interval)
+
+
+async def test_close_drains_then_closes_every_notifier() -> None:
+    """close() delivers pending messages before releasing each notifier."""
+    closed: list[int] = []
+
+    class _ClosingNotifier(_RecordingNotifier):
+        async def close(self) -> None:
+            closed.append(len(self.sent))
+            await super().close()
+
+    notifier = _ClosingNotifier()
+    service = _service(notifier)
+    await service.initialize()
+    service.notify(_message(0))
+
+    await service.close()
+
+    assert closed == [1]
+    assert notifier.is_running is False
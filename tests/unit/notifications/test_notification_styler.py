@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for EventNotificationStyler rendering."""
+
+from __future__ import annotations
+
+from polymarket_copy_trading.notifications.stylers.notification_styler import (
+    EventNotificationStyler,
+)
+from polymarket_copy_trading.notifications.types import NotificationMessage
+
+
+def test_render_dispatches_by_event_type() -> None:
+    """Known event types use their dedicated renderer."""
+    styler = EventNotificationStyler()
+    message = NotificationMessage(event_type="system_stopped", message="Bye")
+
+    rendered = styler.render(message, parse_html=True)
+
+    assert rendered.startswith("⏹️ <b>System Stopped</b>")
+    assert "Bye" in rendered
+
+
+def test_render_unknown_event_falls_back_to_generic_and_strips_html() -> None:
+    """Unknown event types render generically; plain-text output has no tags."""
+    styler = EventNotificationStyler()
+    message = NotificationMessage(
+        event_type="custom_event",
+        message="Hello",
+        payload={"b": 2, "a": 1},
+    )
+
+    rendered = styler.render(message)
+
+    assert rendered == "ℹ️ Custom Event\n\nHello\n\na: 1\nb: 2"
+
+
+def test_render_reuses_cached_text_for_the_same_message() -> None:
+    """A message rendered again with the same parse_html returns the cached string."""
+    styler = EventNotificationStyler()
+    message = NotificationMessage(event_type="system_stopped", message="Bye")
+
+    first = styler.render(message, parse_html=True)
+
+    assert styler.render(message, parse_html=True) is first
+    assert "<b>" not in styler.render(message)
+
+
+def test_render_bytes_is_utf8_of_render_and_reused_for_same_text() -> None:
+    """render_bytes encodes the rendered text and shares bytes for identical output."""
+    styler = EventNotificationStyler()
+    first = NotificationMessage(event_type="custom_event", message="Héllo")
+    second = NotificationMessage(event_type="custom_event", message="Héllo")
+
+    encoded = styler.render_bytes(first)
+
+    assert encoded == styler.render(first).encode("utf-8")
+    assert styler.render_bytes(second) is encoded
+
+
+def test_render_keeps_falsy_payload_values_instead_of_na() -> None:
+    """Zero values are rendered as-is; only missing (None) fields become N/A."""
+    styler = EventNotificationStyler()
+    message = NotificationMessage(
+        event_type="trade_failed",
+        message="failed",
+        payload={"order_id": 0, "wallet": None},
+    )
+
+    rendered = styler.render(message, parse_html=True)
+
+    assert "<b>Order ID:</b> 0\n" in rendered
+    assert "<b>Wallet:</b> N/A\n" in rendered
@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for TelegramNotifier outbox, rate limit and lifecycle."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from polymarket_copy_trading.config.config import TelegramNotificationSettings
+from polymarket_copy_trading.notifications.strategies import telegram
+from polymarket_copy_trading.notifications.strategies.telegram import TelegramNotifier
+from polymarket_copy_trading.notifications.types import NotificationMessage
+
+
+class _FakeRequest:
+    """Stand-in for HTTPXRequest that records shutdown()."""
+
+    def __init__(self, **timeouts: float) -> None:
+        self.timeouts = timeouts
+        self.closed = False
+
+    async def shutdown(self) -> None:
+        self.closed = True
+
+
+class _FakeBot:
+    """Stand-in for telegram.Bot that records every send_message text."""
+
+    def __init__(self, token: str, request: Any = None) -> None:
+        self.token = token
+        self.request = request
+        self.texts: list[str] = []
+
+    async def send_message(self, *, chat_id: str, text: str, parse_mode: str) -> None:
+        self.texts.append(text)
+
+
+class _PlainStyler:
+    """Styler that renders a message as its raw text."""
+
+    def render(self, message: NotificationMessage, parse_html: bool = False) -> str:
+        return message.message
+
+
+@pytest.fixture(autouse=True)
+def _fake_telegram(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(telegram, "Bot", _FakeBot)
+    monkeypatch.setattr(telegram, "HTTPXRequest", _FakeRequest)
+
+
+def _notifier(**overrides: Any) -> TelegramNotifier:
+    cfg = TelegramNotificationSettings(enabled=True, api_key="123:token", chat_id="42", **overrides)
+    return TelegramNotifier(settings=SimpleNamespace(telegram=cfg), styler=_PlainStyler())  # type: ignore[arg-type]
+
+
+async def test_close_releases_the_owned_http_pool() -> None:
+    """close() shuts the notifier's HTTPXRequest down; the next initialize() builds a new one."""
+    notifier = _notifier()
+    await notifier.initialize()
+    request = notifier._request
+    assert isinstance(request, _FakeRequest)
+
+    await notifier.close()
+
+    assert request.closed is True
+    assert notifier.is_running is False
+    await notifier.initialize()
+    assert notifier._request is not request
+    await notifier.close()
+
+
+async def test_shutdown_keeps_the_http_pool_for_reinitialize() -> None:
+    """shutdown() alone keeps the Bot and its pool so a reinit reuses warm connections."""
+    notifier = _notifier()
+    await notifier.initialize()
+    request = notifier._request
+
+    await notifier.shutdown()
+    await notifier.initialize()
+
+    assert notifier._request is request
+    assert isinstance(request, _FakeRequest) and request.closed is False
+    await notifier.close()
+
+
+def _outbox_texts(notifier: TelegramNotifier) -> list[str]:
+    return [entry[2] for entry in sorted(notifier._outbox)]
+
+
+async def test_full_outbox_evicts_the_least_important_newest_message() -> None:
+    """A more important message replaces the lowest-priority entry, newest on ties."""
+    notifier = _notifier(queue_size=3)
+    await notifier.initialize()
+
+    notifier._enqueue(NotificationMessage(event_type="trade_new", message="new-1"), "new-1")
+    notifier._enqueue(NotificationMessage(event_type="trade_new", message="new-2"), "new-2")
+    notifier._enqueue(NotificationMessage(event_type="position_opened", message="open"), "open")
+    notifier._enqueue(NotificationMessage(event_type="trade_failed", message="fail"), "fail")
+
+    assert _outbox_texts(notifier) == ["fail", "open", "new-1"]
+    await notifier.close()
+
+
+async def test_full_outbox_drops_a_message_no_more_important_than_the_worst() -> None:
+    """Equal or lower priority than every pending entry drops the new message instead."""
+    notifier = _notifier(queue_size=2)
+    await notifier.initialize()
+
+    notifier._enqueue(NotificationMessage(event_type="position_closed", message="a"), "a")
+    notifier._enqueue(NotificationMessage(event_type="position_closed", message="b"), "b")
+    notifier._enqueue(NotificationMessage(event_type="position_opened", message="c"), "c")
+    notifier._enqueue(NotificationMessage(event_type="custom", message="d"), "d")
+
+    assert _outbox_texts(notifier) == ["a", "b"]
+    await notifier.close()
+
+
+async def test_message_priority_overrides_the_event_type_default() -> None:
+    """NotificationMessage.priority (higher first) wins over the per-event default."""
+    notifier = _notifier(queue_size=1)
+    await notifier.initialize()
+
+    notifier._enqueue(NotificationMessage(event_type="trade_failed", message="fail"), "fail")
+    urgent = NotificationMessage(event_type="custom", message="urgent", priority=5)
+    notifier._enqueue(urgent, "urgent")
+
+    assert _outbox_texts(notifier) == ["urgent"]
+    await notifier.close()
+
+
+async def test_chunk_keeps_arrival_order_across_priorities() -> None:
+    """Messages sent together in one Telegram message stay in the order they arrived."""
+    notifier = _notifier()
+    await notifier.initialize()
+    bot = notifier._bot
+    assert isinstance(bot, _FakeBot)
+
+    await notifier.send_notifications_batch(
+        [
+            NotificationMessage(event_type="trade_new", message="first"),
+            NotificationMessage(event_type="trade_failed", message="second"),
+            NotificationMessage(event_type="custom", message="third"),
+        ]
+    )
+    await notifier.close()
+
+    assert bot.texts == ["first\n\nsecond\n\nthird"]
+
+
+async def test_burst_is_coalesced_into_one_send_message(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Messages arriving within the coalesce window cost a single Telegram call."""
+    monkeypatch.setattr(telegram, "_COALESCE_WINDOW_SECONDS", 0.01)
+    notifier = _notifier()
+    await notifier.initialize()
+    bot = notifier._bot
+    assert isinstance(bot, _FakeBot)
+    await asyncio.sleep(0)  # sender is now waiting for the first message
+
+    for n in range(5):
+        await notifier.send_notification(NotificationMessage(event_type="custom", message=f"m{n}"))
+    await asyncio.sleep(0.05)
+
+    assert bot.texts == ["m0\n\nm1\n\nm2\n\nm3\n\nm4"]
+    await notifier.close()
+
+
+async def test_chunks_split_exactly_at_the_message_length_limit() -> None:
+    """A chunk fills up to _MAX_MESSAGE_LENGTH; one more character starts a new message."""
+    separator = len(telegram._BATCH_SEPARATOR)
+    head = "a" * (telegram._MAX_MESSAGE_LENGTH - separator - 10)
+    notifier = _notifier()
+    await notifier.initialize()
+    bot = notifier._bot
+    assert isinstance(bot, _FakeBot)
+
+    await notifier.send_notifications_batch(
+        [
+            NotificationMessage(event_type="custom", message=head),
+            NotificationMessage(event_type="custom", message="b" * 10),
+            NotificationMessage(event_type="custom", message=head),
+            NotificationMessage(event_type="custom", message="c" * 11),
+        ]
+    )
+    await notifier.close()
+
+    assert [len(text) for text in bot.texts] == [telegram._MAX_MESSAGE_LENGTH, len(head), 11]
+    assert bot.texts[0].endswith("b" * 10)
+
+
+async def test_shutdown_flushes_pending_messages_and_stops_the_sender() -> None:
+    """shutdown() sends everything still in the outbox, then the sender task exits."""
+    notifier = _notifier()
+    await notifier.initialize()
+    bot = notifier._bot
+    sender = notifier._sender_task
+    assert isinstance(bot, _FakeBot) and sender is not None
+
+    await notifier.send_notification(NotificationMessage(event_type="custom", message="last"))
+    await notifier.shutdown()
+
+    assert bot.texts == ["last"]
+    assert sender.done() and notifier._sender_task is None
+    assert notifier.is_running is False
+    await notifier.send_notification(NotificationMessage(event_type="custom", message="late"))
+    assert bot.texts == ["last"]
+
+
+_real_sleep = asyncio.sleep
+
+
+class _Clock:
+    """Fake monotonic clock; sleep() advances it instead of waiting."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+        await _real_sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    """Patch the notifier's time.monotonic and asyncio.sleep with a fake clock."""
+    fake = _Clock()
+    # Only the notifier module sees the fake clock; the event loop keeps the real one
+    monkeypatch.setattr(telegram, "time", SimpleNamespace(monotonic=fake.monotonic))
+    monkeypatch.setattr(telegram.asyncio, "sleep", fake.sleep)
+    return fake
+
+
+async def test_rate_limit_consumes_capacity_then_refills(clock: _Clock) -> None:
+    """The bucket allows messages_per_minute sends at once, then one per 60/capacity s."""
+    notifier = _notifier(messages_per_minute=2)
+
+    await notifier._apply_rate_limit()
+    await notifier._apply_rate_limit()
+    assert clock.sleeps == []
+
+    await notifier._apply_rate_limit()
+    assert clock.sleeps == [pytest.approx(30.0)]
+
+    clock.now += 60.0  # a full minute refills the bucket to capacity
+    await notifier._apply_rate_limit()
+    await notifier._apply_rate_limit()
+    assert len(clock.sleeps) == 1
+    await notifier._apply_rate_limit()
+    assert clock.sleeps == [pytest.approx(30.0), pytest.approx(30.0)]
+
+
+async def test_concurrent_callers_each_wait_for_their_own_token(clock: _Clock) -> None:
+    """Waiters are serialized: each one sleeps a full refill interval for its token."""
+    notifier = _notifier(messages_per_minute=1)
+
+    await asyncio.gather(*(notifier._apply_rate_limit() for _ in range(3)))
+
+    assert clock.sleeps == [pytest.approx(60.0), pytest.approx(60.0)]
+    assert clock.now == pytest.approx(1120.0)
+
+
+async def test_non_positive_rate_disables_the_limit(clock: _Clock) -> None:
+    """messages_per_minute <= 0 bypasses the bucket entirely."""
+    notifier = _notifier()
+    notifier.messages_per_minute = 0
+
+    for _ in range(100):
+        await notifier._apply_rate_limit()
+
+    assert clock.sleeps == []
@@ -51,6 +51,22 @@ async def test_list_by_wallet_returns_fifo_order(
     assert [p.id for p in listed] == [older.id, newer.id]
 
 
+async def test_save_moving_position_to_another_wallet_updates_wallet_index(
+    bot_position_repo: InMemoryBotPositionRepository,
+    bot_position_factory: Callable[..., BotPosition],
+    wallet: str,
+) -> None:
+    position = bot_position_factory()
+    other_wallet = "0x" + "b" * 40
+    moved = bot_position_factory(id=position.id, tracked_wallet=other_wallet)
+
+    await bot_position_repo.save(position)
+    await bot_position_repo.save(moved)
+
+    assert await bot_position_repo.list_by_wallet(wallet) == []
+    assert [p.id for p in await bot_position_repo.list_by_wallet(other_wallet)] == [position.id]
+
+
 async def test_list_open_by_wallet_filters_only_open_positions(
     bot_position_repo: InMemoryBotPositionRepository,
     bot_position_factory: Callable[..., BotPosition],
@@ -72,6 +88,51 @@ async def test_list_open_by_wallet_filters_only_open_positions(
     assert listed[0].status == PositionStatus.OPEN
 
 
+async def test_list_open_by_ledger_limit_and_count_open_by_ledger(
+    bot_position_repo: InMemoryBotPositionRepository,
+    bot_position_factory: Callable[..., BotPosition],
+    tracking_ledger_factory: Callable[..., TrackingLedger],
+) -> None:
+    ledger = tracking_ledger_factory()
+    t0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    positions = [
+        bot_position_factory(ledger=ledger, opened_at=t0 + timedelta(minutes=m)) for m in (2, 0, 1)
+    ]
+    for position in positions:
+        await bot_position_repo.save(position)
+
+    oldest_two = await bot_position_repo.list_open_by_ledger(ledger.id, limit=2)
+
+    assert [p.id for p in oldest_two] == [positions[1].id, positions[2].id]
+    assert await bot_position_repo.count_open_by_ledger(ledger.id) == 3
+
+
+async def test_count_active_ledgers_tracks_ledgers_with_open_positions(
+    bot_position_repo: InMemoryBotPositionRepository,
+    bot_position_factory: Callable[..., BotPosition],
+    tracking_ledger_factory: Callable[..., TrackingLedger],
+    wallet: str,
+) -> None:
+    ledger_a = tracking_ledger_factory()
+    ledger_b = tracking_ledger_factory(asset="another-asset")
+    first_a = bot_position_factory(ledger=ledger_a)
+    second_a = bot_position_factory(ledger=ledger_a)
+    only_b = bot_position_factory(ledger=ledger_b)
+
+    for position in (first_a, second_a, only_b):
+        await bot_position_repo.save(position)
+    assert await bot_position_repo.count_active_ledgers(wallet) == 2
+
+    await bot_position_repo.save(first_a.with_closed())
+    assert await bot_position_repo.count_active_ledgers(wallet) == 2
+
+    await bot_position_repo.mark_closing_pending(second_a.id)
+    assert await bot_position_repo.count_active_ledgers(wallet) == 1
+
+    await bot_position_repo.save(only_b.with_closed())
+    assert await bot_position_repo.count_active_ledgers(wallet) == 0
+
+
 async def test_list_open_by_ledger_filters_ledger_and_only_open(
     bot_position_repo: InMemoryBotPositionRepository,
     bot_position_factory: Callable[..., BotPosition],
@@ -283,3 +344,26 @@ async def test_update_closed_pnl_updates_closed_position_amounts_and_fees(
     assert updated.close_proceeds_usdc == Decimal("9.5")
     # 0.2 (open) + 0.3 (close in with_closed) + 0.4 (update)
     assert updated.fees == Decimal("0.9")
+
+
+async def test_open_index_stays_fifo_across_updates_and_closing(
+    bot_position_repo: InMemoryBotPositionRepository,
+    bot_position_factory: Callable[..., BotPosition],
+    tracking_ledger_factory: Callable[..., TrackingLedger],
+    wallet: str,
+) -> None:
+    t0 = datetime(2026, 2, 13, 10, 0, tzinfo=timezone.utc)
+    ledger = tracking_ledger_factory()
+    newest = bot_position_factory(ledger=ledger, opened_at=t0 + timedelta(minutes=10))
+    oldest = bot_position_factory(ledger=ledger, opened_at=t0)
+    middle = bot_position_factory(ledger=ledger, opened_at=t0 + timedelta(minutes=5))
+    for position in (newest, oldest, middle):
+        await bot_position_repo.save(position)
+
+    updated = middle.with_entry_cost_updated(Decimal("5"), Decimal("0.1"))
+    await bot_position_repo.save(updated)
+    await bot_position_repo.mark_closing_pending(oldest.id)
+
+    listed = await bot_position_repo.list_open_by_wallet(wallet)
+    assert listed == [updated, newest]
+    assert await bot_position_repo.list_open_by_ledger(ledger.id) == listed
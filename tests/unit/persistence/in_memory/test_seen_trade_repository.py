@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for InMemorySeenTradeRepository."""
+
+from __future__ import annotations
+
+from polymarket_copy_trading.models.seen_trade import SeenTrade
+from polymarket_copy_trading.persistence.repositories.in_memory.seen_trade_repository import (
+    InMemorySeenTradeRepository,
+)
+
+
+async def test_contains_after_add_and_add_key_with_normalized_keys(wallet: str) -> None:
+    repo = InMemorySeenTradeRepository()
+
+    await repo.add(SeenTrade.create(wallet, "tx:0xabc"))
+    await repo.add_key(f" {wallet} ", "tx:0xdef ")
+
+    assert await repo.contains(wallet, "tx:0xabc") is True
+    assert await repo.contains(wallet, "tx:0xdef") is True
+    assert await repo.contains(wallet, "tx:0x123") is False
+    assert await repo.contains("0x0000000000000000000000000000000000000000", "tx:0xabc") is False
+
+
+async def test_add_batch_is_idempotent(wallet: str) -> None:
+    repo = InMemorySeenTradeRepository()
+    trades = [SeenTrade.create(wallet, f"id:{n}") for n in range(3)]
+
+    await repo.add_batch(trades)
+    await repo.add_batch(trades)
+    await repo.add(trades[0])
+
+    assert len(repo) == 3
+
+
+async def test_add_keys_matches_add_key(wallet: str) -> None:
+    repo = InMemorySeenTradeRepository()
+
+    await repo.add_keys(wallet, ["tx:0xabc", " tx:0xdef"])
+    await repo.add_key(wallet, "tx:0xdef")
+
+    assert len(repo) == 2
+    assert await repo.contains(wallet, "tx:0xabc") is True
+
+
+async def test_contains_confirms_filter_hits_against_the_exact_set(wallet: str) -> None:
+    repo = InMemorySeenTradeRepository()
+    await repo.add_key(wallet, "tx:0xabc")
+    repo._filter[:] = b"\xff" * len(repo._filter)  # every lookup is a filter hit
+
+    assert await repo.contains(wallet, "tx:0xabc") is True
+    assert await repo.contains(wallet, "tx:0xdef") is False
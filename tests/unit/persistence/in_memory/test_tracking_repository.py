@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for InMemoryTrackingRepository."""
+
+from __future__ import annotations
+
+import asyncio
+from decimal import Decimal
+from pathlib import Path
+
+from polymarket_copy_trading.persistence.repositories.in_memory import (
+    InMemoryTrackingRepository,
+    StateFile,
+)
+
+
+async def test_list_by_wallet_is_memoized_until_the_next_write(
+    tracking_repo: InMemoryTrackingRepository, wallet: str, asset: str
+) -> None:
+    repo = tracking_repo
+    ledger = await repo.get_or_create(f"  {wallet} ", asset)
+
+    listed = await repo.list_by_wallet(wallet)
+    assert listed == (ledger,)
+    assert await repo.list_by_wallet(wallet) is listed
+
+    updated = ledger.with_post_tracking(Decimal("5"))
+    await repo.save(updated)
+    other = await repo.get_or_create(wallet, "other-asset")
+
+    assert await repo.list_by_wallet(wallet) == (updated, other)
+    assert await repo.list_by_wallet("0xunknown") == ()
+
+
+async def test_convenience_updates_apply_and_store_the_new_ledger(
+    tracking_repo: InMemoryTrackingRepository, wallet: str, asset: str
+) -> None:
+    await tracking_repo.update_snapshot_t0(wallet, asset, Decimal("10"))
+    await tracking_repo.add_post_tracking_delta(wallet, asset, Decimal("3"))
+    updated = await tracking_repo.update_close_stage_ref(wallet, asset, Decimal("2"))
+
+    assert tracking_repo.get_sync(wallet, asset) is updated
+    assert (updated.snapshot_t0_shares, updated.post_tracking_shares) == (
+        Decimal("10"),
+        Decimal("3"),
+    )
+    assert updated.close_stage_ref_post_tracking_shares == Decimal("2")
+
+
+async def test_state_file_restores_ledgers_after_restart(
+    tmp_path: Path, wallet: str, asset: str
+) -> None:
+    path = tmp_path / "state" / "ledgers.pickle"
+    repo = InMemoryTrackingRepository(StateFile(path, flush_every=3))
+    await repo.update_snapshot_t0(wallet, asset, Decimal("10"))
+    assert not path.exists()  # create + save: two writes, below flush_every
+
+    await repo.add_post_tracking_delta(wallet, asset, Decimal("3"))
+    repo.flush()
+    restored = InMemoryTrackingRepository(StateFile(path))
+
+    ledger = await restored.get(wallet, asset)
+    assert ledger is not None
+    assert (ledger.snapshot_t0_shares, ledger.post_tracking_shares) == (Decimal("10"), Decimal("3"))
+
+
+async def test_corrupt_state_file_is_moved_aside_and_repo_starts_empty(
+    tmp_path: Path, wallet: str
+) -> None:
+    path = tmp_path / "ledgers.pickle"
+    path.write_bytes(b"\x80\x05truncated")
+
+    repo = InMemoryTrackingRepository(StateFile(path))
+
+    assert await repo.list_by_wallet(wallet) == ()
+    assert not path.exists()
+    assert (tmp_path / "ledgers.pickle.corrupt").read_bytes() == b"\x80\x05truncated"
+
+
+async def test_periodic_flush_writes_from_the_executor(
+    tmp_path: Path, wallet: str, asset: str
+) -> None:
+    path = tmp_path / "ledgers.pickle"
+    state_file = StateFile(path, flush_every=2)
+    repo = InMemoryTrackingRepository(state_file)
+
+    # create + save: the second write triggers the flush
+    await repo.update_post_tracking(wallet, asset, Decimal("5"))
+    for _ in range(100):
+        if not state_file.dirty:
+            break
+        await asyncio.sleep(0.01)
+
+    assert not state_file.dirty
+    ledger = await InMemoryTrackingRepository(StateFile(path)).get(wallet, asset)
+    assert ledger is not None
+    assert ledger.post_tracking_shares == Decimal("5")
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for InMemoryTrackingSessionRepository."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+from polymarket_copy_trading.models.tracking_session import SessionStatus, TrackingSession
+from polymarket_copy_trading.persistence.repositories.in_memory import (
+    InMemoryTrackingSessionRepository,
+    StateFile,
+)
+
+
+async def test_get_active_for_wallet_returns_running_session(wallet: str) -> None:
+    repo = InMemoryTrackingSessionRepository()
+    session = TrackingSession.create(wallet)
+
+    await repo.save(session)
+
+    assert await repo.get_active_for_wallet(f" {wallet} ") == session
+
+
+async def test_get_active_for_wallet_is_cleared_when_session_ends(wallet: str) -> None:
+    repo = InMemoryTrackingSessionRepository()
+    session = TrackingSession.create(wallet)
+    await repo.save(session)
+
+    ended = session.with_ended(datetime(2026, 2, 13, tzinfo=timezone.utc))
+    await repo.save(ended)
+
+    assert await repo.get_active_for_wallet(wallet) is None
+    assert await repo.list_by_wallet(wallet) == [ended]
+
+
+async def test_ending_an_older_session_keeps_the_newer_active_one(wallet: str) -> None:
+    repo = InMemoryTrackingSessionRepository()
+    older = TrackingSession.create(wallet)
+    newer = TrackingSession.create(wallet)
+    await repo.save(older)
+    await repo.save(newer)
+
+    await repo.save(older.with_status(SessionStatus.STOPPED))
+
+    assert await repo.get_active_for_wallet(wallet) == newer
+
+
+async def test_list_by_wallet_returns_newest_first(wallet: str) -> None:
+    repo = InMemoryTrackingSessionRepository()
+    t0 = datetime(2026, 2, 13, 10, 0, tzinfo=timezone.utc)
+    middle = TrackingSession.create(wallet, started_at=t0.replace(hour=11))
+    oldest = TrackingSession.create(wallet, started_at=t0)
+    newest = TrackingSession.create(wallet, started_at=t0.replace(hour=12))
+    for session in (middle, oldest, newest):
+        await repo.save(session)
+
+    await repo.save(middle.with_status(SessionStatus.STOPPED))
+
+    listed = await repo.list_by_wallet(wallet)
+    assert [s.id for s in listed] == [newest.id, middle.id, oldest.id]
+    assert listed[1].status == SessionStatus.STOPPED
+
+
+async def test_state_file_restores_sessions_with_running_ones_stopped(
+    tmp_path: Path, wallet: str
+) -> None:
+    path = tmp_path / "sessions.pickle"
+    t0 = datetime(2026, 2, 13, 10, 0, tzinfo=timezone.utc)
+    ended = TrackingSession.create(wallet, started_at=t0).with_ended(t0.replace(hour=11))
+    running = TrackingSession.create(wallet, started_at=t0.replace(hour=12))
+    repo = InMemoryTrackingSessionRepository(StateFile(path, flush_every=1))
+    await repo.save(ended)
+    await repo.save(running)
+    repo.flush()  # as on shutdown: writes the latest state synchronously
+
+    restored = InMemoryTrackingSessionRepository(StateFile(path))
+
+    assert await restored.get_active_for_wallet(wallet) is None
+    assert await restored.list_by_wallet(wallet) == [
+        running.with_status(SessionStatus.STOPPED),
+        ended,
+    ]
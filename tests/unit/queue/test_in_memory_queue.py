@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for InMemoryQueue non-blocking operations."""
+
+from __future__ import annotations
+
+import pytest
+
+from polymarket_copy_trading.exceptions import QueueEmpty, QueueFull, QueueShutdown
+from polymarket_copy_trading.queue.in_memory_queue import InMemoryQueue
+
+
+async def test_nowait_ops_raise_domain_errors_for_full_empty_and_shutdown() -> None:
+    queue: InMemoryQueue[int] = InMemoryQueue(maxsize=1)
+
+    with pytest.raises(QueueEmpty):
+        queue.get_nowait()
+    queue.put_nowait(1)
+    with pytest.raises(QueueFull):
+        queue.put_nowait(2)
+
+    queue.shutdown()
+    with pytest.raises(QueueShutdown):
+        queue.put_nowait(3)
+    assert queue.get_nowait() == 1
+    with pytest.raises(QueueShutdown):
+        queue.get_nowait()
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for QueueMessage serialization."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+
+from polymarket_copy_trading.queue.messages import QueueMessage
+from polymarket_copy_trading.services.tracking_trader.trade_dto import DataApiTradeDTO
+
+
+def test_to_dict_matches_asdict_for_dataclass_payload() -> None:
+    trade = DataApiTradeDTO(timestamp=1, side="BUY", asset="asset-1", size=2.0)
+    message = QueueMessage.create(trade, metadata={"source": "poll"})
+
+    data = message.to_dict()
+
+    assert data == asdict(message)
+    assert data["metadata"] is not message.metadata
+
+
+def test_create_assigns_distinct_version_4_ids() -> None:
+    first = QueueMessage.create("a")
+    second = QueueMessage.create("b")
+
+    assert first.id.version == 4
+    assert first.id != second.id
+    assert first.created_at.tzinfo is not None
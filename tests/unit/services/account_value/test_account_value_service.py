@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for AccountValueService aggregation."""
+
+from __future__ import annotations
+
+import asyncio
+from decimal import Decimal
+from typing import Any, cast
+
+from polymarket_copy_trading.services.account_value.account_value_service import (
+    AccountValueService,
+)
+
+
+class _FakeRpc:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get_usdc_e_balance(self, wallet: str) -> Decimal:
+        self.calls += 1
+        await asyncio.sleep(0)
+        return Decimal("10")
+
+
+class _FakeDataApi:
+    def __init__(self, items: list[dict[str, Any]]) -> None:
+        self.items = items
+
+    async def get_positions_value(
+        self, wallet: str, market: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        return self.items
+
+
+async def test_total_sums_values_exactly_and_skips_missing_or_invalid(wallet: str) -> None:
+    data_api = _FakeDataApi([{"value": 0.1}, {"value": "0.2"}, {"value": None}, {"value": "n/a"}])
+    service = AccountValueService(cast(Any, _FakeRpc()), cast(Any, data_api))
+
+    result = await service.get_total_account_value(wallet)
+
+    assert result.positions_value_usdc == Decimal("0.3")
+    assert result.total_usdc == Decimal("10.3")
+
+
+async def test_total_is_cached_per_wallet_and_shared_by_concurrent_callers(wallet: str) -> None:
+    rpc = _FakeRpc()
+    service = AccountValueService(cast(Any, rpc), cast(Any, _FakeDataApi([{"value": 1}])))
+
+    first, second = await asyncio.gather(
+        service.get_total_account_value(wallet),
+        service.get_total_account_value(wallet),
+    )
+    third = await service.get_total_account_value(wallet)
+    await service.get_total_account_value(wallet, market=["0xcond"])
+
+    assert first is second is third
+    assert rpc.calls == 2
+
+
+async def test_zero_ttl_disables_the_cache(wallet: str) -> None:
+    rpc = _FakeRpc()
+    service = AccountValueService(cast(Any, rpc), cast(Any, _FakeDataApi([])), cache_ttl_seconds=0)
+
+    await service.get_total_account_value(wallet)
+    await service.get_total_account_value(wallet)
+
+    assert rpc.calls == 2
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from decimal import Decimal
 from types import SimpleNamespace
@@ -62,6 +63,7 @@ def _trade(
     asset: str = "asset-1",
     price: float | None = 0.5,
     size: float | None = 10.0,
+    condition_id: str | None = None,
 ) -> DataApiTradeDTO:
     """Build trade DTO for evaluate_and_execute tests."""
     return DataApiTradeDTO(
@@ -70,6 +72,7 @@ def _trade(
         asset=asset,
         price=price,
         size=size,
+        condition_id=condition_id,
     )
 
 
@@ -124,7 +127,9 @@ def _deps() -> dict[str, Any]:
     tracking_repo = SimpleNamespace(update_close_stage_ref=AsyncMock())
     position_repo = SimpleNamespace(
         list_open_by_ledger=AsyncMock(return_value=[]),
+        count_open_by_ledger=AsyncMock(return_value=0),
         list_open_by_wallet=AsyncMock(return_value=[]),
+        count_active_ledgers=AsyncMock(return_value=0),
         save=AsyncMock(),
         mark_closing_pending=AsyncMock(),
     )
@@ -157,7 +162,7 @@ async def test_evaluate_and_execute_returns_early_when_ledger_is_none() -> None:
 
     await service.evaluate_and_execute("0xwallet", _trade(side="BUY"), ledger=None)
 
-    deps["position_repo"].list_open_by_ledger.assert_not_called()
+    deps["position_repo"].count_open_by_ledger.assert_not_called()
     deps["market_exec"].place_buy_usdc.assert_not_called()
 
 
@@ -191,6 +196,30 @@ async def test_buy_skips_when_open_policy_denies(
     deps["position_repo"].save.assert_not_called()
 
 
+async def test_buy_values_post_tracking_shares_from_the_trade_market_only(
+    tracking_ledger_factory: Callable[..., TrackingLedger],
+) -> None:
+    deps = _deps()
+    deps["data_api"].get_positions.return_value = [
+        {"asset": "asset-2", "curPrice": 0.9},
+        {"asset": "asset-1", "curPrice": 0.25},
+    ]
+    deps["open_policy"].should_open.return_value = OpenPolicyResult(
+        should_open=False,
+        reason="denied",
+    )
+    service = _engine(settings=_settings(), **deps)
+    ledger = tracking_ledger_factory(post_tracking_shares=Decimal("10"))
+
+    await service.evaluate_and_execute(
+        "0xwallet", _trade(side="BUY", condition_id="0xcond"), ledger=ledger
+    )
+
+    deps["data_api"].get_positions.assert_awaited_once_with(user="0xwallet", market=["0xcond"])
+    inp = deps["open_policy"].should_open.call_args.args[0]
+    assert inp.post_tracking_value_usdc == Decimal("2.50")
+
+
 async def test_buy_emits_failed_event_when_order_placement_fails(
     tracking_ledger_factory: Callable[..., TrackingLedger],
 ) -> None:
@@ -241,6 +270,9 @@ async def test_buy_success_saves_position_emits_order_and_sets_ref_when_missing(
     saved_position = deps["position_repo"].save.call_args.args[0]
     assert isinstance(saved_position, BotPosition)
     assert saved_position.status.value == "OPEN"
+    assert saved_position.shares_held == Decimal("20")
+    assert saved_position.entry_price == Decimal("0.5")
+    assert saved_position.entry_cost_usdc == Decimal("10")
     deps["tracking_repo"].update_close_stage_ref.assert_awaited_once_with(
         "0xwallet", "asset-1", Decimal("20")
     )
@@ -272,7 +304,6 @@ async def test_sell_returns_when_no_open_positions(
     tracking_ledger_factory: Callable[..., TrackingLedger],
 ) -> None:
     deps = _deps()
-    deps["position_repo"].list_open_by_ledger.return_value = []
     service = _engine(settings=_settings(), **deps)
     ledger = tracking_ledger_factory(post_tracking_shares=Decimal("10"))
 
@@ -287,6 +318,7 @@ async def test_sell_skips_when_close_policy_returns_zero(
 ) -> None:
     deps = _deps()
     deps["position_repo"].list_open_by_ledger.return_value = [bot_position_factory()]
+    deps["position_repo"].count_open_by_ledger.return_value = 1
     deps["close_policy"].positions_to_close.return_value = ClosePolicyResult(
         positions_to_close=0,
         reason="skip",
@@ -306,6 +338,7 @@ async def test_sell_emits_failed_when_order_placement_fails(
     deps = _deps()
     open_position = bot_position_factory(shares_held=Decimal("7"))
     deps["position_repo"].list_open_by_ledger.return_value = [open_position]
+    deps["position_repo"].count_open_by_ledger.return_value = 1
     deps["close_policy"].positions_to_close.return_value = ClosePolicyResult(
         positions_to_close=1,
         reason="close one",
@@ -335,6 +368,7 @@ async def test_sell_success_marks_pending_emits_order_and_updates_ref(
     deps = _deps()
     open_position = bot_position_factory(shares_held=Decimal("4"))
     deps["position_repo"].list_open_by_ledger.return_value = [open_position]
+    deps["position_repo"].count_open_by_ledger.return_value = 1
     deps["close_policy"].positions_to_close.return_value = ClosePolicyResult(
         positions_to_close=1,
         reason="close one",
@@ -370,6 +404,7 @@ async def test_sell_emits_position_not_found_when_mark_pending_returns_none(
     deps = _deps()
     open_position = bot_position_factory(shares_held=Decimal("4"))
     deps["position_repo"].list_open_by_ledger.return_value = [open_position]
+    deps["position_repo"].count_open_by_ledger.return_value = 1
     deps["close_policy"].positions_to_close.return_value = ClosePolicyResult(
         positions_to_close=1,
         reason="close one",
@@ -389,3 +424,74 @@ async def test_sell_emits_position_not_found_when_mark_pending_returns_none(
     assert len(deps["event_bus"].dispatched) == 1
     failed = deps["event_bus"].dispatched[0]
     assert failed.reason == "position_not_found"
+
+
+async def test_sell_places_orders_concurrently_and_records_them_in_fifo_order(
+    tracking_ledger_factory: Callable[..., TrackingLedger],
+    bot_position_factory: Callable[..., BotPosition],
+) -> None:
+    deps = _deps()
+    first = bot_position_factory(shares_held=Decimal("4"))
+    second = bot_position_factory(shares_held=Decimal("6"))
+    deps["position_repo"].list_open_by_ledger.return_value = [first, second]
+    deps["position_repo"].count_open_by_ledger.return_value = 2
+    deps["close_policy"].positions_to_close.return_value = ClosePolicyResult(
+        positions_to_close=2,
+        reason="close two",
+    )
+    both_in_flight = asyncio.Event()
+    in_flight = 0
+
+    async def place_sell_shares(*, token_id: str, amount: float) -> Any:
+        nonlocal in_flight
+        in_flight += 1
+        if in_flight == 2:
+            both_in_flight.set()
+        await asyncio.wait_for(both_in_flight.wait(), timeout=1)
+        return _exec_result(success=True, order_id=f"order-{amount:g}")
+
+    deps["market_exec"].place_sell_shares.side_effect = place_sell_shares
+    deps["position_repo"].mark_closing_pending.side_effect = lambda position_id, **_: (
+        first if position_id == first.id else second
+    )
+    service = _engine(settings=_settings(), **deps)
+    ledger = tracking_ledger_factory(post_tracking_shares=Decimal("11"))
+
+    await service.evaluate_and_execute("0xwallet", _trade(side="SELL"), ledger=ledger)
+
+    assert [e.order_id for e in deps["event_bus"].dispatched] == ["order-4", "order-6"]
+    deps["position_repo"].list_open_by_ledger.assert_awaited_once_with(ledger.id, limit=2)
+    deps["tracking_repo"].update_close_stage_ref.assert_awaited_once()
+
+
+async def test_sell_records_other_orders_when_one_placement_raises(
+    tracking_ledger_factory: Callable[..., TrackingLedger],
+    bot_position_factory: Callable[..., BotPosition],
+) -> None:
+    deps = _deps()
+    first = bot_position_factory(shares_held=Decimal("4"))
+    second = bot_position_factory(shares_held=Decimal("6"))
+    deps["position_repo"].list_open_by_ledger.return_value = [first, second]
+    deps["position_repo"].count_open_by_ledger.return_value = 2
+    deps["close_policy"].positions_to_close.return_value = ClosePolicyResult(
+        positions_to_close=2,
+        reason="close two",
+    )
+    deps["market_exec"].place_sell_shares.side_effect = [
+        RuntimeError("connection reset"),
+        _exec_result(success=True, order_id="order-6"),
+    ]
+    deps["position_repo"].mark_closing_pending.return_value = second
+    service = _engine(settings=_settings(), **deps)
+    ledger = tracking_ledger_factory(post_tracking_shares=Decimal("11"))
+
+    await service.evaluate_and_execute("0xwallet", _trade(side="SELL"), ledger=ledger)
+
+    failed, placed = deps["event_bus"].dispatched
+    assert failed.reason == "order_placement_failed"
+    assert failed.position_id == first.id
+    assert "connection reset" in failed.error_message
+    assert placed.order_id == "order-6"
+    deps["position_repo"].mark_closing_pending.assert_awaited_once()
+    assert deps["position_repo"].mark_closing_pending.await_args.args == (second.id,)
+    deps["tracking_repo"].update_close_stage_ref.assert_awaited_once()
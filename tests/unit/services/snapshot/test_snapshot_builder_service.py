@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+from decimal import Decimal
 from types import SimpleNamespace
 from typing import Any, cast
 from unittest.mock import AsyncMock
@@ -109,6 +110,31 @@ async def test_build_snapshot_aggregates_same_asset_and_skips_invalid_positions(
     assert str(ledger_a.post_tracking_shares) == "0"
 
 
+async def test_build_snapshot_resets_restored_ledger_state_from_before_t0(
+    tracking_repo: InMemoryTrackingRepository,
+    session_repo: InMemoryTrackingSessionRepository,
+) -> None:
+    # Ledgers left over from a previous run (e.g. restored from the state file)
+    await tracking_repo.update_post_tracking("0xwallet", "asset-held", Decimal("4"))
+    await tracking_repo.update_close_stage_ref("0xwallet", "asset-held", Decimal("4"))
+    await tracking_repo.update_snapshot_t0("0xwallet", "asset-gone", Decimal("7"))
+    await tracking_repo.update_post_tracking("0xwallet", "asset-gone", Decimal("2"))
+    await tracking_repo.update_close_stage_ref("0xwallet", "asset-gone", Decimal("2"))
+    data_api: Any = SimpleNamespace(get_positions=AsyncMock(return_value=[_pos("asset-held", 9)]))
+    builder = _builder(data_api=data_api, tracking_repo=tracking_repo, session_repo=session_repo)
+
+    result = await builder.build_snapshot_t0("0xwallet")
+
+    assert result.success is True
+    held = await tracking_repo.get("0xwallet", "asset-held")
+    gone = await tracking_repo.get("0xwallet", "asset-gone")
+    assert held is not None and gone is not None
+    assert (held.snapshot_t0_shares, held.post_tracking_shares) == (Decimal("9"), Decimal("0"))
+    assert held.close_stage_ref_post_tracking_shares is None
+    assert (gone.snapshot_t0_shares, gone.post_tracking_shares) == (Decimal("0"), Decimal("0"))
+    assert gone.close_stage_ref_post_tracking_shares is None
+
+
 async def test_build_snapshot_paginates_until_chunk_shorter_than_limit(
     tracking_repo: InMemoryTrackingRepository,
     session_repo: InMemoryTrackingSessionRepository,
@@ -78,12 +78,12 @@ async def test_apply_trade_returns_none_when_size_is_non_positive(size: float |
     repo.get_or_create.assert_not_called()
 
 
-async def test_buy_creates_or_gets_ledger_and_adds_post_tracking_delta(
+async def test_buy_creates_or_gets_ledger_and_saves_added_post_tracking_once(
     tracking_ledger_factory: Callable[..., TrackingLedger],
 ) -> None:
-    updated = tracking_ledger_factory(post_tracking_shares=Decimal("15"))
+    ledger = tracking_ledger_factory(post_tracking_shares=Decimal("5"))
     repo = AsyncMock()
-    repo.add_post_tracking_delta.return_value = updated
+    repo.get_or_create.return_value = ledger
     engine = _engine(repo)
 
     result = await engine.apply_trade(
@@ -92,12 +92,10 @@ async def test_buy_creates_or_gets_ledger_and_adds_post_tracking_delta(
     )
 
     repo.get_or_create.assert_awaited_once_with("0xwallet", "asset-1")
-    repo.add_post_tracking_delta.assert_awaited_once_with(
-        "0xwallet",
-        "asset-1",
-        Decimal("15.0"),
-    )
-    assert result == updated
+    repo.save.assert_awaited_once_with(result)
+    repo.add_post_tracking_delta.assert_not_called()
+    assert result is not None
+    assert result.post_tracking_shares == Decimal("20")
 
 
 async def test_sell_with_sufficient_post_tracking_reduces_post_tracking_only(
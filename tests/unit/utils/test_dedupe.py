@@ -3,9 +3,10 @@
 
 from __future__ import annotations
 
+from hashlib import blake2b
 from typing import Any
 
-from polymarket_copy_trading.utils.dedupe import trade_key
+from polymarket_copy_trading.utils.dedupe import seen_digest, strip_padded, trade_key
 
 
 def test_trade_key_prefers_transaction_hash_field() -> None:
@@ -78,3 +79,20 @@ def test_trade_key_treats_none_id_as_missing_and_uses_composite() -> None:
         "size": 2,
     }
     assert trade_key(trade) == "cmp:10|cond-a|YES|1|2"
+
+
+def test_seen_digest_is_16_bytes_and_ignores_surrounding_whitespace() -> None:
+    digest = seen_digest("0xwallet", "tx:0xabc")
+
+    assert len(digest) == 16
+    assert digest == blake2b(b"0xwallet|tx:0xabc", digest_size=16).digest()
+    assert seen_digest(" 0xwallet ", "tx:0xabc\n") == digest
+    assert seen_digest("0xwallet", "tx:0xabd") != digest
+
+
+def test_strip_padded_returns_same_object_when_unpadded() -> None:
+    key = "tx:0xabc"
+
+    assert strip_padded(key) is key
+    assert strip_padded(f" {key}\n") == key
+    assert strip_padded("") == ""